@@ -1,54 +1,195 @@
+"""
+Підготовка markdown до озвучки (edge-tts тощо).
+
+Файл читається потоково (рядок за рядком через mdc_tokenizer): лишається тільки
+текст — компоненти Docus, мітки слотів, код і HTML-коментарі відкидаються (разом
+із зайвими `::` без відкриття, які токенізатор лишає в прозі), а markdown-розмітка
+прибирається одним проходом об'єднаного regex.
+
+Режими:
+  python3 clean_tts.py content/path/to/file.md content/path/to/file.tts.txt
+      один .txt на файл (як раніше)
+
+  python3 clean_tts.py content/13.aws/ tts/13.aws [--max-chars 3000] [--jobs 8]
+      усі .md з папки, паралельно; по чанку на кожен `##` розділ:
+      tts/13.aws/09.dynamodb.01.txt, 09.dynamodb.02.txt, ...
+      Розділи, довші за --max-chars, діляться по абзацах (а далі — по реченнях).
+"""
+
+import argparse
+import glob
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from batch_runner import atomic_write, expand_patterns
+from mdc_tokenizer import COMPONENT_CLOSE_RE, tokenize_file
+
+DEFAULT_MAX_CHARS = 3000
+
+# Усі правила очищення в одному regex; порядок альтернатив = пріоритет
+MARKDOWN_RE = re.compile(
+    r"""
+      (?P<image>!\[.*?\]\(.*?\))            # зображення ![]() — прибираємо повністю
+    | \[(?P<link>.*?)\]\(.*?\)              # посилання [text](url) → text
+    | ^(?:---\n|\#+\ |>\ )                  # горизонтальна лінія, маркери заголовків і цитат
+    | \*\*|\*|_                             # жирний / курсив
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+EMPHASIS_RE = re.compile(r"\*\*|\*|_")
+SECTION_RE = re.compile(r"^##[ \t]")
+EXTRA_NEWLINES_RE = re.compile(r"\n{3,}")
+SENTENCE_END_RE = re.compile(r"(?<=[.!?…])\s+")
+
+
+def _replace_markdown(m):
+    link = m.group("link")
+    return "" if link is None else EMPHASIS_RE.sub("", link)
+
+
+def clean_prose(text):
+    return MARKDOWN_RE.sub(_replace_markdown, text)
+
+
+def iter_prose_lines(file_path):
+    """Потоково віддає рядки прози файлу як (чи це `##` заголовок, очищений рядок)."""
+    for span in tokenize_file(file_path):
+        if span.kind != "prose":
+            continue
+        for line in span.text.splitlines(keepends=True):
+            # `::` без відкритого компонента — зламана розмітка, а не текст для озвучки
+            if COMPONENT_CLOSE_RE.match(line):
+                continue
+            yield bool(SECTION_RE.match(line)), clean_prose(line)
+
+
+def _finish(lines):
+    return EXTRA_NEWLINES_RE.sub("\n\n", "".join(lines)).strip()
+
+
+def _split_long(text, max_chars):
+    """Ділить один задовгий абзац по реченнях (а речення-гіганти — по пробілах)."""
+    chunk = ""
+    for sentence in SENTENCE_END_RE.split(text):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if chunk:
+                yield chunk
+                chunk = ""
+            yield sentence[:cut]
+            sentence = sentence[cut:].lstrip()
+        if chunk and len(chunk) + 1 + len(sentence) > max_chars:
+            yield chunk
+            chunk = ""
+        chunk = f"{chunk} {sentence}" if chunk else sentence
+    if chunk:
+        yield chunk
+
+
+def iter_chunks(file_path, max_chars=DEFAULT_MAX_CHARS, sections=True):
+    """
+    Текст для озвучки чанками: новий чанк на кожному `##` заголовку (sections=True),
+    і жоден чанк не довший за `max_chars` (None — без обмеження).
+    У пам'яті тримається лише поточний чанк.
+    """
+    buffer = []       # рядки поточного чанку
+    size = 0
+    paragraph_end = 0 # індекс у buffer одразу після останнього порожнього рядка
+
+    def flush(upto):
+        text = _finish(buffer[:upto])
+        del buffer[:upto]
+        if max_chars and len(text) > max_chars:
+            return list(_split_long(text, max_chars))
+        return [text] if text else []
+
+    for is_section, line in iter_prose_lines(file_path):
+        if is_section and sections:
+            yield from flush(len(buffer))
+            size, paragraph_end = 0, 0
+        if max_chars and size + len(line) > max_chars and buffer:
+            # Ріжемо по останній межі абзацу, а якщо її немає — перед поточним рядком
+            upto = paragraph_end or len(buffer)
+            yield from flush(upto)
+            size, paragraph_end = sum(map(len, buffer)), 0
+        buffer.append(line)
+        size += len(line)
+        if not line.strip():
+            paragraph_end = len(buffer)
+    yield from flush(len(buffer))
+
 
 def clean_for_tts(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # 1. Remove Docus components containers (::name and ::)
-    content = re.sub(r'::[a-z-]+\n', '', content)
-    content = re.sub(r'\n::', '', content)
-    
-    # 2. Remove mermaid blocks
-    content = re.sub(r'```mermaid[\s\S]*?```', '', content)
-    
-    # 3. Remove other code blocks if any (usually not good for TTS unless requested)
-    # But for this file, let's keep them if they are small or relevant, 
-    # but the user said "without extra constructions". 
-    # Let's remove all code blocks.
-    content = re.sub(r'```[\s\S]*?```', '', content)
-    
-    # 4. Remove images ![]()
-    content = re.sub(r'!\[.*?\]\(.*?\)', '', content)
-    
-    # 5. Remove horizontal rules ---
-    content = re.sub(r'\n---\n', '\n', content)
-    
-    # 6. Remove Docus labels like #title and #content
-    content = re.sub(r'#title\n', '', content)
-    content = re.sub(r'#content\n', '', content)
-    
-    # 7. Remove markdown formatting but keep text
-    # Headers #
-    content = re.sub(r'^#+ ', '', content, flags=re.MULTILINE)
-    # Bold/Italic ** or * or _
-    content = re.sub(r'(\*\*|\*|_)', '', content)
-    # Links [text](url) -> text
-    content = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', content)
-    # Blockquotes >
-    content = re.sub(r'^> ', '', content, flags=re.MULTILINE)
-    
-    # 8. Clean up extra newlines
-    content = re.sub(r'\n{3,}', '\n\n', content)
-    
-    return content.strip()
+    """Весь текст файлу одним рядком (без поділу на розділи)."""
+    return "\n\n".join(iter_chunks(file_path, max_chars=None, sections=False))
 
-if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python clean_tts.py <input_md> <output_txt>")
+
+def export_sections(job):
+    """Пише чанки одного файлу як <out_dir>/<stem>.NN.txt. Повертає (файл, кількість чанків, помилка)."""
+    file_path, out_dir, max_chars = job
+    try:
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        os.makedirs(out_dir, exist_ok=True)
+        # Прибираємо чанки попереднього експорту, щоб не лишились зайві хвости
+        for old in glob.glob(os.path.join(glob.escape(out_dir), f"{glob.escape(stem)}.[0-9][0-9]*.txt")):
+            os.remove(old)
+        count = 0
+        for count, chunk in enumerate(iter_chunks(file_path, max_chars), 1):
+            atomic_write(os.path.join(out_dir, f"{stem}.{count:02d}.txt"), chunk + "\n")
+        return file_path, count, ""
+    except Exception as e:
+        return file_path, 0, f"{type(e).__name__}: {e}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Очищення markdown для TTS.")
+    parser.add_argument("input", help="Markdown файл або папка (наприклад content/13.aws/)")
+    parser.add_argument("output", help="Вихідний .txt для файлу або папка для чанків")
+    parser.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS,
+                        help=f"Максимальний розмір чанку (за замовчуванням: {DEFAULT_MAX_CHARS})")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Кількість процесів (за замовчуванням — кількість ядер)")
+    args = parser.parse_args()
+
+    if os.path.isfile(args.input) and args.output.endswith(".txt"):
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(clean_for_tts(args.input))
+        print(f"Cleaned text saved to {args.output}")
+        return
+
+    files = expand_patterns([args.input])
+    if not files:
+        print(f"File not found: {args.input}")
         sys.exit(1)
-    
-    cleaned = clean_for_tts(sys.argv[1])
-    with open(sys.argv[2], 'w', encoding='utf-8') as f:
-        f.write(cleaned)
-    print(f"Cleaned text saved to {sys.argv[2]}")
+    base = args.input if os.path.isdir(args.input) else os.path.dirname(args.input)
+    jobs = [
+        (path, os.path.join(args.output, os.path.relpath(os.path.dirname(path), os.path.abspath(base))), args.max_chars)
+        for path in files
+    ]
+
+    workers = args.jobs or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        results = [export_sections(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(export_sections, jobs))
+
+    errors = 0
+    total = 0
+    for path, count, error in results:
+        if error:
+            errors += 1
+            print(f"[X] {os.path.relpath(path)}: {error}")
+        else:
+            total += count
+            print(f"[✓] {os.path.relpath(path)}: {count} чанків")
+    print(f"\n{len(files)} файлів → {total} чанків у {args.output}, помилок {errors}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+// Пошук діаграм, попередньо відрендерених scripts/render_diagrams.py у public/diagrams/<hash>.svg.
+// Хеш має збігатися з Python-стороною: sha256("<kind>\0<нормалізоване джерело>").
+
+// Та сама нормалізація, що й normalize_source у scripts/diagram_cache.py
+export const normalizeDiagramSource = (source: string) =>
+    source
+        .replace(/\r\n/g, '\n')
+        .split('\n')
+        .map((line) => line.trimEnd())
+        .join('\n')
+        .replace(/^\n+|\n+$/g, '')
+
+export const diagramHash = async (kind: string, source: string) => {
+    const data = new TextEncoder().encode(`${kind}\0${normalizeDiagramSource(source)}`)
+    const digest = await crypto.subtle.digest('SHA-256', data)
+    return Array.from(new Uint8Array(digest))
+        .map((b) => b.toString(16).padStart(2, '0'))
+        .join('')
+}
+
+export const useStaticDiagram = () => {
+    const baseURL = useRuntimeConfig().app.baseURL || '/'
+
+    // URL статичного SVG або null, якщо діаграму ще не відрендерили (тоді компонент рендерить сам)
+    const findStaticDiagram = async (kind: string, source: string): Promise<string | null> => {
+        // crypto.subtle доступний лише в secure context (https / localhost)
+        if (!globalThis.crypto?.subtle) return null
+        try {
+            const url = `${baseURL}diagrams/${await diagramHash(kind, source)}.svg`
+            const res = await fetch(url, { method: 'HEAD' })
+            return res.ok ? url : null
+        } catch {
+            return null
+        }
+    }
+
+    // Вміст статичного SVG (для inline-вставки через v-html) або null
+    const loadStaticDiagram = async (kind: string, source: string): Promise<string | null> => {
+        const url = await findStaticDiagram(kind, source)
+        if (!url) return null
+        try {
+            const res = await fetch(url)
+            return res.ok ? await res.text() : null
+        } catch {
+            return null
+        }
+    }
+
+    return { findStaticDiagram, loadStaticDiagram }
+}
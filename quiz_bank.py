@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+quiz_bank.py — CLI банку питань (scripts/question_bank.py): імпорт, пошук і
+експорт тестів в xlsx в тому ж процесі — без тимчасових JSON і subprocess.
+
+Використання:
+  # Імпорт з JSON або зі старого скрипту-генератора (літерал questions = [...])
+  python3 quiz_bank.py import old_generator.py --quiz 05.python/02.encapsulation --tag content/05.python/02.encapsulation.md
+  python3 quiz_bank.py import tests/02.api.json                 # quiz = шлях у tests/ без розширення
+  # Питання з полем "id" (як у банку) замінює саме цей запис, навіть якщо змінився текст чи варіанти
+
+  # Пошук
+  python3 quiz_bank.py list --course 07.tools
+  python3 quiz_bank.py list --quiz 07.tools/01.docker/ --tag content/07.tools/01.docker/06.container-lifecycle.md
+  python3 quiz_bank.py list --tag content/01.csharp/13.network-programming/   # усі розділи папки
+
+  # Експорт тесту в xlsx (за замовчуванням — tests/<quiz>.xlsx)
+  python3 quiz_bank.py export --quiz 12.html-css/12.html-css
+  python3 quiz_bank.py export --ids q3f2a9c1b7e q0b41d2e9aa -o tests/custom.xlsx
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from content_manifest import ROOT
+from question_bank import QuestionBank, extract_questions
+from wayground_exporter import export_questions
+
+
+def _quiz_from_path(path):
+    """tests/02.cpp/09.arrays.json → 02.cpp/09.arrays (для JSON з tests/)."""
+    rel = os.path.relpath(os.path.abspath(path), os.path.join(ROOT, "tests"))
+    if rel.startswith("..") or not path.endswith(".json"):
+        return None
+    return os.path.splitext(rel)[0].replace(os.sep, "/")
+
+
+def cmd_import(args, bank):
+    quiz = args.quiz or _quiz_from_path(args.source)
+    if not quiz:
+        print("❌ Вкажи --quiz (шлях тесту, наприклад 05.python/02.encapsulation)")
+        return 1
+    try:
+        questions = extract_questions(args.source)
+    except (OSError, ValueError, SyntaxError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    counts = {"added": 0, "updated": 0, "unchanged": 0}
+    for q in questions:
+        if isinstance(q, dict):
+            try:
+                _, status = bank.add(q, quiz, args.tag or None, q.get("id"))
+            except ValueError as e:
+                print(f"❌ {e}")
+                return 1
+            counts[status] += 1
+    bank.save()
+    print(f"✅ {quiz}: додано {counts['added']}, оновлено {counts['updated']}, без змін {counts['unchanged']}")
+    return 0
+
+
+def _select(args, bank):
+    records = bank.query(course=args.course, quiz=args.quiz, tags=args.tag, ids=args.ids)
+    return records[: args.limit] if args.limit else records
+
+
+def cmd_list(args, bank):
+    records = _select(args, bank)
+    for r in records:
+        text = r["question"].get("Question Text", "").split("\n")[0]
+        print(f"{r['id']}  {r['quiz']:<45}  {r['question'].get('Question Type', ''):<17}  {text[:70]}")
+    print(f"\n{len(records)} питань")
+    return 0
+
+
+def cmd_export(args, bank):
+    records = _select(args, bank)
+    if not records:
+        print("❌ За цими фільтрами питань немає")
+        return 1
+    output = args.output
+    if not output:
+        if not args.quiz or args.quiz.endswith("/"):
+            print("❌ Вкажи -o/--output (або --quiz конкретного тесту)")
+            return 1
+        output = os.path.join(ROOT, "tests", f"{args.quiz}.xlsx")
+
+    result = export_questions([r["question"] for r in records], output,
+                              render_code=not args.no_render, jobs=args.jobs)
+    count = result["questions"]
+    print(f"✅ Успішно створено {output} ({count} питань).")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Банк питань тестів: імпорт, пошук, експорт у xlsx.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="Додати питання з JSON або скрипту-генератора")
+    p_import.add_argument("source", help="JSON з питаннями або .py з літералом questions = [...]")
+    p_import.add_argument("--quiz", help="Шлях тесту (як у tests/ без .xlsx)")
+    p_import.add_argument("--tag", action="append", help="Тег (розділ content/...); можна кілька")
+    p_import.set_defaults(func=cmd_import)
+
+    for name, func, help_text in (
+        ("list", cmd_list, "Показати питання"),
+        ("export", cmd_export, "Зібрати тест і записати xlsx"),
+    ):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--course", help="Курс (перша частина шляху тесту, напр. 07.tools)")
+        p.add_argument("--quiz", help="Тест або папка тестів із / в кінці")
+        p.add_argument("--tag", action="append", help="Лише питання з цим тегом (з / в кінці — будь-який розділ папки); можна кілька")
+        p.add_argument("--ids", nargs="+", help="Конкретні id питань (у цьому порядку)")
+        p.add_argument("--limit", type=int, help="Не більше N питань")
+        p.set_defaults(func=func)
+        if name == "export":
+            p.add_argument("-o", "--output", help="Вихідний xlsx (за замовчуванням tests/<quiz>.xlsx)")
+            p.add_argument("-j", "--jobs", type=int, default=None,
+                           help="Кількість паралельних рендерів silicon (за замовчуванням — кількість ядер)")
+            p.add_argument("--no-render", action="store_true",
+                           help="Не рендерити блоки коду в зображення")
+
+    args = parser.parse_args()
+    sys.exit(args.func(args, QuestionBank()))
+
+
+if __name__ == "__main__":
+    main()
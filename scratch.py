@@ -1,58 +1,31 @@
-import re
+import os
+import sys
 
-with open('/Users/arakviel/Work/kostyl.dev/content/12.html-css/05.html-forms.md', 'r', encoding='utf-8') as f:
-    content = f.read()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from batch_runner import run_cli
+from mdc_tokenizer import rewrite
 
-# We need to find ```html blocks that are NOT already preceded by ::html-preview
-# We'll split the text and iterate.
+# We need to find ```html blocks that are NOT already inside ::html-preview.
+# The tokenizer tracks component nesting, so the enclosing component tells us directly.
 
-lines = content.split('\n')
-new_lines = []
+def wrap_html(span):
+    if span.kind != 'code' or not span.lang.startswith('html'):
+        return None
+    if span.parent == 'html-preview':
+        return None
 
-i = 0
-while i < len(lines):
-    line = lines[i]
-    if line.startswith('```html'):
-        # Check if previous non-empty line is ::html-preview
-        prev_idx = i - 1
-        is_already_wrapped = False
-        while prev_idx >= 0 and lines[prev_idx].strip() == '':
-            prev_idx -= 1
-        if prev_idx >= 0 and lines[prev_idx].strip() == '::html-preview':
-            is_already_wrapped = True
-        
-        if is_already_wrapped:
-            new_lines.append(line)
-            i += 1
-            continue
-        
-        # Not wrapped, let's wrap it!
-        new_lines.append('::html-preview')
-        new_lines.append('')
-        new_lines.append(line)
-        
-        # Find closing ```
-        i += 1
-        while i < len(lines):
-            close_line = lines[i]
-            new_lines.append(close_line)
-            if close_line.startswith('```'):
-                # Check if there is already a `::` closing tag?
-                # Sometimes there's CSS block after HTML block. If we wrap only HTML, we must close after HTML.
-                # Let's peek ahead to see if there is ```css.
-                # Actually, no, if it's already wrapped, the script skips it. 
-                # If it's NOT wrapped, we just wrap the HTML block.
-                # Wait, if there's no ```css, we wrap it.
-                break
-            i += 1
-        
-        new_lines.append('')
-        new_lines.append('::')
-    else:
-        new_lines.append(line)
-    i += 1
+    # Not wrapped, let's wrap it!
+    # Sometimes there's CSS block after HTML block. If we wrap only HTML, we must close after HTML.
+    text = span.text if span.text.endswith('\n') else span.text + '\n'
+    return '::html-preview\n\n' + text + '\n::\n'
 
-with open('/Users/arakviel/Work/kostyl.dev/content/12.html-css/05.html-forms.md.tmp', 'w', encoding='utf-8') as f:
-    f.write('\n'.join(new_lines))
+def wrap_html_previews(content):
+    return rewrite(content, wrap_html)
 
-print("Done")
+if __name__ == "__main__":
+    # Use --dry-run to see which files would change before writing in place
+    run_cli(
+        "wrap_html_preview", wrap_html_previews,
+        default_patterns=["content/12.html-css/05.html-forms.md"],
+        description="Wrap bare ```html blocks into ::html-preview.",
+    )
@@ -0,0 +1,216 @@
+"""
+batch_runner.py — спільний раннер для markdown-фіксерів (fix_mermaid, refactor_style, unwrap_svg, ...).
+
+  - приймає glob-и по content/** (за замовчуванням — увесь content/)
+  - роздає файли по ProcessPoolExecutor
+  - пропускає файли, вміст яких цей фіксер (тієї ж версії) уже обробляв
+    (спільний маніфест .content-cache/manifest.sqlite, див. content_manifest.py);
+    версія — хеш коду фіксера (`code_version`), тож після правки фіксера
+    --changed знову проходить усі файли без ручного підняття версії
+  - `--changed [REF]` — лише файли, змінені в git відносно REF (для pre-commit)
+  - пише результат атомарно: тимчасовий файл поряд + os.replace
+
+Фіксер — це звичайна функція `transform(content: str) -> str` рівня модуля
+(щоб її можна було передати в інший процес), а CLI збирається через `run_cli`:
+
+  if __name__ == "__main__":
+      run_cli("fix_mermaid", fix_mermaid, default_patterns=["content/**/*.md"])
+"""
+
+import argparse
+import glob
+import hashlib
+import inspect
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+from content_manifest import ROOT, STATE_DIR, ContentManifest, git_changed_files
+
+# umask читається один раз при імпорті: os.umask() змінює його для всього процесу,
+# а atomic_write викликають із потоків (журнал імпорту, маппінг завантажень)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+def code_version(transform: Callable[[str], str]) -> str:
+    """
+    Хеш коду фіксера: модуль, де визначено `transform`, і модулі репозиторію,
+    з яких він імпортує (mdc_tokenizer тощо). Змінився код — змінилась версія.
+    """
+    func = getattr(transform, "func", transform)  # functools.partial
+    module = inspect.getmodule(func)
+    sources = {getattr(module, "__file__", None)}
+    for value in vars(module).values() if module else ():
+        dep = value if inspect.ismodule(value) else inspect.getmodule(value)
+        sources.add(getattr(dep, "__file__", None))
+
+    h = hashlib.sha256()
+    for path in sorted(p for p in sources if p):
+        path = os.path.abspath(path)
+        if not path.startswith(ROOT + os.sep) or not path.endswith(".py") or path == os.path.abspath(__file__):
+            continue
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:12]
+
+
+def expand_patterns(patterns: list[str]) -> list[str]:
+    """Розгортає glob-и (з підтримкою **) у відсортований список унікальних .md файлів."""
+    found: set[str] = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "**", "*.md")
+        for path in glob.glob(pattern, recursive=True):
+            if os.path.isfile(path):
+                found.add(os.path.abspath(path))
+    return sorted(found)
+
+
+def select_files(patterns: list[str], changed: str | None = None) -> list[str]:
+    """
+    `expand_patterns`, обмежений (якщо задано `changed`) файлами, зміненими в git відносно ref.
+    Якщо git недоступний, повертає всі файли — маніфест однаково відсіє необроблені.
+    """
+    paths = expand_patterns(patterns)
+    if changed is None:
+        return paths
+    in_git = git_changed_files(changed)
+    if in_git is None:
+        print("[~] git недоступний — перевіряю всі файли за маніфестом")
+        return paths
+    in_git_set = set(in_git)
+    return [path for path in paths if path in in_git_set]
+
+
+def atomic_write(path: str, content: str) -> None:
+    """Пише файл через тимчасовий файл у тій самій папці + rename, зберігаючи права доступу."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        else:
+            # mkstemp створює файл з 0600 — новому файлу даємо звичайні права за umask
+            os.chmod(tmp_path, NEW_FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _process(job: tuple[Callable[[str], str], str, bool]) -> tuple[str, str, str]:
+    """Обробляє один файл у воркері. Повертає (path, status, error)."""
+    transform, path, dry_run = job
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            content = f.read()
+        result = transform(content)
+        if result == content:
+            return path, "no change", ""
+        if not dry_run:
+            atomic_write(path, result)
+        return path, "CHANGED", ""
+    except Exception as e:
+        return path, "ERROR", f"{type(e).__name__}: {e}"
+
+
+def run(
+    tool: str,
+    transform: Callable[[str], str],
+    patterns: list[str],
+    *,
+    jobs: int | None = None,
+    force: bool = False,
+    dry_run: bool = False,
+    version: str = "1",
+    changed: str | None = None,
+) -> int:
+    """
+    Проганяє `transform` по всіх файлах з `patterns`
+    (або лише по змінених у git відносно `changed`).
+    `version` розрізняє режими одного фіксера; до нього додається `code_version`.
+    Повертає кількість файлів, що завершились помилкою.
+    """
+    version = f"{version}:{code_version(transform)}"
+    paths = select_files(patterns, changed)
+    manifest = ContentManifest()
+    todo = paths if force else manifest.select_changed(paths, tool, version)
+    skipped = len(paths) - len(todo)
+
+    jobs = jobs or os.cpu_count() or 1
+    work = [(transform, path, dry_run) for path in todo]
+    if jobs == 1 or len(work) <= 1:
+        results = [_process(job) for job in work]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_process, work, chunksize=max(1, len(work) // (jobs * 4))))
+
+    counts = {"CHANGED": 0, "no change": 0, "ERROR": 0}
+    for path, status, error in results:
+        counts[status] += 1
+        rel = os.path.relpath(path, ROOT)
+        if status == "ERROR":
+            print(f"{status:10s}  {rel}: {error}")
+            manifest.forget(path, tool)
+            continue
+        if status == "CHANGED":
+            print(f"{status:10s}  {rel}")
+        # У dry-run змінені файли не записані, тож їх треба перевірити наступного разу
+        if not (dry_run and status == "CHANGED"):
+            manifest.mark(path, tool, version)
+
+    manifest.prune_missing()
+    manifest.close()
+
+    print(
+        f"\n{len(paths)} файлів: змінено {counts['CHANGED']}, без змін {counts['no change']}, "
+        f"пропущено (не змінювались) {skipped}, помилок {counts['ERROR']}"
+        + (" [dry-run]" if dry_run else "")
+    )
+    return counts["ERROR"]
+
+
+def add_arguments(parser: argparse.ArgumentParser, default_patterns: list[str]) -> None:
+    """Додає стандартні аргументи раннера до CLI фіксера."""
+    parser.add_argument(
+        "paths", nargs="*",
+        help=f"Файли, папки або glob-и (за замовчуванням: {' '.join(default_patterns)})",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Кількість процесів (за замовчуванням — кількість ядер)")
+    parser.add_argument("--force", action="store_true",
+                        help="Обробити всі файли, навіть якщо вони не змінювались")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Показати, які файли зміняться, без запису")
+    add_changed_argument(parser)
+
+
+def add_changed_argument(parser: argparse.ArgumentParser) -> None:
+    """`--changed [REF]`: обробляти лише файли, змінені в git відносно REF (за замовчуванням HEAD)."""
+    parser.add_argument("--changed", nargs="?", const="HEAD", default=None, metavar="REF",
+                        help="Лише файли, змінені в git відносно REF (за замовчуванням HEAD)")
+
+
+def run_cli(
+    tool: str,
+    transform: Callable[[str], str],
+    default_patterns: list[str],
+    description: str = "",
+    version: str = "1",
+) -> None:
+    """Повний CLI для фіксера: розбирає аргументи, запускає `run`, виходить з кодом помилки."""
+    parser = argparse.ArgumentParser(description=description or f"{tool}: batch-обробка markdown")
+    add_arguments(parser, default_patterns)
+    args = parser.parse_args()
+
+    patterns = args.paths or [os.path.join(ROOT, p) for p in default_patterns]
+    errors = run(tool, transform, patterns, jobs=args.jobs, force=args.force,
+                 dry_run=args.dry_run, version=version, changed=args.changed)
+    sys.exit(1 if errors else 0)
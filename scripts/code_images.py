@@ -0,0 +1,179 @@
+"""
+code_images.py — рендер коду в PNG через silicon з кешем за вмістом.
+
+Ключ кешу — SHA-256 від (код, мова, тема, прапорці silicon, версія silicon),
+тож повторний експорт тестів рендерить лише змінений код. PNG зберігаються в
+.content-cache/code-images/<2 символи>/<ключ>.png; коли кеш перевищує
+`max_bytes`, видаляються найдавніше використані файли (LRU за mtime —
+кожне влучання в кеш оновлює mtime файлу). Розмір кешу рахується обходом
+папки один раз на процес, далі — наростаючим підсумком; повний обхід
+повторюється лише коли підсумок перевищить ліміт (і чистить кеш із запасом).
+
+Використання:
+  from code_images import render_code_image
+
+  png_path = render_code_image(code, "cs")          # шлях до PNG у кеші
+  render_code_image(code, "cs", "out/q1.png")       # + копія у вказаний файл
+"""
+
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+
+from batch_runner import STATE_DIR
+
+CACHE_DIR = os.path.join(STATE_DIR, "code-images")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Після перевищення ліміту кеш чиститься до цієї частки: наступні рендери мають запас,
+# і обхід папки не повторюється на кожному новому PNG
+EVICT_TO = 0.9
+
+THEME = "Visual Studio Dark+"
+SILICON_FLAGS = ("--no-window-controls", "--no-round-corner", "--pad-horiz", "0", "--pad-vert", "0")
+
+
+@functools.lru_cache(maxsize=None)
+def silicon_version() -> str:
+    try:
+        result = subprocess.run(["silicon", "--version"], capture_output=True, text=True, timeout=30)
+        return result.stdout.strip()
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+
+
+def render_key(code: str, lang: str, theme: str = THEME, flags: tuple[str, ...] = SILICON_FLAGS) -> str:
+    payload = "\0".join((code, lang or "", theme, " ".join(flags), silicon_version()))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CodeImageCache:
+    def __init__(self, path: str = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        # Оцінка розміру кешу: None — ще не рахували; PNG інших процесів у ній не видно,
+        # тож evict() при перевищенні все одно обходить папку і уточнює її
+        self._total: int | None = None
+        self._lock = threading.Lock()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], f"{key}.png")
+
+    def get(self, key: str) -> str | None:
+        """Шлях до PNG у кеші або None; влучання оновлює mtime (для LRU)."""
+        path = self._file(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key: str, png_path: str) -> str:
+        """Переносить готовий PNG у кеш і повертає його новий шлях."""
+        path = self._file(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.move(png_path, path)
+        size = os.path.getsize(path)
+        with self._lock:
+            if self._total is None:
+                self._total = self._scan()[1]
+            else:
+                self._total += size
+            over = self._total > self.max_bytes
+        if over:
+            self.evict(keep=path)
+        return path
+
+    def _scan(self) -> tuple[list[tuple[float, int, str]], int]:
+        """(mtime, розмір, шлях) усіх PNG кешу і їхній сумарний розмір."""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.path):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        return entries, total
+
+    def evict(self, keep: str | None = None) -> int:
+        """
+        Якщо кеш більший за `max_bytes` — видаляє найдавніше використані PNG
+        (крім `keep`), поки він не зменшиться до EVICT_TO від ліміту.
+        """
+        with self._lock:
+            entries, total = self._scan()
+            removed = 0
+            target = self.max_bytes * EVICT_TO if total > self.max_bytes else total
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self._total = total
+        return removed
+
+
+@functools.lru_cache(maxsize=None)
+def default_cache() -> CodeImageCache:
+    """Спільний кеш процесу: наростаючий підсумок розміру живе між викликами рендеру."""
+    return CodeImageCache()
+
+
+def _run_silicon(code: str, lang: str, output_path: str, theme: str, flags: tuple[str, ...]) -> None:
+    # Унікальна тимчасова папка — рендери можуть іти паралельно
+    with tempfile.TemporaryDirectory(prefix="silicon-") as tmp_dir:
+        source = os.path.join(tmp_dir, f"code.{lang or 'txt'}")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write(code)
+        cmd = ["silicon", "--theme", theme, *flags]
+        if lang:
+            cmd.extend(["-l", lang])
+        cmd += [source, "-o", output_path]
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def render_code_image(
+    code: str,
+    lang: str = "",
+    output_path: str | None = None,
+    *,
+    theme: str = THEME,
+    flags: tuple[str, ...] = SILICON_FLAGS,
+    cache: CodeImageCache | None = None,
+) -> str:
+    """
+    Повертає шлях до PNG з кодом: з кешу або щойно відрендерений silicon.
+    З `output_path` PNG ще й копіюється туди (і повертається цей шлях).
+    Помилки silicon прокидаються як subprocess.CalledProcessError / OSError.
+    """
+    cache = cache or default_cache()
+    key = render_key(code, lang, theme, flags)
+    cached = cache.get(key)
+    if cached is None:
+        fd, tmp_png = tempfile.mkstemp(prefix="silicon-", suffix=".png")
+        os.close(fd)
+        try:
+            _run_silicon(code, lang, tmp_png, theme, flags)
+            cached = cache.put(key, tmp_png)
+        finally:
+            if os.path.exists(tmp_png):
+                os.remove(tmp_png)
+
+    if output_path is None:
+        return cached
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    shutil.copyfile(cached, output_path)
+    return output_path
@@ -0,0 +1,152 @@
+"""
+content_manifest.py — спільний маніфест файлів content/ для всіх інструментів.
+
+Для кожного файлу зберігає mtime, розмір і SHA-256 вмісту, а для кожної пари
+(файл, інструмент) — версію інструмента і хеш вмісту, який він обробив востаннє.
+Тож будь-який інструмент може обробити лише файли, що змінились після його
+останнього запуску (або після зміни версії самого інструмента).
+
+Версія мусить змінюватись разом з кодом інструмента, інакше --changed пропускатиме
+файли, які нова логіка переписала б: фіксери batch_runner отримують її автоматично
+(хеш коду, `batch_runner.code_version`), а валідатори піднімають VALIDATOR_VERSION
+вручну разом зі зміною логіки перевірки (від неї ж залежить кеш діаграм).
+
+Хеш перераховується тільки коли змінились mtime або розмір, тому перевірка
+всього дерева — це по одному stat на файл.
+
+Для pre-commit є ще дешевший шлях — `git_changed_files`: список змінених файлів
+з `git diff --name-only` без жодного проходу по content/.
+
+Зберігається в SQLite: .content-cache/manifest.sqlite
+
+Використання:
+  with ContentManifest() as manifest:
+      todo = [p for p in paths if not manifest.is_current(p, "fix_mermaid", "1")]
+      ...
+      manifest.mark(path, "fix_mermaid", "1")
+"""
+
+import hashlib
+import os
+import sqlite3
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(ROOT, ".content-cache")
+DEFAULT_PATH = os.path.join(STATE_DIR, "manifest.sqlite")
+
+
+def file_hash(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def git_changed_files(ref: str = "HEAD", staged: bool = False) -> list[str] | None:
+    """
+    Абсолютні шляхи файлів, змінених відносно `ref` (плюс нові неігноровані файли).
+    staged=True — лише проіндексовані зміни (для pre-commit хука).
+    Повертає None, якщо git недоступний або це не репозиторій.
+    """
+    diff = ["git", "diff", "--name-only", "--diff-filter=ACMR"]
+    diff += ["--cached", ref] if staged else [ref]
+    commands = [diff]
+    if not staged:
+        commands.append(["git", "ls-files", "--others", "--exclude-standard"])
+
+    found: set[str] = set()
+    for cmd in commands:
+        try:
+            result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        for line in result.stdout.splitlines():
+            path = os.path.join(ROOT, line.strip())
+            if line.strip() and os.path.isfile(path):
+                found.add(os.path.abspath(path))
+    return sorted(found)
+
+
+class ContentManifest:
+    def __init__(self, path: str = DEFAULT_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path     TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size     INTEGER NOT NULL,
+                hash     TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                path    TEXT NOT NULL,
+                tool    TEXT NOT NULL,
+                version TEXT NOT NULL,
+                hash    TEXT NOT NULL,
+                PRIMARY KEY (path, tool)
+            );
+            """
+        )
+
+    @staticmethod
+    def _rel(path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), ROOT)
+
+    def fingerprint(self, path: str) -> str:
+        """SHA-256 вмісту файлу; перераховується лише якщо змінились mtime або розмір."""
+        rel = self._rel(path)
+        st = os.stat(path)
+        row = self.db.execute("SELECT mtime_ns, size, hash FROM files WHERE path = ?", (rel,)).fetchone()
+        if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+            return row[2]
+        digest = file_hash(path)
+        self.db.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, hash) VALUES (?, ?, ?, ?)",
+            (rel, st.st_mtime_ns, st.st_size, digest),
+        )
+        return digest
+
+    def is_current(self, path: str, tool: str, version: str) -> bool:
+        """Чи вже обробив `tool` версії `version` саме цей вміст файлу."""
+        row = self.db.execute(
+            "SELECT version, hash FROM runs WHERE path = ? AND tool = ?", (self._rel(path), tool)
+        ).fetchone()
+        return row is not None and row[0] == version and row[1] == self.fingerprint(path)
+
+    def select_changed(self, paths: list[str], tool: str, version: str) -> list[str]:
+        return [path for path in paths if not self.is_current(path, tool, version)]
+
+    def mark(self, path: str, tool: str, version: str) -> None:
+        """Запам'ятовує, що `tool` обробив поточний вміст файлу."""
+        self.db.execute(
+            "INSERT OR REPLACE INTO runs (path, tool, version, hash) VALUES (?, ?, ?, ?)",
+            (self._rel(path), tool, version, self.fingerprint(path)),
+        )
+
+    def forget(self, path: str, tool: str) -> None:
+        self.db.execute("DELETE FROM runs WHERE path = ? AND tool = ?", (self._rel(path), tool))
+
+    def prune_missing(self) -> int:
+        """Видаляє записи про файли, яких уже немає на диску."""
+        gone = [rel for (rel,) in self.db.execute("SELECT path FROM files")
+                if not os.path.exists(os.path.join(ROOT, rel))]
+        for rel in gone:
+            self.db.execute("DELETE FROM files WHERE path = ?", (rel,))
+            self.db.execute("DELETE FROM runs WHERE path = ?", (rel,))
+        return len(gone)
+
+    def close(self) -> None:
+        if self.db is None:
+            return
+        self.db.commit()
+        self.db.close()
+        self.db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,160 @@
+"""
+diagram_cache.py — кеш результатів валідації діаграм між запусками.
+
+Ключ — SHA-256 від (валідатор, версія валідатора, нормалізоване джерело діаграми),
+тому повторна перевірка всього content/ після правки однієї сторінки торкається
+лише змінених блоків. Зберігається в SQLite: .content-cache/diagrams.sqlite
+
+Політика витіснення (виконується при закритті кешу):
+  - записи, якими не користувались понад `max_age_days`, видаляються;
+  - якщо записів валідатора більше за `max_entries`, лишаються найсвіжіші (LRU).
+
+Використання:
+  with DiagramCache("mermaid", version) as cache:
+      hit = cache.get(code)            # {'valid': ..., 'error': ..., 'line': ...} або None
+      cache.put(code, valid, error, line)
+
+`line` в обидва боки — номер рядка відносно переданого `code`: кеш сам враховує
+порожні рядки на початку, які нормалізація відкидає.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+
+from batch_runner import STATE_DIR
+
+DEFAULT_PATH = os.path.join(STATE_DIR, "diagrams.sqlite")
+# Формат записів: 2 — рядок помилки зберігається відносно нормалізованого джерела
+FORMAT = "2"
+
+
+def normalize_source(source: str) -> str:
+    """Прибирає відмінності, що не впливають на діаграму: CRLF, хвостові пробіли, порожні рядки по краях."""
+    lines = [line.rstrip() for line in source.replace("\r\n", "\n").split("\n")]
+    return "\n".join(lines).strip("\n")
+
+
+def leading_blank_lines(source: str) -> int:
+    """Скільки порожніх рядків на початку відкидає `normalize_source`."""
+    count = 0
+    for line in source.replace("\r\n", "\n").split("\n"):
+        if line.strip():
+            break
+        count += 1
+    return count
+
+
+class DiagramCache:
+    def __init__(
+        self,
+        validator: str,
+        version: str,
+        path: str = DEFAULT_PATH,
+        enabled: bool = True,
+        max_entries: int = 20000,
+        max_age_days: int = 90,
+    ):
+        self.validator = validator
+        self.version = version
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.started_at = time.time()
+        self.hits = 0
+        self.misses = 0
+        self.db = None
+        if not enabled:
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                key        TEXT PRIMARY KEY,
+                validator  TEXT NOT NULL,
+                valid      INTEGER NOT NULL,
+                error      TEXT NOT NULL DEFAULT '',
+                line       INTEGER,
+                created_at REAL NOT NULL,
+                last_used  REAL NOT NULL
+            )
+            """
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_lru ON results (validator, last_used)")
+
+    def key(self, source: str) -> str:
+        payload = "\0".join((FORMAT, self.validator, self.version, normalize_source(source)))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, source: str) -> dict | None:
+        if self.db is None:
+            return None
+        key = self.key(source)
+        row = self.db.execute("SELECT valid, error, line FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        # Той самий ключ дають блоки з різною кількістю порожніх рядків на початку
+        line = row[2] + leading_blank_lines(source) if row[2] is not None else None
+        return {"valid": bool(row[0]), "error": row[1], "line": line}
+
+    def put(self, source: str, valid: bool, error: str = "", line: int | None = None) -> None:
+        """`line` — відносно `source` як є; зберігається відносно нормалізованого джерела."""
+        if self.db is None:
+            return
+        if line is not None:
+            line -= leading_blank_lines(source)
+        now = time.time()
+        self.db.execute(
+            "INSERT OR REPLACE INTO results (key, validator, valid, error, line, created_at, last_used)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.key(source), self.validator, int(valid), error or "", line, now, now),
+        )
+
+    def prune_unused(self) -> int:
+        """Видаляє записи валідатора, які не знадобились у поточному запуску (діаграми, яких уже немає)."""
+        if self.db is None:
+            return 0
+        cur = self.db.execute(
+            "DELETE FROM results WHERE validator = ? AND last_used < ?",
+            (self.validator, self.started_at),
+        )
+        return cur.rowcount
+
+    def evict(self) -> int:
+        """Застосовує політику витіснення: TTL за останнім використанням + ліміт кількості (LRU)."""
+        if self.db is None:
+            return 0
+        removed = self.db.execute(
+            "DELETE FROM results WHERE validator = ? AND last_used < ?",
+            (self.validator, time.time() - self.max_age_days * 86400),
+        ).rowcount
+        removed += self.db.execute(
+            """
+            DELETE FROM results WHERE key IN (
+                SELECT key FROM results WHERE validator = ?
+                ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.validator, self.max_entries),
+        ).rowcount
+        return removed
+
+    def close(self) -> None:
+        if self.db is None:
+            return
+        self.evict()
+        self.db.commit()
+        self.db.close()
+        self.db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,9 +1,10 @@
-import re
-import os
-import sys
+from batch_runner import run_cli
+from mdc_tokenizer import rewrite
 
-def fix_block(match):
-    block = match.group(1)
+def fix_block(span):
+    if span.kind != 'code' or span.lang != 'mermaid':
+        return None
+    block = span.body
     if 'sequenceDiagram' in block:
         lines = block.splitlines()
         new_lines = []
@@ -16,24 +17,18 @@ def fix_block(match):
                     if not (label.startswith('"') and label.endswith('"')):
                         line = f'{parts[0]}: "{label}"'
                 new_lines.append(line)
-        return '```mermaid\n' + '\n'.join(new_lines) + '\n```'
-    return match.group(0)
+        return span.replace_body('\n'.join(new_lines) + '\n')
+    return None
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python fix_mermaid.py <file.md>")
-        return
-    
-    file_path = sys.argv[1]
-        
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    new_content = re.sub(r'```mermaid\n(.*?)\n```', fix_block, content, flags=re.DOTALL)
+def fix_mermaid(content):
+    return rewrite(content, fix_block)
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    print("Fixed mermaid blocks.")
+def main():
+    run_cli(
+        "fix_mermaid", fix_mermaid,
+        default_patterns=["content/**/*.md"],
+        description="Fix mermaid sequence diagrams in markdown files (files, folders or globs).",
+    )
 
 if __name__ == "__main__":
     main()
@@ -3,152 +3,175 @@
 Генерує зображення для варіантів відповідей тесту.
 Читає JSON з питаннями, рендерить кожен варіант через silicon,
 створює mapping.json для wayground_add_images.py.
+
+Рендер і завантаження йдуть конвеєром: пул рендеру кладе готові PNG в обмежену
+чергу, яку розбирає пул завантаження. answer_mapping.json перезаписується після
+кожного завантаженого зображення, тож перерваний запуск продовжується з того
+місця, де зупинився. Кожен запис маппінгу зберігає render_key коду варіанта:
+пропускаються лише варіанти, код яких відтоді не змінився.
+
+Використання:
+  python3 generate_answer_images.py <json_path> <quiz_id>
+  python3 generate_answer_images.py <json_path> <quiz_id> --render-jobs 8 --upload-jobs 8
+  python3 generate_answer_images.py <json_path> <quiz_id> --restart   # ігнорувати наявний mapping
 """
+import argparse
 import json
 import os
-import subprocess
+import queue
+import re
 import sys
-import requests
-import uuid
-import hashlib
-
-
-def get_catbox_userhash():
-    """Читає CATBOX_USERHASH з .env."""
-    env_dirs = [
-        os.path.dirname(os.path.abspath(__file__)),
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"),
-    ]
-    for d in env_dirs:
-        env_file = os.path.join(d, ".env")
-        if os.path.exists(env_file):
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        k, _, v = line.partition("=")
-                        os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
-            break
-    return os.environ.get("CATBOX_USERHASH", "")
-
-
-def get_wayground_session():
-    """Логінимось на Wayground."""
-    env_dirs = [
-        os.path.dirname(os.path.abspath(__file__)),
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"),
-    ]
-    for d in env_dirs:
-        env_file = os.path.join(d, ".env")
-        if os.path.exists(env_file):
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        k, _, v = line.partition("=")
-                        os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
-            break
-
-    email = os.environ.get("WAYGROUND_EMAIL", "")
-    password = os.environ.get("WAYGROUND_PASSWORD", "")
-    if not email or not password:
-        return None
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-    try:
-        resp = requests.post(
-            "https://wayground.com/_authserver/public/public/v1/auth/login/local",
-            json={"username": email, "password": password, "requestId": str(uuid.uuid4())},
-            headers={"Content-Type": "application/json", "User-Agent": "Mozilla/5.0",
-                     "Origin": "https://wayground.com"},
-            timeout=15,
-        )
-        sid = resp.cookies.get("_sid")
-        if not sid:
-            return None
-        session = requests.Session()
-        session.cookies.set("_sid", sid, domain="wayground.com")
-        session.headers.update({"User-Agent": "Mozilla/5.0", "Origin": "https://wayground.com"})
-        return session
-    except Exception:
-        return None
+from batch_runner import atomic_write
+from code_images import render_code_image, render_key
+from upload_index import UploadIndex, upload_with_index
+from uploader import DEFAULT_JOBS, upload_to_catbox, upload_to_wayground
+from wayground_auth import catbox_userhash, get_session
+
+CODE_BLOCK_RE = re.compile(r'```(\w*)\n([\s\S]*?)\n```')
 
 
-def upload_to_catbox(img_path, userhash):
-    """Завантажує PNG на catbox.moe."""
+def render_code_to_image(code_text, lang):
+    """Рендерить код через silicon (з кешем PNG, див. code_images.py). Повертає шлях до PNG або None."""
     try:
-        with open(img_path, "rb") as f:
-            img_data = f.read()
-        r = requests.post(
-            "https://catbox.moe/user/api.php",
-            data={"reqtype": "fileupload", "userhash": userhash},
-            files={"fileToUpload": ("image.png", img_data, "image/png")},
-            timeout=30,
-        )
-        url = r.text.strip()
-        return url if url.startswith("https://") else None
-    except Exception:
+        return render_code_image(code_text, lang)
+    except Exception as e:
+        print(f"  ⚠️ Помилка silicon: {e}")
         return None
 
 
-def upload_to_wayground(session, img_path):
-    """Завантажує PNG на Wayground S3."""
-    try:
-        with open(img_path, "rb") as f:
-            img_data = f.read()
-        r = session.post(
-            "https://media.quizizz.com/_mdserver/main/getUploadURL"
-            "?destination=quizzes&enableAcceleration=true",
-            timeout=15,
-        )
-        if r.status_code != 200 or not r.json().get("success"):
-            return None
-        res = r.json()["data"]
-        s3 = requests.put(
-            res["signedUrl"],
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            data=img_data,
-            timeout=30,
-        )
-        return res["finalUrl"] if s3.status_code == 200 else None
-    except Exception:
-        return None
+def collect_tasks(questions):
+    """Варіанти відповідей з блоками коду: список (question_index, option_index, lang, code)."""
+    tasks = []
+    for q_idx, q in enumerate(questions):
+        q_type = q.get("Question Type", "Multiple Choice")
+        if q_type in ("Open-Ended", "Draw", "Fill-in-the-Blank"):
+            continue
+
+        for opt_idx in range(1, 6):
+            opt_text = q.get(f"Option {opt_idx}", "")
+            if not opt_text:
+                continue
+
+            # Перевіряємо чи є блок коду у варіанті
+            code_match = CODE_BLOCK_RE.search(str(opt_text))
+            if code_match:
+                tasks.append((q_idx, opt_idx - 1, code_match.group(1) or "", code_match.group(2)))
+    return tasks
+
+
+class MappingWriter:
+    """Накопичує записи маппінгу і після кожного нового атомарно переписує файл (впорядковано)."""
+
+    def __init__(self, path, entries=()):
+        self.path = path
+        self.entries = {(e["question_index"], e["option_index"]): e for e in entries}
+        self.lock = threading.Lock()
 
+    def add(self, entry):
+        with self.lock:
+            self.entries[(entry["question_index"], entry["option_index"])] = entry
+            self._write()
 
-def render_code_to_image(code_text, lang, output_path):
-    """Рендерить код через silicon."""
-    ext = lang if lang else "txt"
-    temp_file = f"/tmp/answer_{os.getpid()}.{ext}"
+    def save(self):
+        with self.lock:
+            self._write()
+
+    def _write(self):
+        ordered = [self.entries[key] for key in sorted(self.entries)]
+        atomic_write(self.path, json.dumps(ordered, indent=2, ensure_ascii=False))
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def load_mapping(path):
     try:
-        with open(temp_file, "w", encoding="utf-8") as f:
-            f.write(code_text)
-            cmd = [
-                "silicon", "--no-window-controls",
-                "--theme", "Visual Studio Dark+",
-                "--no-round-corner",
-                "--pad-horiz", "0", "--pad-vert", "0",
-            ]
-        if lang:
-            cmd.extend(["-l", lang])
-        cmd += [temp_file, "-o", output_path]
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    except Exception as e:
-        print(f"  ⚠️ Помилка silicon: {e}")
-        return False
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        return entries if isinstance(entries, list) else []
+    except (OSError, ValueError):
+        return []
+
+
+def run_pipeline(tasks, uploaders, index, writer, render_jobs, upload_jobs):
+    """
+    Конвеєр рендер → завантаження: `render_jobs` потоків рендерять PNG і кладуть їх
+    в обмежену чергу (рендер не втікає далеко вперед), `upload_jobs` потоків
+    завантажують і одразу дописують результат у маппінг.
+    Повертає кількість варіантів, які не вдалося відрендерити або завантажити.
+    """
+    rendered = queue.Queue(maxsize=upload_jobs * 2)
+    failed = []
+
+    def put(item):
+        # Черга обмежена: якщо всі завантажувачі впали, звичайний put() чекав би вічно
+        while True:
+            try:
+                rendered.put(item, timeout=1)
+                return
+            except queue.Full:
+                if not any(t.is_alive() for t in uploaders_threads):
+                    raise RuntimeError("усі потоки завантаження зупинились")
+
+    def render(task):
+        q_idx, opt_idx, lang, code = task
+        print(f"  📝 [{q_idx}] opt {opt_idx}: код ({lang or 'plain'})")
+        put((task, render_code_to_image(code, lang)))
+
+    def upload_worker():
+        while True:
+            item = rendered.get()
+            if item is None:
+                return
+            (q_idx, opt_idx, lang, code), img_path = item
+            try:
+                image_url, host = upload_with_index(img_path, uploaders, index) if img_path else (None, None)
+                if image_url:
+                    print(f"    🚀 [{q_idx}] opt {opt_idx} → {host}: {image_url[:60]}...")
+                    writer.add({"question_index": q_idx, "option_index": opt_idx, "image_path": image_url,
+                                "render_key": render_key(code, lang)})
+                    continue
+                print(f"    ⚠️ [{q_idx}] opt {opt_idx}: не вдалося згенерувати або завантажити")
+            except Exception as e:
+                # Потік не має тихо вмирати: інакше рендер заблокується на повній черзі
+                print(f"    ❌ [{q_idx}] opt {opt_idx}: {e}")
+            failed.append((q_idx, opt_idx))
+
+    uploaders_threads = [threading.Thread(target=upload_worker) for _ in range(upload_jobs)]
+    for t in uploaders_threads:
+        t.start()
+    try:
+        with ThreadPoolExecutor(max_workers=render_jobs) as executor:
+            list(executor.map(render, tasks))
     finally:
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+        for t in uploaders_threads:
+            if t.is_alive():
+                try:
+                    put(None)
+                except RuntimeError:
+                    break
+        for t in uploaders_threads:
+            t.join()
+    return len(failed)
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Використання: python3 generate_answer_images.py <json_path> <quiz_id>")
-        print("  json_path — шлях до JSON з питаннями")
-        print("  quiz_id   — ID тесту на Wayground")
-        sys.exit(1)
-
-    json_path = sys.argv[1]
-    quiz_id = sys.argv[2]
+    parser = argparse.ArgumentParser(description="Генерує й завантажує зображення коду для варіантів відповідей.")
+    parser.add_argument("json_path", help="Шлях до JSON з питаннями")
+    parser.add_argument("quiz_id", help="ID тесту на Wayground")
+    parser.add_argument("--render-jobs", type=int, default=os.cpu_count() or 1,
+                        help="Паралельних рендерів silicon (за замовчуванням — кількість ядер)")
+    parser.add_argument("--upload-jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"Паралельних завантажень (за замовчуванням: {DEFAULT_JOBS})")
+    parser.add_argument("--restart", action="store_true",
+                        help="Почати з нуля, ігноруючи наявний answer_mapping.json")
+    args = parser.parse_args()
+
+    json_path = args.json_path
+    quiz_id = args.quiz_id
 
     with open(json_path, "r", encoding="utf-8") as f:
         questions = json.load(f)
@@ -159,13 +182,14 @@ def main():
                 questions = questions[key]
                 break
 
-    # Створюємо папку для зображень
-    img_dir = os.path.join(os.path.dirname(json_path) or ".", "answer_images")
-    os.makedirs(img_dir, exist_ok=True)
-
-    # Авторизація
-    wg_session = get_wayground_session()
-    catbox_hash = get_catbox_userhash()
+    # Авторизація (збережена сесія Wayground або новий логін, див. wayground_auth.py).
+    # Будь-яка невдача логіну (зокрема мережа) — RuntimeError і fallback на catbox/litterbox
+    try:
+        wg_session = get_session()
+    except RuntimeError as e:
+        print(f"⚠️ Wayground: {e}")
+        wg_session = None
+    catbox_hash = catbox_userhash()
 
     if wg_session:
         print("🔑 Wayground авторизовано")
@@ -175,78 +199,42 @@ def main():
         print("❌ Немає авторизації — зображення не завантажаться")
         sys.exit(1)
 
-    mapping = []
-    temp_files = []
-
-    for q_idx, q in enumerate(questions):
-        q_type = q.get("Question Type", "Multiple Choice")
-        if q_type in ("Open-Ended", "Draw", "Fill-in-the-Blank"):
-            continue
-
-        print(f"\n[{q_idx}] {q.get('Question Text', '')[:60]}...")
-
-        for opt_idx in range(1, 6):
-            opt_key = f"Option {opt_idx}"
-            opt_text = q.get(opt_key, "")
-            if not opt_text:
-                continue
-
-            # Перевіряємо чи є блок коду у варіанті
-            import re
-            code_match = re.search(r'```(\w*)\n([\s\S]*?)\n```', str(opt_text))
-            if not code_match:
-                continue
-
-            lang = code_match.group(1) or ""
-            code = code_match.group(2)
-
-            print(f"  📝 opt {opt_idx-1}: код ({lang or 'plain'})")
-
-            # Рендеримо
-            img_name = f"q{q_idx}_opt{opt_idx-1}.png"
-            img_path = os.path.join(img_dir, img_name)
-
-            if not render_code_to_image(code, lang, img_path):
-                continue
-
-            temp_files.append(img_path)
-
-            # Завантажуємо
-            image_url = None
-            if wg_session:
-                image_url = upload_to_wayground(wg_session, img_path)
-                if image_url:
-                    print(f"    🚀 Wayground: {image_url[:60]}...")
+    # Пріоритет хостів: Wayground S3, потім catbox; уже завантажені PNG беруться з індексу
+    uploaders = []
+    if wg_session:
+        uploaders.append(("wayground", lambda path: upload_to_wayground(wg_session, path)))
+    if catbox_hash:
+        uploaders.append(("catbox", lambda path: upload_to_catbox(path, catbox_hash)))
 
-            if not image_url and catbox_hash:
-                image_url = upload_to_catbox(img_path, catbox_hash)
-                if image_url:
-                    print(f"    🚀 Catbox: {image_url}")
-
-            if image_url:
-                mapping.append({
-                    "question_index": q_idx,
-                    "option_index": opt_idx - 1,
-                    "image_path": image_url,
-                })
-            else:
-                print(f"    ⚠️ Не вдалося завантажити")
-
-    # Зберігаємо mapping
+    # Продовжуємо з наявного маппінгу: лишаються записи, код яких не змінився
+    # (за render_key); решта — застарілі, їх варіанти рендеряться заново
     mapping_path = os.path.join(os.path.dirname(json_path) or ".", "answer_mapping.json")
-    with open(mapping_path, "w") as f:
-        json.dump(mapping, f, indent=2, ensure_ascii=False)
-
-    print(f"\n✅ Зображення згенеровано: {len(mapping)} шт")
+    all_tasks = collect_tasks(questions)
+    keys = {(q_idx, opt_idx): render_key(code, lang) for q_idx, opt_idx, lang, code in all_tasks}
+    previous = [] if args.restart else load_mapping(mapping_path)
+    current = [e for e in previous
+               if keys.get((e.get("question_index"), e.get("option_index"))) == e.get("render_key")]
+    writer = MappingWriter(mapping_path, current)
+    tasks = [t for t in all_tasks if (t[0], t[1]) not in writer.entries]
+    if len(current) < len(previous):
+        # Застарілі посилання не мають дожити до wayground_add_images.py, навіть якщо рендер не вдасться
+        writer.save()
+        print(f"♻️  Застарілих записів у {mapping_path}: {len(previous) - len(current)} — рендеримо заново")
+    if len(writer):
+        print(f"↩️  Продовжуємо: {len(writer)} варіантів уже в {mapping_path}")
+    print(f"🎨 До обробки: {len(tasks)} варіантів з кодом")
+
+    with UploadIndex() as index:
+        failed = run_pipeline(tasks, uploaders, index, writer,
+                              max(1, args.render_jobs), max(1, args.upload_jobs))
+
+    print(f"\n✅ Зображення згенеровано: {len(writer)} шт" + (f", не вдалося: {failed}" if failed else ""))
     print(f"📁 Mapping: {mapping_path}")
+    if failed:
+        print("   Запусти ще раз, щоб дообробити пропущені варіанти")
     print(f"\nДля застосування запусти:")
     print(f"  python3 scripts/wayground_add_images.py --quiz-id {quiz_id} --mapping {mapping_path}")
 
-    # Прибираємо тимчасові файли
-    for f in temp_files:
-        if os.path.exists(f):
-            os.remove(f)
-
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,246 @@
+"""
+mdc_tokenizer.py — однопрохідний токенізатор Docus/MDC markdown.
+
+Проходить файл один раз (рядок за рядком) і віддає типізовані спани:
+
+  prose            — звичайний текст між іншими конструкціями
+  code             — fenced-блок коду (```lang meta ... ```), з lang, meta і body
+  component_open   — відкриття компонента (::name{props}), з name, attrs і depth
+  component_close  — закриття компонента (::), з name і depth відповідного відкриття
+  slot             — мітка слоту всередині компонента (#title, #content, ...)
+  comment          — HTML-коментар (<!-- IMAGE: ... -->), з body
+
+Склеювання `span.text` усіх спанів дає рівно вихідний текст, тому скрипти-фіксери
+пишуться як visitor-функції над спанами (див. `rewrite`).
+
+Використання:
+  from mdc_tokenizer import tokenize, rewrite
+
+  for span in tokenize(text):
+      if span.kind == "code" and span.lang == "mermaid":
+          print(span.start_line, span.end_line)
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+
+FENCE_OPEN_RE = re.compile(r'^[ \t]*(`{3,}|~{3,})[ \t]*([^\s`]*)[ \t]*(.*?)\s*$')
+COMPONENT_OPEN_RE = re.compile(r'^[ \t]*(:{2,})([A-Za-z][\w-]*)(.*?)\s*$')
+COMPONENT_CLOSE_RE = re.compile(r'^[ \t]*(:{2,})\s*$')
+SLOT_RE = re.compile(r'^[ \t]*#([A-Za-z][\w-]*)\s*$')
+COMMENT_OPEN = '<!--'
+COMMENT_CLOSE = '-->'
+
+
+@dataclass(frozen=True)
+class Span:
+    """Один фрагмент вихідного файлу. Рядки 1-based, `end_line` включно, `end` — exclusive."""
+    kind: str
+    text: str
+    start_line: int
+    end_line: int
+    start: int
+    end: int
+    depth: int = 0          # кількість відкритих компонентів навколо (для open/close — рівень самого компонента)
+    parent: str = ''        # ім'я найближчого зовнішнього компонента
+    name: str = ''          # ім'я компонента або слоту
+    attrs: str = ''         # усе після імені компонента: {title="..."} тощо
+    lang: str = ''          # мова fenced-блоку
+    meta: str = ''          # решта info-рядка fenced-блоку: [File.cpp] showLineNumbers
+    body: str = ''          # вміст fenced-блоку або коментаря без огорожі
+    open_fence: str = ''    # рядок ```lang ... разом з \n
+    close_fence: str = ''   # закривальний рядок ``` (порожній, якщо блок не закрито до EOF)
+
+    def replace_body(self, body: str) -> str:
+        """Повертає текст code-спану з новим вмістом, зберігаючи огорожу як є."""
+        return self.open_fence + body + self.close_fence
+
+
+class LineIndex:
+    """
+    Індекс "зміщення → номер рядка" для одного тексту.
+
+    Будується один раз (позиції всіх \n), далі кожен запит — бінарний пошук,
+    тож regex-екстрактори можуть віддавати рядки без повторного сканування файлу.
+    """
+
+    def __init__(self, text: str):
+        self.newlines = [m.start() for m in re.finditer('\n', text)]
+
+    def line_of(self, offset: int) -> int:
+        """1-based номер рядка, у якому стоїть символ з індексом `offset`."""
+        return bisect_right(self.newlines, offset - 1) + 1
+
+    def line_start(self, line: int) -> int:
+        """Зміщення першого символу 1-based рядка `line`."""
+        return 0 if line <= 1 else self.newlines[line - 2] + 1
+
+
+def _is_fence_close(line: str, char: str, length: int) -> bool:
+    stripped = line.strip()
+    return len(stripped) >= length and stripped == char * len(stripped)
+
+
+def tokenize(source: str | Iterable[str]) -> Iterator[Span]:
+    """
+    Стрімінгово розбиває markdown на спани.
+
+    `source` — або весь текст, або ітерабельне рядків із збереженими `\\n`
+    (наприклад, відкритий файл), щоб не тримати файл у пам'яті цілком.
+    """
+    lines = source.splitlines(keepends=True) if isinstance(source, str) else source
+
+    stack: list[tuple[str, str]] = []   # (name, marker) відкритих компонентів
+    prose: list[str] = []
+    prose_start_line = 1
+    prose_start = 0
+    line_no = 0
+    offset = 0
+
+    # Стан багаторядкових конструкцій
+    fence: dict | None = None
+    comment: dict | None = None
+
+    def context() -> tuple[int, str]:
+        return len(stack), (stack[-1][0] if stack else '')
+
+    def flush_prose() -> Iterator[Span]:
+        if prose:
+            depth, parent = context()
+            text = ''.join(prose)
+            yield Span('prose', text, prose_start_line, line_no - 1,
+                       prose_start, prose_start + len(text), depth=depth, parent=parent)
+            prose.clear()
+
+    for line in lines:
+        line_no += 1
+        line_start = offset
+        offset += len(line)
+
+        # --- всередині fenced-блоку: шукаємо лише закривальну огорожу ---
+        if fence is not None:
+            if _is_fence_close(line, fence['char'], fence['length']):
+                yield _code_span(fence, close_fence=line, end_line=line_no, end=offset)
+                fence = None
+            else:
+                fence['body'].append(line)
+            continue
+
+        # --- всередині HTML-коментаря ---
+        if comment is not None:
+            comment['lines'].append(line)
+            if COMMENT_CLOSE in line:
+                yield _comment_span(comment, end_line=line_no, end=offset)
+                comment = None
+            continue
+
+        m = FENCE_OPEN_RE.match(line)
+        if m:
+            yield from flush_prose()
+            depth, parent = context()
+            fence = {
+                'char': m.group(1)[0], 'length': len(m.group(1)),
+                'lang': m.group(2), 'meta': m.group(3),
+                'open_fence': line, 'body': [],
+                'start_line': line_no, 'start': line_start,
+                'depth': depth, 'parent': parent,
+            }
+            continue
+
+        if line.lstrip().startswith(COMMENT_OPEN):
+            yield from flush_prose()
+            depth, parent = context()
+            comment = {'lines': [line], 'start_line': line_no, 'start': line_start,
+                       'depth': depth, 'parent': parent}
+            if COMMENT_CLOSE in line[line.index(COMMENT_OPEN) + len(COMMENT_OPEN):]:
+                yield _comment_span(comment, end_line=line_no, end=offset)
+                comment = None
+            continue
+
+        m = COMPONENT_OPEN_RE.match(line)
+        if m:
+            yield from flush_prose()
+            depth, parent = context()
+            yield Span('component_open', line, line_no, line_no, line_start, offset,
+                       depth=depth, parent=parent, name=m.group(2), attrs=m.group(3))
+            stack.append((m.group(2), m.group(1)))
+            continue
+
+        m = COMPONENT_CLOSE_RE.match(line)
+        if m and stack:
+            yield from flush_prose()
+            # Закриваємо найближчий компонент з тим самим маркером; якщо такого
+            # немає (змішані :: та :::), — просто останній відкритий.
+            idx = len(stack) - 1
+            for i in range(len(stack) - 1, -1, -1):
+                if stack[i][1] == m.group(1):
+                    idx = i
+                    break
+            name = stack[idx][0]
+            del stack[idx:]
+            depth, parent = context()
+            yield Span('component_close', line, line_no, line_no, line_start, offset,
+                       depth=depth, parent=parent, name=name)
+            continue
+
+        m = SLOT_RE.match(line)
+        if m and stack:
+            yield from flush_prose()
+            depth, parent = context()
+            yield Span('slot', line, line_no, line_no, line_start, offset,
+                       depth=depth, parent=parent, name=m.group(1))
+            continue
+
+        if not prose:
+            prose_start_line = line_no
+            prose_start = line_start
+        prose.append(line)
+
+    line_no += 1
+    yield from flush_prose()
+    if fence is not None:
+        # Незакритий блок коду тягнеться до кінця файлу (як у CommonMark)
+        yield _code_span(fence, close_fence='', end_line=line_no - 1, end=offset)
+    if comment is not None:
+        yield _comment_span(comment, end_line=line_no - 1, end=offset)
+
+
+def _code_span(fence: dict, close_fence: str, end_line: int, end: int) -> Span:
+    body = ''.join(fence['body'])
+    return Span('code', fence['open_fence'] + body + close_fence,
+                fence['start_line'], end_line, fence['start'], end,
+                depth=fence['depth'], parent=fence['parent'],
+                lang=fence['lang'], meta=fence['meta'], body=body,
+                open_fence=fence['open_fence'], close_fence=close_fence)
+
+
+def _comment_span(comment: dict, end_line: int, end: int) -> Span:
+    text = ''.join(comment['lines'])
+    inner = text[text.index(COMMENT_OPEN) + len(COMMENT_OPEN):]
+    inner = inner[: inner.rfind(COMMENT_CLOSE)] if COMMENT_CLOSE in inner else inner
+    return Span('comment', text, comment['start_line'], end_line, comment['start'], end,
+                depth=comment['depth'], parent=comment['parent'], body=inner.strip())
+
+
+def tokenize_file(path: str, errors: str = 'strict') -> Iterator[Span]:
+    """
+    Токенізує файл, читаючи його рядками.
+    Для read-only інструментів (валідатори) можна передати errors='replace'.
+    """
+    with open(path, 'r', encoding='utf-8', errors=errors, newline='') as f:
+        yield from tokenize(f)
+
+
+def rewrite(source: str | Iterable[str], visit: Callable[[Span], str | None]) -> str:
+    """
+    Проганяє `visit` по всіх спанах і склеює результат.
+    `visit` повертає новий текст спану або None, щоб залишити його без змін.
+    """
+    out = []
+    for span in tokenize(source):
+        new_text = visit(span)
+        out.append(span.text if new_text is None else new_text)
+    return ''.join(out)
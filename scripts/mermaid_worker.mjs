@@ -0,0 +1,150 @@
+// mermaid_worker.mjs — довгоживучий воркер для валідації Mermaid-діаграм.
+//
+// Один процес Node + один headless Chromium на весь запуск: mermaid завантажується
+// у сторінку один раз, а блоки приходять рядками JSON через stdin.
+//
+// Протокол (по одному JSON-об'єкту на рядок):
+//   → stdout при старті:  {"ready": true, "version": "11.x.x"}
+//   ← stdin:              {"id": 1, "code": "graph TD\n  A --> B"}
+//   → stdout:             {"id": 1, "ok": false, "error": "Parse error on line 2: ...", "line": 2}
+//   ← stdin:              {"id": 2, "code": "...", "svg": true, "elementId": "mmd-3f2a9c1b7e04"}
+//   → stdout:             {"id": 2, "ok": true, "svg": "<svg ...>"}
+//   → stdout:             {"id": 3, "ok": false, "infra": true, "error": "worker: ...", "line": null}
+//
+// `infra: true` — блок не перевірено через збій воркера; це не помилка діаграми.
+//
+// `elementId` стає id кореня SVG, префіксом його <style> і маркерів. Статичні SVG
+// вбудовуються в сторінку через v-html, тож id мусить бути унікальним між діаграмами
+// (render_diagrams.py передає похідний від хешу вмісту); без нього — `mmd-<id>`.
+//
+// `node mermaid_worker.mjs --version` лише друкує {"version": "..."} без запуску браузера
+// (потрібно для ключів кешу валідації).
+//
+// Залежності: puppeteer (йде разом з @mermaid-js/mermaid-cli) та mermaid.
+// Шукаються в node_modules проєкту, потім у глобальному `npm root -g`.
+
+import { createRequire } from 'node:module'
+import { execSync } from 'node:child_process'
+import { readFileSync } from 'node:fs'
+import { createInterface } from 'node:readline'
+import path from 'node:path'
+import { fileURLToPath, pathToFileURL } from 'node:url'
+
+const ROOT = path.dirname(path.dirname(fileURLToPath(import.meta.url)))
+
+const send = (msg) => process.stdout.write(JSON.stringify(msg) + '\n')
+
+let globalBases = null
+
+const candidateBases = function* () {
+    yield path.join(ROOT, 'package.json')
+    if (globalBases === null) {
+        globalBases = []
+        try {
+            const globalRoot = execSync('npm root -g', { encoding: 'utf8' }).trim()
+            globalBases.push(path.join(globalRoot, '@mermaid-js', 'mermaid-cli', 'package.json'))
+            globalBases.push(path.join(globalRoot, 'package.json'))
+        } catch {
+            // npm недоступний — лишаються тільки локальні node_modules
+        }
+    }
+    yield* globalBases
+}
+
+const resolveFrom = (specifier) => {
+    for (const base of candidateBases()) {
+        try {
+            return createRequire(base).resolve(specifier)
+        } catch {
+            // пробуємо наступне місце
+        }
+    }
+    return null
+}
+
+// Виконується всередині сторінки
+const validate = async (elementId, code, withSvg) => {
+    try {
+        const { svg } = await window.mermaid.render(elementId, code)
+        return withSvg ? { ok: true, svg } : { ok: true }
+    } catch (e) {
+        const error = String((e && (e.str || e.message)) || e)
+        const m = error.match(/on line (\d+)/i)
+        const loc = e && e.hash && e.hash.loc
+        return { ok: false, error, line: m ? Number(m[1]) : loc ? loc.first_line : null }
+    } finally {
+        // mermaid лишає тимчасові вузли у DOM після помилок
+        document.querySelectorAll(`#${elementId}, #d${elementId}`).forEach((el) => el.remove())
+    }
+}
+
+// mermaid/dist/mermaid.min.js → mermaid/package.json
+const mermaidVersion = (mermaidPath) => {
+    const pkgPath = path.join(path.dirname(mermaidPath), '..', 'package.json')
+    return JSON.parse(readFileSync(pkgPath, 'utf8')).version
+}
+
+const main = async () => {
+    if (process.argv.includes('--version')) {
+        const mermaidPath = resolveFrom('mermaid/dist/mermaid.min.js')
+        send({ version: mermaidPath ? mermaidVersion(mermaidPath) : '' })
+        return
+    }
+
+    const puppeteerPath = resolveFrom('puppeteer')
+    const mermaidPath = resolveFrom('mermaid/dist/mermaid.min.js')
+    if (!puppeteerPath || !mermaidPath) {
+        send({
+            fatal: 'puppeteer або mermaid не знайдено. Встанови: npm i -g @mermaid-js/mermaid-cli',
+        })
+        process.exit(2)
+    }
+
+    const { default: puppeteer } = await import(pathToFileURL(puppeteerPath).href)
+    const browser = await puppeteer.launch({ headless: true, args: ['--no-sandbox'] })
+    const page = await browser.newPage()
+    await page.setContent('<!doctype html><html><body><div id="container"></div></body></html>')
+    await page.addScriptTag({ path: mermaidPath })
+    // Та сама конфігурація, що й у components/content/Mermaid.vue — SVG з pre-render
+    // (scripts/render_diagrams.py) мають виглядати як відрендерені в браузері
+    await page.evaluate(() => {
+        window.mermaid.initialize({
+            startOnLoad: false,
+            theme: 'dark',
+            securityLevel: 'loose',
+            fontFamily: 'inherit',
+        })
+    })
+    send({ ready: true, version: mermaidVersion(mermaidPath) })
+
+    // Блоки обробляються строго по черзі: одна сторінка, один render за раз
+    let queue = Promise.resolve()
+    const rl = createInterface({ input: process.stdin })
+
+    rl.on('line', (raw) => {
+        if (!raw.trim()) return
+        queue = queue.then(async () => {
+            let id = null
+            try {
+                const msg = JSON.parse(raw)
+                id = msg.id
+                const elementId = msg.elementId || `mmd-${id}`
+                const result = await page.evaluate(validate, elementId, msg.code, Boolean(msg.svg))
+                send({ id, ...result })
+            } catch (e) {
+                // Збій самого воркера (таймаут evaluate, падіння сторінки), а не діаграми
+                send({ id, ok: false, infra: true, error: `worker: ${(e && e.message) || e}`, line: null })
+            }
+        })
+    })
+
+    rl.on('close', async () => {
+        await queue
+        await browser.close()
+    })
+}
+
+main().catch((e) => {
+    send({ fatal: String((e && e.stack) || e) })
+    process.exit(2)
+})
@@ -0,0 +1,291 @@
+"""
+question_bank.py — банк питань тестів: JSON-lines на курс замість Python-літералів
+у скриптах-генераторах.
+
+  question-bank/<курс>.jsonl — один рядок на питання:
+    {"id": "q3f2a9c1b7e", "quiz": "07.tools/01.docker/06.container-lifecycle",
+     "tags": ["content/07.tools/01.docker/06.container-lifecycle.md"],
+     "hash": "…", "question": {"Question Text": …, "Question Type": …, …}}
+
+  - id стабільний: призначається при першому додаванні і не змінюється, коли
+    питання редагують. Запис оновлюється, а не дублюється, якщо передано його id
+    або якщо в тесті є питання з тим самим текстом, типом і варіантами (змінились
+    лише відповідь, час чи пояснення). Питання зі спільним текстом, але різними
+    варіантами — окремі записи;
+  - hash — SHA-256 канонічного вигляду питання: видно, що саме змінилось, і
+    однакові питання не додаються вдруге;
+  - quiz — шлях тесту (як у tests/ без .xlsx), tags — зв'язок з розділами content/
+    (за замовчуванням — розділ з тим самим шляхом або найближча папка content/).
+
+Курс — перша частина шляху тесту ("07.tools"). Файли пишуться атомарно,
+рядки — у порядку додавання (він же порядок питань у тесті).
+
+Використання:
+  bank = QuestionBank()
+  bank.add(question, quiz="05.python/02.encapsulation", tags=["content/05.python/..."])
+  questions = [r["question"] for r in bank.query(quiz="05.python/02.encapsulation")]
+  bank.save()
+"""
+
+import ast
+import hashlib
+import json
+import os
+
+from batch_runner import atomic_write
+from content_manifest import ROOT
+from quiz_questions import QUESTION_FIELDS, load_questions
+
+BANK_DIR = os.path.join(ROOT, "question-bank")
+
+
+def canonical_question(q: dict) -> dict:
+    """
+    Лише колонки шаблону, без порожніх значень. Самі значення не змінюються
+    (рядок "30" лишається рядком), щоб експорт збігався з тим, що дав автор.
+    """
+    result = {}
+    for field in QUESTION_FIELDS:
+        value = q.get(field)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        result[field] = value
+    return result
+
+
+def question_hash(q: dict) -> str:
+    """SHA-256 питання з точністю до пробілів по краях і типу часу ("30" == 30)."""
+    normalized = {}
+    for field, value in canonical_question(q).items():
+        value = str(value).strip()
+        if field == "Time in seconds" and value.isdigit():
+            value = int(value)
+        normalized[field] = value
+    payload = json.dumps(normalized, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Поля, які визначають «те саме питання» при редагуванні без id
+_IDENTITY_FIELDS = ("Question Text", "Question Type", "Option 1", "Option 2", "Option 3", "Option 4", "Option 5")
+
+
+def _identity(q: dict) -> tuple[str, ...]:
+    return tuple(str(q.get(field, "")).strip() for field in _IDENTITY_FIELDS)
+
+
+def course_of(quiz: str) -> str:
+    return quiz.strip("/").split("/")[0]
+
+
+def default_tags(quiz: str) -> list[str]:
+    """
+    Розділ content/ для тесту: файл з тим самим шляхом ("content/<quiz>.md"),
+    інакше — найближча папка content/ на шляху тесту ("content/12.html-css/").
+    """
+    chapter = f"content/{quiz}.md"
+    if os.path.isfile(os.path.join(ROOT, chapter)):
+        return [chapter]
+    parts = quiz.strip("/").split("/")
+    for depth in range(len(parts), 0, -1):
+        folder = "content/" + "/".join(parts[:depth]) + "/"
+        if os.path.isdir(os.path.join(ROOT, folder)):
+            return [folder]
+    return []
+
+
+def _tag_matches(wanted: str, tags: list[str]) -> bool:
+    """Тег-папка ("content/05.python/") охоплює всі розділи всередині неї."""
+    if wanted.endswith("/"):
+        return any(tag.startswith(wanted) for tag in tags)
+    return wanted in tags
+
+
+# Методи, якими скрипт міг змінити список після літерала
+_MUTATORS = {"append", "extend", "insert", "pop", "remove", "clear", "sort", "reverse"}
+
+
+def _changes_questions(node: ast.AST) -> bool:
+    """Чи змінює вузол змінну `questions` (присвоєння, зріз, мутуючий виклик, shuffle)."""
+    if isinstance(node, ast.Name) and node.id == "questions":
+        return isinstance(node.ctx, (ast.Store, ast.Del))
+    if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == "questions":
+        return isinstance(node.ctx, (ast.Store, ast.Del))
+    if isinstance(node, ast.Call):
+        func = node.func
+        if (
+            isinstance(func, ast.Attribute)
+            and func.attr in _MUTATORS
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "questions"
+        ):
+            return True
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+        return name == "shuffle" and any(isinstance(a, ast.Name) and a.id == "questions" for a in node.args)
+    return False
+
+
+def extract_questions(path: str) -> list[dict]:
+    """
+    Питання з JSON або зі скрипту-генератора: список-літерал `questions = [...]`
+    читається через ast, без виконання скрипту. ValueError, якщо скрипт потім
+    змінює список (`questions = questions[:70]`, shuffle тощо) — літерал тоді
+    не те, що потрапляє в тест.
+    """
+    if not path.endswith(".py"):
+        return load_questions(path)
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    literal = next(
+        (
+            node for node in tree.body
+            if isinstance(node, ast.Assign)
+            and any(isinstance(t, ast.Name) and t.id == "questions" for t in node.targets)
+            and isinstance(node.value, ast.List)
+        ),
+        None,
+    )
+    if literal is None:
+        raise ValueError(f"{path}: не знайдено `questions = [...]`")
+    for node in ast.walk(tree):
+        if node is literal or node in literal.targets:
+            continue
+        if _changes_questions(node):
+            raise ValueError(
+                f"{path}:{node.lineno}: скрипт змінює `questions` після літерала — "
+                "вибери потрібні питання і імпортуй їх з JSON"
+            )
+    return ast.literal_eval(literal.value)
+
+
+class QuestionBank:
+    def __init__(self, path: str = BANK_DIR):
+        self.path = path
+        self._records: dict[str, list[dict]] = {}
+        self._dirty: set[str] = set()
+
+    def _file(self, course: str) -> str:
+        return os.path.join(self.path, f"{course}.jsonl")
+
+    def courses(self) -> list[str]:
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            names = []
+        on_disk = {name[: -len(".jsonl")] for name in names if name.endswith(".jsonl")}
+        return sorted(on_disk | set(self._records))
+
+    def records(self, course: str) -> list[dict]:
+        """Записи курсу (ліниво читаються з диску один раз)."""
+        if course not in self._records:
+            records = []
+            try:
+                with open(self._file(course), "r", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            records.append(json.loads(line))
+            except FileNotFoundError:
+                pass
+            self._records[course] = records
+        return self._records[course]
+
+    def _new_id(self, course: str, quiz: str, text: str) -> str:
+        taken = {r["id"] for r in self.records(course)}
+        seed = f"{quiz}\0{text}"
+        while True:
+            qid = "q" + hashlib.sha256(seed.encode("utf-8")).hexdigest()[:10]
+            if qid not in taken:
+                return qid
+            seed += "\0"
+
+    def add(
+        self, question: dict, quiz: str, tags: list[str] | None = None, qid: str | None = None
+    ) -> tuple[dict, str]:
+        """
+        Додає питання до тесту `quiz`. Повертає (запис, статус): "added",
+        "updated" (id зберігається) або "unchanged".
+
+        Наявний запис шукається за хешем вмісту, а за його відсутності — за текстом
+        разом з типом і варіантами (виправлена відповідь, час чи пояснення).
+        `qid` — явно замінити запис з цим id будь-яким новим вмістом;
+        ValueError, якщо такого запису в курсі немає.
+        """
+        course = course_of(quiz)
+        question = canonical_question(question)
+        digest = question_hash(question)
+        records = self.records(course)
+
+        if qid is not None:
+            record = next((r for r in records if r["id"] == qid), None)
+            if record is None:
+                raise ValueError(f"Питання {qid} немає в курсі {course}")
+        else:
+            in_quiz = [r for r in records if r["quiz"] == quiz]
+            identity = _identity(question)
+            record = next((r for r in in_quiz if r["hash"] == digest), None) or next(
+                (r for r in in_quiz if _identity(r["question"]) == identity), None
+            )
+
+        if record is not None:
+            if record["question"] == question and record["quiz"] == quiz and (tags is None or record["tags"] == tags):
+                return record, "unchanged"
+            record.update(quiz=quiz, hash=digest, question=question)
+            if tags is not None:
+                record["tags"] = tags
+            self._dirty.add(course)
+            return record, "updated"
+
+        text = str(question.get("Question Text", "")).strip()
+        record = {
+            "id": self._new_id(course, quiz, text),
+            "quiz": quiz,
+            "tags": default_tags(quiz) if tags is None else tags,
+            "hash": digest,
+            "question": question,
+        }
+        records.append(record)
+        self._dirty.add(course)
+        return record, "added"
+
+    def get(self, qid: str) -> dict | None:
+        for course in self.courses():
+            for record in self.records(course):
+                if record["id"] == qid:
+                    return record
+        return None
+
+    def query(
+        self,
+        course: str | None = None,
+        quiz: str | None = None,
+        tags: list[str] | None = None,
+        ids: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        Записи за фільтрами (усі — через AND). `quiz` — точний шлях тесту або
+        префікс папки ("07.tools/01.docker/"); `tags` — запис має мати хоча б один
+        (тег з / в кінці — будь-який розділ у цій папці).
+        З `ids` записи повертаються в порядку `ids`.
+        """
+        if course is None and quiz is not None:
+            course = course_of(quiz)
+        courses = [course] if course else self.courses()
+        selected = []
+        for name in courses:
+            for record in self.records(name):
+                if quiz and not (record["quiz"] == quiz or (quiz.endswith("/") and record["quiz"].startswith(quiz))):
+                    continue
+                if tags and not any(_tag_matches(tag, record["tags"]) for tag in tags):
+                    continue
+                selected.append(record)
+        if ids:
+            by_id = {r["id"]: r for r in selected}
+            selected = [by_id[qid] for qid in ids if qid in by_id]
+        return selected
+
+    def save(self) -> None:
+        """Атомарно переписує змінені файли курсів."""
+        os.makedirs(self.path, exist_ok=True)
+        for course in sorted(self._dirty):
+            lines = [json.dumps(r, ensure_ascii=False) for r in self._records[course]]
+            atomic_write(self._file(course), "\n".join(lines) + "\n")
+        self._dirty.clear()
@@ -0,0 +1,227 @@
+"""
+quiz_questions.py — спільна обробка JSON з питаннями тестів (формат шаблону Wayground:
+"Question Text", "Question Type", "Option 1".."Option 5", "Correct Answer",
+"Time in seconds", "Image Link", "Answer explanation").
+
+  - `load_questions`      — читає JSON (масив або {"questions": [...]});
+  - `process_code_blocks` — блоки коду з тексту питань → PNG (silicon) → Image Link;
+  - `normalize_question`  — виправляє неточності AI-генерації (відповіді, Fill-in-the-Blank);
+  - `to_extracted`        — питання у формат `extracted`, який `wayground_import.build_question`
+                            перетворює на payload POST /questions. Тобто JSON імпортується
+                            напряму, без xlsx, S3 і серверного парсингу upload-quiz.
+
+Використання:
+  questions = load_questions("tests/02.api.json")
+  process_code_blocks(questions, jobs=4, catbox_hash=userhash)
+  extracted = [to_extracted(normalize_question(q)) for q in questions]
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from code_images import render_code_image
+from upload_index import UploadIndex, upload_with_index
+from uploader import upload_many, upload_to_catbox, upload_to_litterbox
+
+CODE_BLOCK_RE = re.compile(r'```(\w*)\n([\s\S]*?)\n```')
+
+# Колонки шаблону Wayground (і порядок колонок у xlsx)
+QUESTION_FIELDS = [
+    "Question Text", "Question Type", "Option 1", "Option 2",
+    "Option 3", "Option 4", "Option 5", "Correct Answer",
+    "Time in seconds", "Image Link", "Answer explanation"
+]
+
+# "Question Type" шаблону → questionType у форматі extracted
+QUESTION_KINDS = {
+    "Multiple Choice": "MCQ",
+    "Checkbox": "MSQ",
+    "Fill-in-the-Blank": "BLANK",
+    "Open-Ended": "OPEN",
+}
+DEFAULT_TIME = 30
+
+
+def load_questions(json_path: str) -> list[dict]:
+    """Масив питань з JSON; словник на кшталт {"questions": [...]} розгортається. ValueError, якщо масиву немає."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    # Якщо JSON це просто словник з одним полем (наприклад {"questions": [...]})
+    if isinstance(data, dict):
+        for key in data.keys():
+            if isinstance(data[key], list):
+                data = data[key]
+                break
+
+    if not isinstance(data, list):
+        raise ValueError(f"{json_path} не містить масиву питань.")
+    return data
+
+
+def _render_job(job):
+    """Рендер одного блоку коду у воркері пулу. Повертає (шлях до PNG | None, помилка)."""
+    code_content, lang_mapped = job
+    try:
+        return render_code_image(code_content, lang_mapped), None
+    except Exception as e:
+        return None, e
+
+
+def process_code_blocks(data, jobs=None, catbox_hash=""):
+    """
+    Рендерить блоки коду з "Question Text" у PNG, завантажує їх і записує посилання
+    в "Image Link" (сам блок з тексту прибирається). Змінює питання на місці.
+    Повертає кількість питань, які отримали зображення коду.
+    """
+    if catbox_hash:
+        print("🔑 Catbox.moe — зображення питань завантажуються постійно")
+    else:
+        print("⚠️  CATBOX_USERHASH не знайдено — litterbox.catbox.moe (72h TTL)")
+
+    # 1. Збираємо всі блоки коду набору питань
+    found = []
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+
+        q_text = item.get("Question Text", "")
+        if not q_text:
+            continue
+
+        match = CODE_BLOCK_RE.search(q_text)
+        if match:
+            lang = match.group(1)
+            code_content = match.group(2)
+
+            lang_mapped = lang.lower() if lang else ""
+            if lang_mapped in ("csharp", "c#"):
+                lang_mapped = "cs"
+
+            print(f"🔍 Знайдено блок коду ({lang if lang else 'plain'}) в питанні: '{q_text[:30]}...'")
+            found.append((item, (code_content, lang_mapped)))
+
+    if not found:
+        return 0
+
+    # 2. Рендеримо всі унікальні блоки разом у пулі (silicon — окремий процес, тож потоків достатньо)
+    unique_jobs = list(dict.fromkeys(job for _, job in found))
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(unique_jobs)))
+    print(f"🎨 Рендеринг {len(unique_jobs)} зображень коду за допомогою silicon ({workers} потоків)...")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        rendered = dict(zip(unique_jobs, executor.map(_render_job, unique_jobs)))
+
+    # 3. Завантажуємо зображення паралельно (uploader.py) і оновлюємо питання.
+    # Спершу catbox.moe (постійне зберігання), fallback — litterbox (72h).
+    # Уже завантажені PNG беруться з індексу (upload_index.py) без повторного upload.
+    uploaders = []
+    if catbox_hash:
+        uploaders.append(("catbox", lambda path: upload_to_catbox(path, catbox_hash)))
+    uploaders.append(("litterbox", upload_to_litterbox))
+
+    images = list(dict.fromkeys(path for path, error in rendered.values() if error is None))
+    print(f"🚀 Завантаження {len(images)} зображень...")
+    with UploadIndex() as index:
+        uploaded = dict(zip(images, upload_many(images, lambda path: upload_with_index(path, uploaders, index))))
+
+    attached = 0
+    for item, job in found:
+        img_path, error = rendered[job]
+        if error is not None:
+            print(f"⚠️ Не вдалося обробити блок коду: {error}")
+            continue
+
+        image_url, host = uploaded[img_path]
+        if image_url:
+            print(f"🔗 Зображення ({host}): {image_url}")
+            item["Image Link"] = image_url
+            item["Question Text"] = CODE_BLOCK_RE.sub("", item["Question Text"]).strip()
+            attached += 1
+        else:
+            print("⚠️ Не вдалося завантажити зображення — посилання залишається порожнім")
+    return attached
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def normalize_question(q: dict) -> dict:
+    """
+    Нормалізація даних, якщо AI згенерував їх неточно (ті самі правила, що й при
+    експорті в xlsx): номери правильних відповідей без зайвого тексту, а для
+    Fill-in-the-Blank — відповідь у Option 1 і порожні решта варіантів.
+    Повертає нову копію питання.
+    """
+    q = dict(q)
+    q_type = _text(q.get("Question Type"))
+    ans = _text(q.get("Correct Answer"))
+
+    if q_type == "Multiple Choice":
+        m = re.search(r'\d+', ans)
+        if m:
+            q["Correct Answer"] = m.group(0)
+    elif q_type == "Checkbox":
+        m = re.findall(r'\d+', ans)
+        if m:
+            q["Correct Answer"] = ",".join(m)
+    elif q_type.lower() == "fill-in-the-blank":
+        q["Question Type"] = "Fill-in-the-Blank"
+        if ans and not _text(q.get("Option 1")):
+            q["Option 1"] = ans
+        q["Correct Answer"] = ""
+        for opt in ("Option 2", "Option 3", "Option 4", "Option 5"):
+            q[opt] = ""
+    return q
+
+
+def to_extracted(q: dict) -> dict:
+    """
+    Нормалізоване питання → extracted (поля як у відповіді upload-quiz):
+    text, questionType, option1-5, correct (0-based int / list для MSQ), time, explain, url?, mediaType?
+    ValueError для питань без тексту, без правильної відповіді (або з номером
+    порожнього варіанта) і типів, які напряму не імпортуються (для них лишається
+    шлях через xlsx).
+    """
+    q_type = _text(q.get("Question Type")) or "Multiple Choice"
+    kind = QUESTION_KINDS.get(q_type)
+    if kind is None:
+        raise ValueError(f"Тип питання '{q_type}' не підтримується прямим імпортом")
+
+    text = _text(q.get("Question Text"))
+    if not text and not _text(q.get("Image Link")):
+        raise ValueError("немає Question Text")
+
+    extracted = {"text": text, "questionType": kind}
+    for i in range(1, 6):
+        option = _text(q.get(f"Option {i}"))
+        if option:
+            extracted[f"option{i}"] = option
+
+    if kind in ("MCQ", "MSQ"):
+        # Без правильної відповіді питання не імпортуємо: інакше в тест піде вгадана
+        numbers = [int(n) - 1 for n in re.findall(r'\d+', _text(q.get("Correct Answer")))]
+        if not numbers:
+            raise ValueError("немає Correct Answer")
+        for n in numbers:
+            if f"option{n + 1}" not in extracted:
+                raise ValueError(f"Correct Answer {n + 1} вказує на порожній варіант")
+        extracted["correct"] = numbers if kind == "MSQ" else numbers[0]
+    elif kind == "BLANK":
+        # Єдиний варіант — сама відповідь (див. normalize_question)
+        extracted["correct"] = 0
+
+    time_raw = _text(q.get("Time in seconds"))
+    extracted["time"] = int(float(time_raw)) if time_raw else DEFAULT_TIME
+
+    explain = _text(q.get("Answer explanation"))
+    if explain:
+        extracted["explain"] = explain
+
+    image_link = _text(q.get("Image Link"))
+    if image_link.startswith("http"):
+        extracted["url"] = image_link
+        extracted["mediaType"] = "image"
+    return extracted
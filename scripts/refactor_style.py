@@ -3,12 +3,27 @@ Refactors C++ code blocks in markdown files to match 02.code-style.md:
   - adds `using namespace std;` after #include block
   - removes `std::` prefix from cout, cin, string, vector, etc.
 Only modifies content inside ```cpp ... ``` fences.
+
+The whole REPLACEMENTS table is compiled once into a single regex alternation
+(longest key first), so each block is rewritten in one linear pass. String/char
+literals and comments are left untouched unless --include-literals is given.
+
+Usage:
+  python3 scripts/refactor_style.py                       # all of content/02.cpp
+  python3 scripts/refactor_style.py 'content/02.cpp/4*.md' --dry-run
 """
 
+import argparse
+import functools
+import os
 import re
 import sys
 
-# Ordered replacements (longest/most-specific first to avoid partial matches)
+from batch_runner import ROOT, add_arguments, run
+from mdc_tokenizer import rewrite
+
+# std:: → unqualified replacements. Order doesn't matter: the table is compiled
+# into one alternation that always prefers the longest key at a given position.
 REPLACEMENTS = [
     # Static member references — must stay as Type::member
     ('std::string::npos',       'string::npos'),
@@ -124,6 +139,51 @@ REPLACEMENTS = [
 ]
 
 
+STD_NAMES = dict(REPLACEMENTS)
+
+# One alternation for the whole table, with the shared `std::` prefix factored
+# out. Python's regex engine tries branches left to right, so sorting by length
+# gives longest-match semantics (string_view::npos > string_view > string).
+STD_NAME_PATTERN = 'std::(?:' + '|'.join(
+    re.escape(old[len('std::'):]) for old in sorted(STD_NAMES, key=len, reverse=True)
+) + ')'
+
+# Tokens that must be copied verbatim when skipping literals: comments,
+# raw strings, string and char literals (with optional u8/u/U/L prefixes), and
+# numbers with C++14 digit separators, whose ' would otherwise open a char literal.
+LITERAL_PATTERN = r"""
+    (?<!\w)\d\w*(?:'\w+)+
+  | //[^\n]*
+  | /\*.*?\*/
+  | (?:u8|u|U|L)?R"(?P<delim>[^()\\\s]{0,16})\(.*?\)(?P=delim)"
+  | (?:u8|u|U|L)?"(?:\\.|[^"\\\n])*"
+  | (?:u8|u|U|L)?'(?:\\.|[^'\\\n])*'
+"""
+
+STD_NAME_RE = re.compile(STD_NAME_PATTERN)
+# The lookahead rejects most positions on the first character, before any
+# branch of the alternation is tried.
+STD_NAME_OR_LITERAL_RE = re.compile(
+    rf'''(?=[/"'uULRs0-9])(?:(?P<literal>{LITERAL_PATTERN})|(?P<name>{STD_NAME_PATTERN}))''',
+    re.DOTALL | re.VERBOSE,
+)
+
+
+def _replace_std_name(m: re.Match) -> str:
+    name = m.group('name') if m.re is STD_NAME_OR_LITERAL_RE else m.group(0)
+    if name is None:
+        return m.group(0)  # literal or comment → copy as is
+    return STD_NAMES[name]
+
+
+def strip_std(code: str, skip_literals: bool = True) -> str:
+    """Replace every std:: name from REPLACEMENTS in a single pass over `code`."""
+    if 'std::' not in code:
+        return code
+    regex = STD_NAME_OR_LITERAL_RE if skip_literals else STD_NAME_RE
+    return regex.sub(_replace_std_name, code)
+
+
 def insert_using_namespace(code: str) -> str:
     """Insert `using namespace std;` after the #include block."""
     lines = code.split('\n')
@@ -151,7 +211,7 @@ def insert_using_namespace(code: str) -> str:
     return '\n'.join(new_lines)
 
 
-def transform_block(code: str) -> str:
+def transform_block(code: str, skip_literals: bool = True) -> str:
     """Apply all style transformations to a single cpp block."""
     has_includes = '#include' in code
 
@@ -161,49 +221,44 @@ def transform_block(code: str) -> str:
 
     # Apply all std:: → unqualified replacements to ALL blocks
     # (snippets without includes also use unqualified style consistently)
-    for old, new in REPLACEMENTS:
-        code = code.replace(old, new)
-
-    return code
-
+    return strip_std(code, skip_literals)
 
-def process_file(path: str) -> None:
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
 
-    def replace_block(m):
-        header = m.group(1)   # ```cpp [File.cpp] showLineNumbers\n
-        body   = m.group(2)   # code content
-        footer = m.group(3)   # ```
-        return header + transform_block(body) + footer
+def transform_span(span, skip_literals: bool = True):
+    """Visitor for mdc_tokenizer.rewrite: restyles ```cpp blocks only."""
+    if span.kind == 'code' and span.lang == 'cpp':
+        return span.replace_body(transform_block(span.body, skip_literals))
+    return None
 
-    result = re.sub(
-        r'(```cpp[^\n]*\n)(.*?)(```)',
-        replace_block,
-        content,
-        flags=re.DOTALL,
-    )
 
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(result)
+def refactor_style(content: str, skip_literals: bool = True) -> str:
+    return rewrite(content, functools.partial(transform_span, skip_literals=skip_literals))
 
-    changed = content != result
-    print(f"{'CHANGED' if changed else 'no change':10s}  {path}")
 
+def main() -> None:
+    default_patterns = ['content/02.cpp/*.md']
+    parser = argparse.ArgumentParser(description='Refactor ```cpp blocks to match 02.code-style.md.')
+    add_arguments(parser, default_patterns)
+    parser.add_argument(
+        '--include-literals', action='store_true',
+        help='Also strip std:: inside string literals and comments',
+    )
+    args = parser.parse_args()
+
+    skip_literals = not args.include_literals
+    errors = run(
+        'refactor_style',
+        functools.partial(refactor_style, skip_literals=skip_literals),
+        args.paths or [os.path.join(ROOT, p) for p in default_patterns],
+        jobs=args.jobs,
+        force=args.force,
+        dry_run=args.dry_run,
+        changed=args.changed,
+        # The result depends on the literal mode, so each mode keeps its own skip state
+        version='2-skip-literals' if skip_literals else '2-all',
+    )
+    sys.exit(1 if errors else 0)
 
-FILES = [
-    'content/02.cpp/37.ascii-characters.md',
-    'content/02.cpp/38.unicode-utf.md',
-    'content/02.cpp/39.c-strings.md',
-    'content/02.cpp/40.std-string-intro.md',
-    'content/02.cpp/41.std-string-capacity-access.md',
-    'content/02.cpp/42.std-string-modification.md',
-    'content/02.cpp/43.std-string-search.md',
-]
 
 if __name__ == '__main__':
-    import os
-    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    for rel in FILES:
-        process_file(os.path.join(base, rel))
-    print('\nDone.')
+    main()
@@ -0,0 +1,190 @@
+"""
+Pre-render Mermaid і PlantUML діаграм у статичні SVG для сайту.
+
+Кожна діаграма з content/ рендериться один раз у public/diagrams/<hash>.svg, де
+hash = sha256("<kind>\\0<нормалізоване джерело>") — той самий, що рахує
+composables/useStaticDiagram.ts. Mermaid.vue і PlantUml.vue спершу шукають цей
+файл і лише за його відсутності рендерять діаграму в браузері.
+
+Уже наявні SVG не перерендерюються (ім'я файлу = хеш вмісту), тож повторний запуск
+рендерить тільки нові або змінені діаграми. public/diagrams/manifest.json
+зберігає для кожного хешу тип діаграми та місця, де вона зустрічається.
+
+Використання:
+  python3 scripts/render_diagrams.py                       # весь content/
+  python3 scripts/render_diagrams.py content/04.java --jobs 4
+  python3 scripts/render_diagrams.py --prune               # + видалити SVG, на які вже ніщо не посилається
+  python3 scripts/render_diagrams.py --force               # перерендерити все
+  python3 scripts/render_diagrams.py --changed             # лише файли, змінені в git
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from batch_runner import ROOT, add_changed_argument, atomic_write, select_files
+from diagram_cache import normalize_source
+from mdc_tokenizer import LineIndex, tokenize
+from validate_mermaid import validate_blocks
+from validate_plantuml import extract_plantuml, render_plantuml_batch
+
+OUTPUT_DIR = os.path.join(ROOT, "public", "diagrams")
+MANIFEST_NAME = "manifest.json"
+
+
+def diagram_hash(kind: str, source: str) -> str:
+    payload = f"{kind}\0{normalize_source(source)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def collect_diagrams(files: list[str]) -> dict[str, dict]:
+    """
+    Збирає всі діаграми з файлів (кожен файл читається один раз).
+    Повертає {hash: {'kind', 'source', 'sources': [{'file', 'line'}]}}.
+    """
+    diagrams: dict[str, dict] = {}
+
+    def add(kind: str, source: str, file_path: str, line: int) -> None:
+        key = diagram_hash(kind, source)
+        entry = diagrams.setdefault(key, {"kind": kind, "source": normalize_source(source), "sources": []})
+        entry["sources"].append({"file": os.path.relpath(file_path, ROOT), "line": line})
+
+    for file_path in files:
+        with open(file_path, "r", encoding="utf-8", errors="replace", newline="") as f:
+            content = f.read()
+        for span in tokenize(content):
+            if span.kind == "code" and span.lang == "mermaid":
+                add("mermaid", span.body, file_path, span.start_line)
+        for block in extract_plantuml(content, LineIndex(content)):
+            add("plantuml", block["content"], file_path, block["start_line"])
+    return diagrams
+
+
+def render_missing(diagrams: dict[str, dict], todo: list[str], jobs: int) -> dict[str, str]:
+    """Рендерить діаграми з `todo`; повертає {hash: помилка} для тих, що не вдалися."""
+    failures: dict[str, str] = {}
+
+    mermaid_keys = [key for key in todo if diagrams[key]["kind"] == "mermaid"]
+    if mermaid_keys:
+        print(f"[~] Mermaid: {len(mermaid_keys)} діаграм, воркерів: {jobs}")
+        # id SVG з хешу вмісту: дві діаграми на одній сторінці не ділять стилі й маркери
+        blocks = [
+            {"key": key, "content": diagrams[key]["source"], "start_line": 0, "element_id": f"mmd-{key[:12]}"}
+            for key in mermaid_keys
+        ]
+        try:
+            validate_blocks(blocks, jobs, render=True)
+        except RuntimeError as e:
+            print(f"[X] mermaid worker: {e}")
+        for block in blocks:
+            if block.get("valid") and block.get("svg"):
+                atomic_write(os.path.join(OUTPUT_DIR, f"{block['key']}.svg"), block["svg"])
+            else:
+                failures[block["key"]] = block.get("error") or "не відрендерено"
+
+    plantuml_keys = [key for key in todo if diagrams[key]["kind"] == "plantuml"]
+    if plantuml_keys:
+        print(f"[~] PlantUML: {len(plantuml_keys)} діаграм одним запуском")
+        try:
+            svgs = render_plantuml_batch([diagrams[key]["source"] for key in plantuml_keys])
+        except OSError as e:
+            print(f"[X] plantuml: {e}")
+            svgs = {}
+        for i, key in enumerate(plantuml_keys):
+            if i in svgs:
+                atomic_write(os.path.join(OUTPUT_DIR, f"{key}.svg"), svgs[i])
+            else:
+                failures[key] = "помилка синтаксису або PlantUML недоступний"
+
+    return failures
+
+
+def merge_manifest(diagrams: dict[str, dict], files: list[str]) -> dict[str, dict]:
+    """
+    Поєднує діаграми поточного запуску з наявним manifest.json: записи з файлів,
+    які цього разу не оброблялись, лишаються як є, тож запуск по одній папці
+    не стирає решту маніфесту.
+    """
+    processed = {os.path.relpath(f, ROOT) for f in files}
+    merged: dict[str, dict] = {}
+    try:
+        with open(os.path.join(OUTPUT_DIR, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            previous = json.load(f).get("diagrams", {})
+    except (OSError, ValueError):
+        previous = {}
+    for key, entry in previous.items():
+        sources = [s for s in entry.get("sources", []) if s.get("file") not in processed]
+        if sources:
+            merged[key] = {"kind": entry.get("kind", ""), "sources": sources}
+    for key, entry in diagrams.items():
+        merged.setdefault(key, {"kind": entry["kind"], "sources": []})["sources"].extend(entry["sources"])
+    return merged
+
+
+def write_manifest(entries: dict[str, dict]) -> None:
+    manifest = {
+        "version": 1,
+        "diagrams": {
+            key: {"kind": entry["kind"], "sources": entry["sources"]}
+            for key, entry in sorted(entries.items())
+            if os.path.exists(os.path.join(OUTPUT_DIR, f"{key}.svg"))
+        },
+    }
+    atomic_write(os.path.join(OUTPUT_DIR, MANIFEST_NAME),
+                 json.dumps(manifest, ensure_ascii=False, indent=2) + "\n")
+
+
+def prune(entries: dict[str, dict]) -> int:
+    """Видаляє SVG, на які не посилається жоден запис маніфесту."""
+    removed = 0
+    for name in os.listdir(OUTPUT_DIR):
+        if name.endswith(".svg") and name[:-4] not in entries:
+            os.remove(os.path.join(OUTPUT_DIR, name))
+            removed += 1
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render Mermaid і PlantUML діаграм у public/diagrams/*.svg.")
+    parser.add_argument("paths", nargs="*", default=["content/**/*.md"],
+                        help="Файли, папки або glob-и (за замовчуванням: content/**/*.md)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Кількість паралельних mermaid-воркерів (кожен — окремий Chromium)")
+    parser.add_argument("--force", action="store_true", help="Перерендерити навіть наявні SVG")
+    parser.add_argument("--prune", action="store_true",
+                        help="Видалити SVG, на які не посилається маніфест")
+    add_changed_argument(parser)
+    args = parser.parse_args()
+
+    files = select_files(args.paths, args.changed)
+    if not files and args.changed is not None:
+        print("[✓] Змінених файлів немає")
+        return
+    if not files:
+        print(f"File not found: {' '.join(args.paths)}")
+        sys.exit(1)
+
+    diagrams = collect_diagrams(files)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    todo = [key for key in diagrams
+            if args.force or not os.path.exists(os.path.join(OUTPUT_DIR, f"{key}.svg"))]
+    print(f"[~] Діаграм: {len(diagrams)} у {len(files)} файлах, до рендеру: {len(todo)}")
+
+    failures = render_missing(diagrams, todo, args.jobs) if todo else {}
+    entries = merge_manifest(diagrams, files)
+    if args.prune:
+        print(f"[~] Видалено застарілих SVG: {prune(entries)}")
+    write_manifest(entries)
+
+    for key, error in failures.items():
+        source = diagrams[key]["sources"][0]
+        print(f"[X] {source['file']}:{source['line']} ({diagrams[key]['kind']}): {error.strip()}")
+    print(f"[✓] Відрендерено: {len(todo) - len(failures)}, помилок: {len(failures)}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
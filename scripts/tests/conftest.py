@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Модулі scripts/ імпортуються напряму, як це роблять самі скрипти; корінь — для wayground_exporter
+SCRIPTS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(SCRIPTS))
+sys.path.insert(0, SCRIPTS)
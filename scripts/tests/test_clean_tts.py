@@ -0,0 +1,42 @@
+"""clean_tts: у текст для озвучки потрапляє лише проза — без компонентів, коду і зайвих `::`."""
+
+from clean_tts import clean_for_tts, iter_chunks
+
+
+def write(tmp_path, text):
+    path = tmp_path / "chapter.md"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_components_and_code_dropped(tmp_path):
+    path = write(tmp_path, """# Заголовок
+
+Текст з **жирним** і [посиланням](https://example.com).
+
+::callout{type="info"}
+#title
+Порада
+::
+
+```cpp
+int main() {}
+```
+""")
+    assert clean_for_tts(path) == "Заголовок\n\nТекст з жирним і посиланням.\n\nПорада"
+
+
+def test_unbalanced_closer_dropped(tmp_path):
+    path = write(tmp_path, """Перший абзац.
+
+::
+:::
+
+Другий абзац.
+""")
+    assert clean_for_tts(path) == "Перший абзац.\n\nДругий абзац."
+
+
+def test_sections_split_into_chunks(tmp_path):
+    path = write(tmp_path, "## Перший\n\nТекст.\n\n## Другий\n\nЩе текст.\n")
+    assert list(iter_chunks(path)) == ["Перший\n\nТекст.", "Другий\n\nЩе текст."]
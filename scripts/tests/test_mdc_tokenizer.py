@@ -0,0 +1,102 @@
+"""mdc_tokenizer: склеювання спанів дає вихідний текст, rewrite міняє лише те, що повернув visitor."""
+
+import pytest
+
+from mdc_tokenizer import LineIndex, rewrite, tokenize
+
+SAMPLE = """# Заголовок
+
+Текст з `inline` кодом.
+
+::code-group
+```cpp [main.cpp] showLineNumbers
+#include <iostream>
+int main() {}
+```
+#second
+~~~mermaid
+graph TD
+  A --> B
+~~~
+::
+
+<!-- IMAGE: схема
+   у два рядки -->
+::callout{type="info"}
+:::nested
+Вкладений
+:::
+::
+"""
+
+CASES = [
+    SAMPLE,
+    SAMPLE.replace("\n", "\r\n"),
+    "",
+    "без переводу рядка в кінці",
+    "```python\nнезакритий блок\n",
+    "<!-- незакритий коментар\nрядок\n",
+    "::a\n::b\n::\n",  # компонент, не закритий до EOF
+]
+
+
+@pytest.mark.parametrize("source", CASES)
+def test_spans_concatenate_to_source(source):
+    spans = list(tokenize(source))
+    assert "".join(s.text for s in spans) == source
+    # Зміщення суцільні й відповідають тексту
+    pos = 0
+    for span in spans:
+        assert span.start == pos
+        assert source[span.start:span.end] == span.text
+        pos = span.end
+    assert pos == len(source)
+
+
+@pytest.mark.parametrize("source", CASES)
+def test_rewrite_identity(source):
+    assert rewrite(source, lambda span: None) == source
+
+
+def test_tokenize_lines_of_text_input():
+    lines = SAMPLE.splitlines(keepends=True)
+    assert [s.text for s in tokenize(lines)] == [s.text for s in tokenize(SAMPLE)]
+
+
+def test_code_span_fields():
+    code = [s for s in tokenize(SAMPLE) if s.kind == "code"]
+    assert [(s.lang, s.start_line, s.end_line) for s in code] == [("cpp", 6, 9), ("mermaid", 11, 14)]
+    cpp = code[0]
+    assert cpp.meta == "[main.cpp] showLineNumbers"
+    assert cpp.body == "#include <iostream>\nint main() {}\n"
+    assert cpp.parent == "code-group"
+    assert cpp.replace_body(cpp.body) == cpp.text
+
+
+def test_components_and_comments():
+    spans = list(tokenize(SAMPLE))
+    opens = [(s.name, s.depth) for s in spans if s.kind == "component_open"]
+    assert opens == [("code-group", 0), ("callout", 0), ("nested", 1)]
+    closes = [(s.name, s.depth) for s in spans if s.kind == "component_close"]
+    assert closes == [("code-group", 0), ("nested", 1), ("callout", 0)]
+    assert [s.name for s in spans if s.kind == "slot"] == ["second"]
+    comment = next(s for s in spans if s.kind == "comment")
+    assert (comment.start_line, comment.end_line) == (17, 18)
+
+
+def test_rewrite_replaces_only_visited_spans():
+    def upper_mermaid(span):
+        if span.kind == "code" and span.lang == "mermaid":
+            return span.replace_body(span.body.upper())
+        return None
+
+    result = rewrite(SAMPLE, upper_mermaid)
+    assert "GRAPH TD\n  A --> B\n" in result
+    assert result.replace("GRAPH TD\n  A --> B\n", "graph TD\n  A --> B\n") == SAMPLE
+
+
+def test_line_index():
+    text = "a\nbb\n\nccc"
+    index = LineIndex(text)
+    assert [index.line_of(i) for i in range(len(text))] == [1, 1, 2, 2, 2, 3, 4, 4, 4]
+    assert [index.line_start(n) for n in (1, 2, 3, 4)] == [0, 2, 5, 6]
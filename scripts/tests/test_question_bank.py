@@ -0,0 +1,128 @@
+"""question_bank: статуси add, стабільні id, збереження, фільтри і читання генераторів."""
+
+import json
+
+import pytest
+
+from question_bank import QuestionBank, default_tags, extract_questions, question_hash
+
+QUIZ = "05.python/02.encapsulation"
+QUESTION = {
+    "Question Text": "Що таке інкапсуляція?",
+    "Question Type": "Multiple Choice",
+    "Option 1": "a",
+    "Option 2": "b",
+    "Correct Answer": "2",
+    "Time in seconds": "30",
+    "Image Link": "",
+}
+
+
+@pytest.fixture
+def bank(tmp_path):
+    return QuestionBank(str(tmp_path))
+
+
+def test_add_statuses(bank):
+    record, status = bank.add(QUESTION, QUIZ, ["content/05.python/02.encapsulation.md"])
+    assert status == "added"
+    qid = record["id"]
+
+    assert bank.add(dict(QUESTION), QUIZ)[1] == "unchanged"
+
+    # Той самий текст і варіанти, інша відповідь — оновлення зі збереженням id
+    edited = dict(QUESTION, **{"Correct Answer": "1"})
+    record, status = bank.add(edited, QUIZ)
+    assert (status, record["id"]) == ("updated", qid)
+    assert record["question"]["Correct Answer"] == "1"
+    assert record["tags"] == ["content/05.python/02.encapsulation.md"]
+
+    # Нові теги теж оновлюють запис
+    assert bank.add(edited, QUIZ, ["content/05.python/"])[1] == "updated"
+
+    # Інший тест — окремий запис
+    other, status = bank.add(QUESTION, "05.python/03.inheritance-mro")
+    assert status == "added" and other["id"] != qid
+    assert len(bank.records("05.python")) == 2
+
+
+def test_shared_stem_is_not_overwritten(bank):
+    first, _ = bank.add(QUESTION, QUIZ)
+    second, status = bank.add(dict(QUESTION, **{"Option 1": "c", "Option 2": "d"}), QUIZ)
+    assert status == "added" and second["id"] != first["id"]
+    assert first["question"]["Option 1"] == "a"
+    assert len(bank.records("05.python")) == 2
+
+
+def test_add_by_id(bank):
+    record, _ = bank.add(QUESTION, QUIZ)
+    rewritten = dict(QUESTION, **{"Question Text": "Що таке інкапсуляція в Python?", "Option 1": "c"})
+    updated, status = bank.add(rewritten, QUIZ, qid=record["id"])
+    assert (status, updated["id"]) == ("updated", record["id"])
+    assert len(bank.records("05.python")) == 1
+    with pytest.raises(ValueError):
+        bank.add(QUESTION, QUIZ, qid="q0000000000")
+
+
+def test_values_kept_as_written(bank):
+    record, _ = bank.add(QUESTION, QUIZ)
+    assert record["question"]["Time in seconds"] == "30"
+    assert "Image Link" not in record["question"]
+    # Хеш не залежить від типу часу й пробілів по краях
+    assert question_hash(dict(QUESTION, **{"Time in seconds": 30, "Option 1": " a "})) == record["hash"]
+
+
+def test_save_and_reload(bank, tmp_path):
+    bank.add(QUESTION, QUIZ)
+    bank.add(dict(QUESTION, **{"Question Text": "Друге"}), "07.tools/01.docker/01.intro")
+    bank.save()
+
+    lines = (tmp_path / "05.python.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0])["quiz"] == QUIZ
+
+    reloaded = QuestionBank(str(tmp_path))
+    assert reloaded.courses() == ["05.python", "07.tools"]
+    assert reloaded.add(QUESTION, QUIZ)[1] == "unchanged"
+
+
+def test_query_filters(bank):
+    a, _ = bank.add(QUESTION, QUIZ, ["content/05.python/02.encapsulation.md"])
+    b, _ = bank.add(dict(QUESTION, **{"Question Text": "B"}), "05.python/03.inheritance-mro", ["content/05.python/"])
+    c, _ = bank.add(dict(QUESTION, **{"Question Text": "C"}), "07.tools/01.docker/01.intro", [])
+
+    ids = lambda records: [r["id"] for r in records]
+    assert ids(bank.query(quiz=QUIZ)) == [a["id"]]
+    assert ids(bank.query(quiz="05.python/")) == [a["id"], b["id"]]
+    assert ids(bank.query(course="07.tools")) == [c["id"]]
+    assert ids(bank.query(tags=["content/05.python/"])) == [a["id"], b["id"]]
+    assert ids(bank.query(tags=["content/05.python/02.encapsulation.md"])) == [a["id"]]
+    assert ids(bank.query(ids=[c["id"], a["id"]])) == [c["id"], a["id"]]
+    assert bank.get(b["id"]) is b
+
+
+def test_default_tags():
+    assert default_tags("07.tools/01.docker/06.container-lifecycle") == [
+        "content/07.tools/01.docker/06.container-lifecycle.md"
+    ]
+    assert default_tags("12.html-css/12.html-css") == ["content/12.html-css/"]
+    assert default_tags("99.missing/quiz") == []
+
+
+def test_extract_questions_from_generator(tmp_path):
+    script = tmp_path / "gen.py"
+    script.write_text('questions = [{"Question Text": "Q"}]\nprint(len(questions))\n', encoding="utf-8")
+    assert extract_questions(str(script)) == [{"Question Text": "Q"}]
+
+
+@pytest.mark.parametrize("tail", [
+    "questions = questions[:1]",
+    "questions += [{}]",
+    "questions.append({})",
+    "random.shuffle(questions)",
+    "del questions[0]",
+])
+def test_extract_questions_rejects_changed_list(tmp_path, tail):
+    script = tmp_path / "gen.py"
+    script.write_text(f'import random\nquestions = [{{"Question Text": "Q"}}]\n{tail}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="змінює `questions`"):
+        extract_questions(str(script))
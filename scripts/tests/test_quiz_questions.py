@@ -0,0 +1,82 @@
+"""quiz_questions: нормалізація (та сама, що у wayground_exporter) і перетворення в extracted."""
+
+import pytest
+
+from quiz_questions import QUESTION_FIELDS, normalize_question, to_extracted
+
+QUESTIONS = [
+    {"Question Text": "MCQ", "Question Type": "Multiple Choice", "Option 1": "a", "Option 2": "b",
+     "Correct Answer": "Відповідь 2 (b)", "Time in seconds": "30"},
+    {"Question Text": "MCQ число", "Question Type": "Multiple Choice", "Option 1": "a", "Option 2": "b",
+     "Correct Answer": 1, "Time in seconds": 45},
+    {"Question Text": "MSQ", "Question Type": "Checkbox", "Option 1": "a", "Option 2": "b", "Option 3": "c",
+     "Correct Answer": "1 і 3"},
+    {"Question Text": "Blank", "Question Type": "fill-in-the-blank", "Option 2": "зайве",
+     "Correct Answer": "відповідь"},
+    {"Question Text": "Blank з Option 1", "Question Type": "Fill-in-the-Blank", "Option 1": "так",
+     "Correct Answer": "ні"},
+    {"Question Text": "Без відповіді", "Question Type": "Multiple Choice", "Option 1": "a", "Correct Answer": ""},
+    {"Question Text": "Open", "Question Type": "Open-Ended", "Correct Answer": None},
+    {"Question Text": "Без типу", "Option 1": "a", "Correct Answer": "1"},
+]
+
+
+def _cell(value):
+    """Комірка так, як її бачить xlsx: None/NaN/"" — порожньо, решта — рядок."""
+    if value is None or value == "" or value != value:
+        return None
+    return str(value)
+
+
+def test_normalize_question_matches_normalize_answers():
+    pd = pytest.importorskip("pandas")
+    from wayground_exporter import normalize_answers
+
+    df = pd.DataFrame(QUESTIONS, columns=QUESTION_FIELDS)
+    normalize_answers(df)
+    expected = [[_cell(v) for v in row] for row in df.itertuples(index=False)]
+    rows = [normalize_question(q) for q in QUESTIONS]
+    actual = [[_cell(row.get(c)) for c in QUESTION_FIELDS] for row in rows]
+    assert actual == expected
+
+
+def test_normalize_question_does_not_mutate_input():
+    q = dict(QUESTIONS[3])
+    normalize_question(q)
+    assert q == QUESTIONS[3]
+
+
+def test_to_extracted_mcq_msq_blank():
+    mcq = to_extracted(normalize_question(QUESTIONS[0]))
+    assert mcq == {"text": "MCQ", "questionType": "MCQ", "option1": "a", "option2": "b",
+                   "correct": 1, "time": 30}
+    msq = to_extracted(normalize_question(QUESTIONS[2]))
+    assert (msq["questionType"], msq["correct"]) == ("MSQ", [0, 2])
+    blank = to_extracted(normalize_question(QUESTIONS[3]))
+    assert blank == {"text": "Blank", "questionType": "BLANK", "option1": "відповідь",
+                     "correct": 0, "time": 30}
+
+
+def test_to_extracted_image_link():
+    q = {"Question Text": "", "Image Link": "https://files.catbox.moe/x.png", "Option 1": "a",
+         "Correct Answer": "1", "Answer explanation": " чому "}
+    extracted = to_extracted(q)
+    assert extracted["url"] == "https://files.catbox.moe/x.png"
+    assert extracted["mediaType"] == "image"
+    assert extracted["explain"] == "чому"
+
+
+@pytest.mark.parametrize("question, message", [
+    ({"Question Text": "x", "Question Type": "Draw"}, "не підтримується"),
+    ({"Question Text": " ", "Option 1": "a", "Correct Answer": "1"}, "немає Question Text"),
+    ({"Question Text": "x", "Option 1": "a", "Correct Answer": ""}, "немає Correct Answer"),
+    ({"Question Text": "x", "Option 1": "a", "Correct Answer": "правильна перша"}, "немає Correct Answer"),
+    ({"Question Text": "x", "Question Type": "Checkbox", "Option 1": "a"}, "немає Correct Answer"),
+    ({"Question Text": "x", "Option 1": "a", "Option 2": "b", "Correct Answer": "3"}, "порожній варіант"),
+    ({"Question Text": "x", "Option 1": "a", "Correct Answer": "0"}, "порожній варіант"),
+    ({"Question Text": "x", "Question Type": "Checkbox", "Option 1": "a", "Option 2": "b",
+      "Correct Answer": "1,4"}, "порожній варіант"),
+])
+def test_to_extracted_errors(question, message):
+    with pytest.raises(ValueError, match=message):
+        to_extracted(normalize_question(question))
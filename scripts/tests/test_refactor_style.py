@@ -0,0 +1,58 @@
+"""refactor_style.strip_std: заміни за найдовшим ключем і пропуск літералів та коментарів."""
+
+import pytest
+
+from refactor_style import strip_std, transform_block
+
+
+@pytest.mark.parametrize("code, expected", [
+    ("std::cout << std::endl;", "cout << endl;"),
+    # Найдовший ключ виграє
+    ("std::string_view v; std::string s;", "string_view v; string s;"),
+    ("auto p = std::string::npos;", "auto p = string::npos;"),
+    # Імена не з таблиці лишаються кваліфікованими
+    ("std::map<int, int> m; std::vector<int> v;", "std::map<int, int> m; vector<int> v;"),
+    ("no std here", "no std here"),
+])
+def test_strip_std_replacements(code, expected):
+    assert strip_std(code) == expected
+
+
+@pytest.mark.parametrize("code", [
+    'auto s = "std::string";',
+    "auto s = u8\"std::cout\";",
+    'auto s = R"(std::vector)";',
+    'auto s = R"x(")std::cin)x";',
+    "char c = 's'; // std::cout",
+    "/* std::endl\n std::cin */",
+    'auto s = "escaped \\" std::cout";',
+])
+def test_strip_std_skips_literals_and_comments(code):
+    assert strip_std(code) == code
+
+
+def test_strip_std_char_literals():
+    assert strip_std("char q = '\\''; std::cout << q;") == "char q = '\\''; cout << q;"
+    assert strip_std("char c = u8'a'; std::cout << c;") == "char c = u8'a'; cout << c;"
+
+
+@pytest.mark.parametrize("code, expected", [
+    # ' — роздільник розрядів (C++14), а не початок char-літерала
+    ("int n = 1'000; std::cout << 'x';", "int n = 1'000; cout << 'x';"),
+    ("auto h = 0x1'FF; std::cout << h << 'x';", "auto h = 0x1'FF; cout << h << 'x';"),
+    ("x = 1'000'000 + std::max(a, b);", "x = 1'000'000 + max(a, b);"),
+])
+def test_strip_std_digit_separators(code, expected):
+    assert strip_std(code) == expected
+
+
+def test_strip_std_include_literals():
+    code = 'std::cout << "std::string";'
+    assert strip_std(code, skip_literals=False) == 'cout << "string";'
+
+
+def test_transform_block_inserts_using_namespace():
+    code = "#include <iostream>\n\nint main() { std::cout << 1; }"
+    assert transform_block(code) == (
+        "#include <iostream>\n\nusing namespace std;\n\nint main() { cout << 1; }"
+    )
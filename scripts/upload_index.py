@@ -0,0 +1,139 @@
+"""
+upload_index.py — індекс уже завантажених зображень (catbox, litterbox, Wayground).
+
+Зображення ідентифікується SHA-256 свого вмісту; для кожного хосту індекс
+пам'ятає URL, час завантаження і строк життя посилання (litterbox — 72 години).
+Тож однакові PNG (той самий код у різних тестах, повторний експорт) не
+завантажуються вдруге, а прострочені litterbox-посилання тихо замінюються
+новим завантаженням — першим пробується постійний хост.
+
+Зберігається в SQLite: .content-cache/uploads.sqlite
+
+Використання:
+  with UploadIndex() as index:
+      url, host = upload_with_index(png_path, [
+          ("catbox", lambda p: upload_to_catbox(p, userhash)),
+          ("litterbox", upload_to_litterbox),
+      ], index)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable
+
+from batch_runner import STATE_DIR
+
+DEFAULT_PATH = os.path.join(STATE_DIR, "uploads.sqlite")
+
+# Строк життя посилань за хостом (секунди); хостів без запису — постійні
+HOST_TTL = {"litterbox": 72 * 3600}
+# Посилання, що от-от протухне, вже не годиться — тест має прожити хоча б стільки
+EXPIRY_MARGIN = 6 * 3600
+
+
+def image_digest(data: bytes | str) -> str:
+    """SHA-256 вмісту: приймає байти або шлях до файлу."""
+    if isinstance(data, str):
+        with open(data, "rb") as f:
+            data = f.read()
+    return hashlib.sha256(data).hexdigest()
+
+
+class UploadIndex:
+    def __init__(self, path: str = DEFAULT_PATH, enabled: bool = True):
+        self.db = None
+        # Завантаження можуть іти з кількох потоків — одне з'єднання під локом
+        self.lock = threading.Lock()
+        if not enabled:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS uploads (
+                sha256      TEXT NOT NULL,
+                host        TEXT NOT NULL,
+                url         TEXT NOT NULL,
+                uploaded_at REAL NOT NULL,
+                expires_at  REAL,
+                PRIMARY KEY (sha256, host)
+            )
+            """
+        )
+
+    def lookup(self, digest: str, host: str) -> str | None:
+        """URL цього зображення на `host`, якщо він є і ще не (майже) протух."""
+        if self.db is None:
+            return None
+        with self.lock:
+            row = self.db.execute(
+                "SELECT url, expires_at FROM uploads WHERE sha256 = ? AND host = ?", (digest, host)
+            ).fetchone()
+        if row is None:
+            return None
+        url, expires_at = row
+        if expires_at is not None and expires_at - EXPIRY_MARGIN < time.time():
+            return None
+        return url
+
+    def record(self, digest: str, host: str, url: str) -> None:
+        if self.db is None:
+            return
+        now = time.time()
+        ttl = HOST_TTL.get(host)
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO uploads (sha256, host, url, uploaded_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (digest, host, url, now, now + ttl if ttl else None),
+            )
+            self.db.commit()
+
+    def prune_expired(self) -> int:
+        if self.db is None:
+            return 0
+        with self.lock:
+            cur = self.db.execute(
+                "DELETE FROM uploads WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+            )
+            self.db.commit()
+        return cur.rowcount
+
+    def close(self) -> None:
+        if self.db is None:
+            return
+        self.prune_expired()
+        self.db.close()
+        self.db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def upload_with_index(
+    img_path: str,
+    uploaders: list[tuple[str, Callable[[str], str | None]]],
+    index: UploadIndex,
+) -> tuple[str | None, str | None]:
+    """
+    Повертає (url, host) для зображення, пробуючи хости в порядку пріоритету:
+    для кожного спершу індекс, потім реальне завантаження. Тож живе посилання на
+    постійному хості перевикористовується одразу, а протухле litterbox-посилання
+    замінюється завантаженням на постійний хост (або свіжим litterbox).
+    """
+    digest = image_digest(img_path)
+    for host, upload in uploaders:
+        url = index.lookup(digest, host)
+        if url:
+            return url, host
+        url = upload(img_path)
+        if url:
+            index.record(digest, host, url)
+            return url, host
+    return None, None
@@ -0,0 +1,180 @@
+"""
+uploader.py — спільне завантаження зображень на catbox, litterbox і Wayground S3.
+
+  - одна keep-alive сесія з пулом з'єднань на кожен хост (TCP+TLS не відкриваються
+    заново для кожного зображення), включно з S3 pre-signed PUT;
+  - повтори з експоненційною затримкою на 5xx / 429 / таймаути / обриви з'єднання;
+  - обмеження частоти запитів на хост (HOST_MIN_INTERVAL);
+  - `upload_many` — паралельне завантаження пулом потоків з обмеженою кількістю.
+
+Функції завантаження повертають URL або None (помилка вже залогована повторами),
+тож їх можна напряму передавати в upload_index.upload_with_index.
+
+Використання:
+  from uploader import upload_many, upload_to_catbox
+
+  urls = upload_many(paths, lambda p: upload_to_catbox(p, userhash), jobs=8)
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CATBOX_API = "https://catbox.moe/user/api.php"
+LITTERBOX_API = "https://litterbox.catbox.moe/resources/internals/api.php"
+WAYGROUND_UPLOAD_URL = (
+    "https://media.quizizz.com/_mdserver/main/getUploadURL"
+    "?destination=quizzes&enableAcceleration=true"
+)
+
+DEFAULT_JOBS = 8
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0      # 1, 2, 4, 8 с (+ випадковий jitter)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Мінімальний інтервал між запитами до одного хосту (секунди)
+HOST_MIN_INTERVAL = {
+    "catbox.moe": 0.5,
+    "litterbox.catbox.moe": 0.5,
+    "media.quizizz.com": 0.1,
+}
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_sessions: dict[str, requests.Session] = {}
+_last_request: dict[str, float] = {}
+_lock = threading.Lock()
+_host_locks: dict[str, threading.Lock] = {}
+
+
+def host_session(url: str) -> requests.Session:
+    """Спільна keep-alive сесія для хосту з `url` (пул з'єднань розрахований на DEFAULT_JOBS потоків)."""
+    host = urlsplit(url).hostname or ""
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=DEFAULT_JOBS * 2)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"User-Agent": "Mozilla/5.0"})
+            _sessions[host] = session
+        return session
+
+
+def _throttle(host: str) -> None:
+    interval = HOST_MIN_INTERVAL.get(host, 0)
+    if not interval:
+        return
+    with _lock:
+        host_lock = _host_locks.setdefault(host, threading.Lock())
+    # Лок на хост: потоки стають у чергу, і кожен чекає свій слот
+    with host_lock:
+        wait = _last_request.get(host, 0) + interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request[host] = time.monotonic()
+
+
+def request(method: str, url: str, *, session: requests.Session | None = None, **kwargs) -> requests.Response:
+    """
+    HTTP-запит з обмеженням частоти і повторами на тимчасових помилках.
+    Без `session` використовується спільна сесія хосту.
+    Після вичерпання повторів повертає останню відповідь або прокидає останній виняток.
+    """
+    session = session or host_session(url)
+    host = urlsplit(url).hostname or ""
+    for attempt in range(MAX_RETRIES + 1):
+        _throttle(host)
+        try:
+            resp = session.request(method, url, **kwargs)
+            if resp.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return resp
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == MAX_RETRIES:
+                raise
+        time.sleep(BACKOFF_BASE * 2 ** attempt + random.uniform(0, BACKOFF_BASE))
+    raise AssertionError("unreachable")
+
+
+def _read(img_path: str) -> bytes:
+    with open(img_path, "rb") as f:
+        return f.read()
+
+
+def upload_to_catbox(img_path: str, userhash: str) -> str | None:
+    """Завантажує PNG на catbox.moe (постійне зберігання)."""
+    try:
+        r = request(
+            "POST", CATBOX_API,
+            data={"reqtype": "fileupload", "userhash": userhash},
+            files={"fileToUpload": ("image.png", _read(img_path), "image/png")},
+            timeout=30,
+        )
+        url = r.text.strip()
+        return url if url.startswith("https://") else None
+    except (OSError, requests.RequestException):
+        return None
+
+
+def upload_to_litterbox(img_path: str) -> str | None:
+    """Завантажує PNG на litterbox.catbox.moe (72h TTL)."""
+    try:
+        r = request(
+            "POST", LITTERBOX_API,
+            data={"reqtype": "fileupload", "time": "72h"},
+            files={"fileToUpload": ("image.png", _read(img_path), "image/png")},
+            timeout=30,
+        )
+        url = r.text.strip()
+        return url if url.startswith("https://") else None
+    except (OSError, requests.RequestException):
+        return None
+
+
+def upload_bytes_to_wayground(session: requests.Session, data: bytes) -> str:
+    """
+    Завантажує байти на Wayground S3 і повертає finalUrl.
+    `session` — авторизована сесія Wayground (для getUploadURL); сам PUT іде
+    через спільну сесію S3-хосту. Помилки — RuntimeError.
+    """
+    init_resp = request("POST", WAYGROUND_UPLOAD_URL, session=session, timeout=30)
+    if init_resp.status_code != 200 or not init_resp.json().get("success"):
+        raise RuntimeError(f"Не вдалось отримати upload URL: {init_resp.text[:300]}")
+    res = init_resp.json()["data"]
+
+    # S3 pre-signed URL підписаний з Content-Type: application/x-www-form-urlencoded —
+    # будь-який інший тип дасть 403 SignatureDoesNotMatch.
+    s3_resp = request(
+        "PUT", res["signedUrl"],
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        data=data,
+        timeout=60,
+    )
+    if s3_resp.status_code != 200:
+        raise RuntimeError(f"Помилка S3 upload. HTTP {s3_resp.status_code}: {s3_resp.text[:200]}")
+    return res["finalUrl"]
+
+
+def upload_to_wayground(session: requests.Session, img_path: str) -> str | None:
+    """Завантажує PNG на Wayground S3 і повертає finalUrl (None при помилці)."""
+    try:
+        return upload_bytes_to_wayground(session, _read(img_path))
+    except (OSError, ValueError, RuntimeError, requests.RequestException):
+        return None
+
+
+def upload_many(items: Iterable[T], upload: Callable[[T], R], jobs: int = DEFAULT_JOBS) -> list[R]:
+    """Проганяє `upload` по всіх елементах пулом з `jobs` потоків; результати — у порядку вхідних."""
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(items)))) as executor:
+        return list(executor.map(upload, items))
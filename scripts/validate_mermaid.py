@@ -1,111 +1,274 @@
-import sys
+"""
+Валідація Mermaid-діаграм у markdown файлах.
+
+Усі блоки ```mermaid стрімляться в довгоживучий воркер (scripts/mermaid_worker.mjs:
+один Node + один headless Chromium з уже завантаженим mermaid), тож Node, npm і
+Chromium стартують один раз на воркер, а не на кожну діаграму.
+
+Результати кешуються за хешем діаграми + версією mermaid (див. diagram_cache.py),
+тож повторний запуск перевіряє лише змінені блоки.
+
+Використання:
+  python3 scripts/validate_mermaid.py content/04.java/05.business-logic-patterns.md
+  python3 scripts/validate_mermaid.py 'content/**/*.md' --jobs 4
+  python3 scripts/validate_mermaid.py 'content/**/*.md' --prune      # + прибрати кеш зниклих діаграм
+  python3 scripts/validate_mermaid.py content/... --no-cache
+  python3 scripts/validate_mermaid.py content --changed            # лише змінені в git і ще не перевірені файли
+"""
+
+import argparse
+import json
 import os
+import queue
 import subprocess
-import shutil
+import sys
+import threading
+
+from batch_runner import add_changed_argument, select_files
+from content_manifest import ContentManifest
+from diagram_cache import DiagramCache
+from mdc_tokenizer import tokenize_file
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mermaid_worker.mjs')
+# Змінюється разом з логікою перевірки, щоб старі результати в кеші стали недійсними
+VALIDATOR_VERSION = '3'
+
+
+def mermaid_version():
+    """Версія mermaid, яку використає воркер (без запуску браузера)."""
+    try:
+        res = subprocess.run(['node', WORKER_SCRIPT, '--version'], stdin=subprocess.DEVNULL,
+                             capture_output=True, text=True, timeout=60)
+        return json.loads(res.stdout.strip().splitlines()[-1]).get('version', '')
+    except (OSError, ValueError, IndexError, subprocess.TimeoutExpired):
+        return ''
+
 
 def extract_mermaid_blocks(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     blocks = []
-    lines = content.splitlines()
-    in_block = False
-    current_block = []
-    start_line = 0
-    
-    for i, line in enumerate(lines):
-        if line.strip().startswith('```mermaid'):
-            in_block = True
-            start_line = i + 1
-            current_block = []
-        elif in_block and line.strip() == '```':
-            in_block = False
+    for span in tokenize_file(file_path, errors='replace'):
+        if span.kind == 'code' and span.lang == 'mermaid':
             blocks.append({
-                'content': '\n'.join(current_block),
-                'start_line': start_line,
-                'end_line': i + 1
+                'file': file_path,
+                'content': span.body[:-1] if span.body.endswith('\n') else span.body,
+                'start_line': span.start_line,
+                'end_line': span.end_line,
             })
-        elif in_block:
-            current_block.append(line)
-            
     return blocks
 
+
+class MermaidWorker:
+    """Клієнт для одного процесу mermaid_worker.mjs (JSON-рядки через stdin/stdout)."""
+
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            ['node', WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+        )
+        self._next_id = 0
+        ready = self._read()
+        if not ready.get('ready'):
+            self.close()
+            raise RuntimeError(f"mermaid worker не стартував: {ready.get('fatal', ready)}")
+        self.version = ready.get('version', '')
+
+    def _read(self):
+        line = self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"mermaid worker несподівано завершився (код {self.proc.poll()})")
+        return json.loads(line)
+
+    def validate(self, code, svg=False, element_id=None):
+        """
+        Повертає {'ok': bool, 'error': str, 'line': int | None}; line — 1-based у межах блоку.
+        'infra': True — блок не перевірено через збій воркера (таймаут, падіння сторінки).
+        З svg=True валідна діаграма повертається ще й відрендереною: {'ok': True, 'svg': '<svg ...>'}.
+        `element_id` — id кореня SVG (і префікс його стилів); лічильник воркера для
+        статичних SVG не годиться — він однаковий у кожному процесі й запуску.
+        """
+        self._next_id += 1
+        request = {'id': self._next_id, 'code': code, 'svg': svg}
+        if element_id:
+            request['elementId'] = element_id
+        self.proc.stdin.write(json.dumps(request, ensure_ascii=False) + '\n')
+        self.proc.stdin.flush()
+        while True:
+            msg = self._read()
+            if msg.get('fatal'):
+                raise RuntimeError(f"mermaid worker: {msg['fatal']}")
+            if msg.get('id') == self._next_id:
+                return msg
+
+    def close(self):
+        if self.proc.stdin and not self.proc.stdin.closed:
+            self.proc.stdin.close()
+        try:
+            self.proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def validate_blocks(blocks, jobs=1, render=False):
+    """
+    Валідує блоки у `jobs` паралельних воркерах.
+    Кожному блоку додаються поля 'valid', 'error', 'error_line' (номер рядка у файлі)
+    та 'infra' (збій воркера, а не помилка діаграми — такий результат не кешується),
+    а з render=True — ще й 'svg' для валідних діаграм.
+    """
+    pending = queue.Queue()
+    for block in blocks:
+        pending.put(block)
+    failures = []
+
+    def run_worker():
+        try:
+            with MermaidWorker() as worker:
+                while True:
+                    try:
+                        block = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    res = worker.validate(block['content'], svg=render, element_id=block.get('element_id'))
+                    block['valid'] = res.get('ok', False)
+                    block['infra'] = bool(res.get('infra'))
+                    if render:
+                        block['svg'] = res.get('svg')
+                    block['error'] = res.get('error', '')
+                    # Рядок помилки всередині діаграми → рядок у файлі (start_line — це рядок з ```mermaid)
+                    block['error_line'] = block['start_line'] + res['line'] if res.get('line') else None
+        except (OSError, RuntimeError) as e:
+            failures.append(e)
+
+    threads = [threading.Thread(target=run_worker) for _ in range(max(1, min(jobs, len(blocks))))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if failures and any('valid' not in b for b in blocks):
+        raise RuntimeError(str(failures[0]))
+    return blocks
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate_mermaid.py <file_path>")
-        sys.exit(1)
-        
-    file_path = sys.argv[1]
-    if not os.path.exists(file_path):
-        print(f"File not found: {file_path}")
+    parser = argparse.ArgumentParser(description='Валідація Mermaid-діаграм у markdown файлах.')
+    parser.add_argument('paths', nargs='+', help='Файли, папки або glob-и (наприклад content/**/*.md)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Кількість паралельних воркерів (кожен — окремий Chromium). За замовчуванням: 1')
+    parser.add_argument('--no-cache', action='store_true', help='Не читати і не писати кеш результатів')
+    parser.add_argument('--prune', action='store_true',
+                        help='Видалити з кешу діаграми, яких не було в цьому запуску (для запуску по всьому content/)')
+    add_changed_argument(parser)
+    args = parser.parse_args()
+
+    files = select_files(args.paths, args.changed)
+    if not files and args.changed is None:
+        print(f"File not found: {' '.join(args.paths)}")
         sys.exit(1)
 
-    blocks = extract_mermaid_blocks(file_path)
-    
+    manifest = ContentManifest()
+    if args.changed is not None:
+        # Файли, які вже пройшли перевірку цією версією валідатора, не чіпаємо
+        files = manifest.select_changed(files, 'validate_mermaid', VALIDATOR_VERSION)
+        if not files:
+            manifest.close()
+            print("No changed files to validate")
+            return
+
+    blocks = []
+    for file_path in files:
+        blocks.extend(extract_mermaid_blocks(file_path))
+
     if not blocks:
-        print(f"No mermaid blocks found in {file_path}")
+        for file_path in files:
+            manifest.mark(file_path, 'validate_mermaid', VALIDATOR_VERSION)
+        manifest.close()
+        print(f"No mermaid blocks found in {len(files)} file(s)")
         return
 
-    temp_dir = ".mermaid_tmp"
-    if os.path.exists(temp_dir):
-        shutil.rmtree(temp_dir)
-    os.makedirs(temp_dir)
-    
-    # Save all snippets
-    for i, block in enumerate(blocks):
-        temp_file = os.path.join(temp_dir, f'snippet_{i}.mmd')
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            f.write(block['content'])
-
-    print(f"Validating {len(blocks)} blocks in {file_path}...")
-    
-    # Run mermaid-cli on all snippets at once
-    # We use a dummy output directory
+    cache = DiagramCache('mermaid', f"{VALIDATOR_VERSION}:{mermaid_version()}", enabled=not args.no_cache)
+    todo = []
+    for block in blocks:
+        hit = cache.get(block['content'])
+        if hit is None:
+            todo.append(block)
+        else:
+            block['valid'] = hit['valid']
+            block['error'] = hit['error']
+            block['error_line'] = block['start_line'] + hit['line'] if hit['line'] else None
+
+    print(f"Validating {len(todo)} of {len(blocks)} blocks in {len(files)} file(s) "
+          f"with {args.jobs} worker(s) ({len(blocks) - len(todo)} cached)...")
+
     try:
-        result = subprocess.run(
-            ['npx', '-y', '@mermaid-js/mermaid-cli', '-i', os.path.join(temp_dir, 'snippet_*.mmd')],
-            capture_output=True,
-            text=True
-        )
-        # Note: mmdc returns 0 even if some fail? No, usually it returns non-zero if any fail.
-    except Exception as e:
-        print(f"Error running mermaid-cli: {e}")
+        if todo:
+            validate_blocks(todo, args.jobs)
+    except RuntimeError as e:
+        cache.close()
+        manifest.close()
+        print(f"Error running mermaid worker: {e}")
         sys.exit(1)
 
-    # The issue with mmdc is it doesn't easily map errors back to files in batch mode
-    # Let's run them one by one for better reporting, but use npx cache
-    
+    for block in todo:
+        if block['infra']:
+            continue
+        line = block['error_line'] - block['start_line'] if block['error_line'] else None
+        cache.put(block['content'], block['valid'], block['error'], line)
+    if args.prune:
+        print(f"Pruned {cache.prune_unused()} stale cache entries")
+    cache.close()
+
+    invalid_files = {block['file'] for block in blocks if not block['valid']}
+    for file_path in files:
+        if file_path in invalid_files:
+            manifest.forget(file_path, 'validate_mermaid')
+        else:
+            manifest.mark(file_path, 'validate_mermaid', VALIDATOR_VERSION)
+    manifest.close()
+
     print("\n--- MERMAID VALIDATION REPORT ---")
     all_valid = True
-    for i, block in enumerate(blocks):
-        temp_file = os.path.join(temp_dir, f'snippet_{i}.mmd')
-        res = subprocess.run(
-            ['npx', '-y', '@mermaid-js/mermaid-cli', '-i', temp_file, '-o', f'{temp_file}.svg'],
-            capture_output=True,
-            text=True
-        )
-        
-        status = "✅ VALID" if res.returncode == 0 else "❌ INVALID"
-        if res.returncode != 0:
+    current_file = None
+    for block in blocks:
+        if block['file'] != current_file:
+            current_file = block['file']
+            index = 0
+            print(f"\n{os.path.relpath(current_file)}")
+        index += 1
+
+        if block.get('infra'):
+            print(f"Block {index} (Lines {block['start_line']}-{block['end_line']}): ⚠️ NOT CHECKED")
+            print(f"{os.path.relpath(block['file'])}:{block['start_line']}: {block['error'].strip()}")
+            continue
+        status = "✅ VALID" if block['valid'] else "❌ INVALID"
+        print(f"Block {index} (Lines {block['start_line']}-{block['end_line']}): {status}")
+        if not block['valid']:
             all_valid = False
-            
-        print(f"Block {i+1} (Lines {block['start_line']}-{block['end_line']}): {status}")
-        if res.returncode != 0:
-            # Extract relevant error part from stderr
-            error_msg = res.stderr
-            # mmdc errors can be long, let's try to find the actual message
-            print(f"Error Details:\n{error_msg.strip()}")
+            location = block['error_line'] or block['start_line']
+            print(f"{os.path.relpath(block['file'])}:{location}")
+            print(f"Error Details:\n{block['error'].strip()}")
             print("Snippet Content:")
             print(f"```mermaid\n{block['content']}\n```")
             print("-" * 40)
 
-    if all_valid:
-        print("\nAll Mermaid diagrams are valid!")
-    else:
+    infra_errors = sum(1 for block in blocks if block.get('infra'))
+    if not all_valid:
         print("\nFound errors in some Mermaid diagrams.")
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    if infra_errors:
+        print(f"\nError running mermaid worker: {infra_errors} block(s) not checked — run again")
+    if not all_valid or infra_errors:
+        sys.exit(1)
+    print("\nAll Mermaid diagrams are valid!")
 
 if __name__ == "__main__":
     main()
@@ -1,54 +1,212 @@
+"""
+Валідація ::plant-uml блоків у markdown файлах.
+
+Усі блоки, витягнуті з усіх файлів, пишуться в одну тимчасову папку і
+перевіряються одним викликом PlantUML (одна JVM замість однієї на блок).
+Помилки зіставляються назад з файлом і рядком.
+
+Використання:
+  python3 scripts/validate_plantuml.py content/02.cpp/39.c-strings.md
+  python3 scripts/validate_plantuml.py content/04.java
+  python3 scripts/validate_plantuml.py 'content/**/*.md' --no-cache
+  python3 scripts/validate_plantuml.py content --changed     # лише змінені в git і ще не перевірені файли
+"""
+
 import re
 import sys
 import subprocess
 import os
+import argparse
 import tempfile
 
-def extract_plantuml(content):
-    # Regex to find ::plant-uml blocks
-    pattern = re.compile(r'::plant-uml\s+```plantuml\s+(.*?)```\s+::', re.DOTALL)
-    return pattern.findall(content)
+from batch_runner import add_changed_argument, select_files
+from content_manifest import ContentManifest
+from diagram_cache import DiagramCache
+from mdc_tokenizer import LineIndex
 
-def validate_plantuml(code):
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.puml', delete=False) as tmp:
-        tmp.write(code)
-        tmp_path = tmp.name
-    
+# Змінюється разом з логікою перевірки, щоб старі результати в кеші стали недійсними
+VALIDATOR_VERSION = '3'
+
+# Формати помилок PlantUML: `-stdrpt:1` → "block_3.puml:12:error:Syntax Error?",
+# класичний вивід → "Error line 12 in file: /tmp/.../block_3.puml"
+STDRPT_RE = re.compile(r'^(?P<file>.*?block_(?P<idx>\d+)\.puml):(?P<line>\d+):error:(?P<msg>.*)$', re.MULTILINE)
+CLASSIC_RE = re.compile(r'^Error line (?P<line>\d+) in file: (?P<file>.*?block_(?P<idx>\d+)\.puml)\s*$', re.MULTILINE)
+
+PLANTUML_BLOCK_RE = re.compile(r'::plant-uml\s+```plantuml\s+(.*?)```\s+::', re.DOTALL)
+
+def extract_plantuml(content, line_index=None):
+    """
+    Знаходить ::plant-uml блоки з позиціями у файлі.
+
+    Кожен блок — dict:
+      content               код діаграми (те, що йде в PlantUML)
+      start_line, end_line  рядки `::plant-uml` і закривального `::` (1-based)
+      code_line             рядок, з якого починається `content`
+      start, end            зміщення всього блоку в `content` файлу (str-індекси, не байти)
+      code_start, code_end  зміщення коду діаграми: content[code_start:code_end]
+    """
+    line_index = line_index or LineIndex(content)
+    blocks = []
+    for m in PLANTUML_BLOCK_RE.finditer(content):
+        blocks.append({
+            'content': m.group(1),
+            'start_line': line_index.line_of(m.start()),
+            'end_line': line_index.line_of(m.end() - 1),
+            'code_line': line_index.line_of(m.start(1)),
+            'start': m.start(),
+            'end': m.end(),
+            'code_start': m.start(1),
+            'code_end': m.end(1),
+        })
+    return blocks
+
+def plantuml_version():
+    """Перший рядок `plantuml -version` (для ключа кешу)."""
     try:
-        # Use --check-syntax to validate
-        result = subprocess.run(['plantuml', '--check-syntax', tmp_path], 
-                                capture_output=True, text=True)
-        if result.returncode != 0:
-            return result.stdout or result.stderr
-        return None
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+        result = subprocess.run(['plantuml', '-version'], capture_output=True, text=True, timeout=60)
+        return (result.stdout or result.stderr).strip().splitlines()[0]
+    except (OSError, IndexError, subprocess.TimeoutExpired):
+        return ''
+
+def validate_plantuml_batch(codes):
+    """
+    Перевіряє всі блоки одним запуском PlantUML.
+    Повертає {індекс блоку: (рядок у блоці | None, текст помилки)} лише для невалідних блоків.
+    """
+    if not codes:
+        return {}
+    with tempfile.TemporaryDirectory(prefix='plantuml-check-') as tmp_dir:
+        for i, code in enumerate(codes):
+            with open(os.path.join(tmp_dir, f'block_{i}.puml'), 'w', encoding='utf-8') as f:
+                f.write(code)
+
+        result = subprocess.run(
+            ['plantuml', '-checkonly', '-stdrpt:1', '-charset', 'UTF-8', tmp_dir],
+            capture_output=True, text=True,
+        )
+        output = (result.stdout or '') + '\n' + (result.stderr or '')
+
+    errors = {}
+    for m in STDRPT_RE.finditer(output):
+        errors.setdefault(int(m.group('idx')), (int(m.group('line')), m.group('msg').strip() or 'Syntax Error'))
+    for m in CLASSIC_RE.finditer(output):
+        errors.setdefault(int(m.group('idx')), (int(m.group('line')), 'Syntax Error'))
+
+    if result.returncode != 0 and not errors:
+        # PlantUML впав не через конкретний блок (немає Java, битий аргумент...) — це не результат валідації
+        raise RuntimeError(output.strip() or f'plantuml exited with code {result.returncode}')
+    return errors
+
+def render_plantuml_batch(codes):
+    """
+    Рендерить усі блоки в SVG одним запуском PlantUML.
+    Повертає {індекс блоку: svg-текст}; блоки з помилками у результат не потрапляють.
+    """
+    if not codes:
+        return {}
+    svgs = {}
+    with tempfile.TemporaryDirectory(prefix='plantuml-render-') as tmp_dir:
+        out_dir = os.path.join(tmp_dir, 'out')
+        for i, code in enumerate(codes):
+            with open(os.path.join(tmp_dir, f'block_{i}.puml'), 'w', encoding='utf-8') as f:
+                f.write(code)
+
+        result = subprocess.run(
+            ['plantuml', '-tsvg', '-charset', 'UTF-8', '-o', out_dir, tmp_dir],
+            capture_output=True, text=True,
+        )
+        errors = {int(m.group('idx')) for m in STDRPT_RE.finditer(result.stderr or '')}
+        errors |= {int(m.group('idx')) for m in CLASSIC_RE.finditer(result.stderr or '')}
+        for i in range(len(codes)):
+            svg_path = os.path.join(out_dir, f'block_{i}.svg')
+            # PlantUML малює SVG навіть для помилкових діаграм (з текстом помилки) — такі пропускаємо
+            if i not in errors and os.path.exists(svg_path):
+                with open(svg_path, 'r', encoding='utf-8') as f:
+                    svgs[i] = f.read()
+    return svgs
+
+def validate_plantuml(code):
+    errors = validate_plantuml_batch([code])
+    if 0 in errors:
+        line, message = errors[0]
+        return f"Error line {line}: {message}"
+    return None
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate_plantuml.py <file.md>")
-        sys.exit(1)
-    
-    file_path = sys.argv[1]
-    if not os.path.exists(file_path):
-        print(f"File not found: {file_path}")
+    parser = argparse.ArgumentParser(description="Validate ::plant-uml blocks in markdown files.")
+    parser.add_argument("paths", nargs="+", help="Markdown files, folders or globs")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the validation cache")
+    parser.add_argument("--prune", action="store_true",
+                        help="Drop cached results for diagrams not seen in this run")
+    add_changed_argument(parser)
+    args = parser.parse_args()
+
+    files = select_files(args.paths, args.changed)
+    if not files and args.changed is None:
+        print(f"File not found: {' '.join(args.paths)}")
         sys.exit(1)
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    blocks = extract_plantuml(content)
+
+    manifest = ContentManifest()
+    if args.changed is not None:
+        # Файли, які вже пройшли перевірку цією версією валідатора, не чіпаємо
+        files = manifest.select_changed(files, 'validate_plantuml', VALIDATOR_VERSION)
+
+    blocks = []
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+        for block in extract_plantuml(content):
+            block['file'] = file_path
+            blocks.append(block)
+
     if not blocks:
+        for file_path in files:
+            manifest.mark(file_path, 'validate_plantuml', VALIDATOR_VERSION)
+        manifest.close()
         print("No PlantUML blocks found.")
         return
 
+    with DiagramCache('plantuml', f"{VALIDATOR_VERSION}:{plantuml_version()}", enabled=not args.no_cache) as cache:
+        todo = []
+        for block in blocks:
+            hit = cache.get(block['content'])
+            if hit is None:
+                todo.append(block)
+            else:
+                block['error'] = None if hit['valid'] else (hit['line'], hit['error'])
+
+        print(f"Checking {len(todo)} of {len(blocks)} PlantUML blocks in {len(files)} file(s) "
+              f"with one PlantUML run ({len(blocks) - len(todo)} cached)...")
+        try:
+            results = validate_plantuml_batch([block['content'] for block in todo])
+        except (OSError, RuntimeError) as e:
+            manifest.close()
+            print(f"Error running plantuml: {e}")
+            sys.exit(1)
+
+        for i, block in enumerate(todo):
+            block['error'] = results.get(i)
+            line, message = block['error'] or (None, '')
+            cache.put(block['content'], block['error'] is None, message, line)
+        if args.prune:
+            print(f"Pruned {cache.prune_unused()} stale cache entries")
+
+    invalid_files = {block['file'] for block in blocks if block['error']}
+    for file_path in files:
+        if file_path in invalid_files:
+            manifest.forget(file_path, 'validate_plantuml')
+        else:
+            manifest.mark(file_path, 'validate_plantuml', VALIDATOR_VERSION)
+    manifest.close()
+
     errors = []
-    for i, code in enumerate(blocks):
-        error = validate_plantuml(code)
-        if error:
-            errors.append(f"Block {i+1}:\nCode:\n{code}\nError:\n{error}")
-    
+    for block in blocks:
+        if block['error']:
+            line, message = block['error']
+            # Рядок n у .puml — це рядок code_line + n - 1 у markdown
+            location = block['code_line'] + line - 1 if line else block['start_line']
+            errors.append(f"{os.path.relpath(block['file'])}:{location}: {message}\nCode:\n{block['content']}")
+
     if errors:
         print("\n--- Syntax Errors Found ---\n")
         for err in errors:
@@ -3,11 +3,12 @@
 wayground_add_images.py — Додає зображення до варіантів відповідей у тесті Wayground.
 
 Флоу:
-  1. Логін через email/пароль -> отримання _sid cookie
+  1. Логін через email/пароль -> отримання _sid cookie (збережена сесія, див. wayground_auth.py)
   2. GET quiz -> витягуємо version_id та повну структуру питань
   3. Читаємо JSON-маппінг: яке питання, який варіант, який файл зображення
   4. Завантажуємо кожне зображення на AWS S3 через Wayground media API
-  5. PATCH quiz question -> замінюємо варіант відповіді на image-варіант
+  5. Замінюємо варіанти відповідей на image-варіанти (усі варіанти питання разом)
+  6. PATCH змінених питань пачками (--batch-size питань за запит)
 
 Використання:
   python3 wayground_add_images.py --quiz-id <QUIZ_ID> --mapping <mapping.json>
@@ -29,70 +30,16 @@ Credentials:
   ]
 """
 
-import os
 import sys
 import json
-import uuid
 import struct
 import argparse
 import requests
 from pathlib import Path
 
-
-# ---------------------------------------------------------------------------
-# Авторизація
-# ---------------------------------------------------------------------------
-
-def login(email: str, password: str) -> requests.Session:
-    """
-    Логінимось на Wayground, повертаємо авторизований Session з _sid cookie.
-    """
-    print(f"[~] Авторизація як {email}...")
-
-    resp = requests.post(
-        "https://wayground.com/_authserver/public/public/v1/auth/login/local",
-        json={
-            "username": email,
-            "password": password,
-            "requestId": str(uuid.uuid4()),
-        },
-        headers={
-            "Content-Type": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Origin": "https://wayground.com",
-            "Referer": "https://wayground.com/login",
-        },
-        timeout=30,
-    )
-
-    if resp.status_code != 200:
-        raise RuntimeError(f"Помилка авторизації. HTTP {resp.status_code}: {resp.text[:300]}")
-
-    body = resp.json()
-    if not body.get("success"):
-        raise RuntimeError(f"Авторизація не вдалась: {body}")
-
-    sid = resp.cookies.get("_sid")
-    quizizz_uid = resp.cookies.get("quizizz_uid")
-
-    if not sid:
-        raise RuntimeError("_sid cookie не знайдено у відповіді login!")
-
-    session = requests.Session()
-    session.cookies.set("_sid", sid, domain="wayground.com")
-    if quizizz_uid:
-        session.cookies.set("quizizz_uid", quizizz_uid, domain="wayground.com")
-    session.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        "Origin": "https://wayground.com",
-        "Content-Type": "application/json",
-    })
-
-    user = body.get("data", {}).get("user", {})
-    name = f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
-    print(f"[✓] Авторизовано: {name} (id={user.get('id')})")
-
-    return session
+from upload_index import UploadIndex, image_digest
+from uploader import upload_bytes_to_wayground, upload_many
+from wayground_auth import credentials, get_session
 
 
 # ---------------------------------------------------------------------------
@@ -171,44 +118,32 @@ def get_image_dimensions(data: bytes) -> tuple[int, int]:
     return 800, 600
 
 
-def upload_image(session: requests.Session, image_path: Path) -> str:
+def upload_image(session: requests.Session, image_path: Path, index: UploadIndex | None = None) -> str:
     """
     Завантажує локальний файл на сервери Wayground/S3.
     Повертає finalUrl для вставки в структуру питання.
+    Якщо ці самі байти вже є в індексі завантажень, повторного upload не буде.
     """
     if not image_path.exists():
         raise FileNotFoundError(f"Файл не знайдено: {image_path}")
 
-    print(f"  [~] Завантажуємо {image_path.name}...")
     image_data = image_path.read_bytes()
     width, height = get_image_dimensions(image_data)
+    digest = image_digest(image_data)
+    if index is not None:
+        cached_url = index.lookup(digest, "wayground")
+        if cached_url:
+            print(f"  [✓] Уже завантажено: {cached_url}")
+            return cached_url, width, height
+
+    print(f"  [~] Завантажуємо {image_path.name}...")
     print(f"       розміри: {width}×{height}px")
 
-    # 1. Отримуємо pre-signed S3 URL
-    init_resp = session.post(
-        "https://media.quizizz.com/_mdserver/main/getUploadURL"
-        "?destination=quizzes&enableAcceleration=true",
-        timeout=30,
-    )
-    if init_resp.status_code != 200 or not init_resp.json().get("success"):
-        raise RuntimeError(f"Не вдалось отримати upload URL: {init_resp.text[:300]}")
-
-    res = init_resp.json()["data"]
-    signed_url: str = res["signedUrl"]
-    final_url: str = res["finalUrl"]
-
-    # 2. PUT бінарні дані на S3.
-    # S3 pre-signed URL підписаний з Content-Type: application/x-www-form-urlencoded —
-    # саме цей тип вказано в підписі, тому будь-який інший дасть 403 SignatureDoesNotMatch.
-    s3_resp = requests.put(
-        signed_url,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        data=image_data,
-        timeout=60,
-    )
-    if s3_resp.status_code != 200:
-        raise RuntimeError(f"Помилка S3 upload. HTTP {s3_resp.status_code}: {s3_resp.text[:200]}")
+    # getUploadURL + PUT на S3 — через спільний uploader (пул з'єднань, повтори, rate limit)
+    final_url = upload_bytes_to_wayground(session, image_data)
 
+    if index is not None:
+        index.record(digest, "wayground", final_url)
     print(f"  [✓] Завантажено: {final_url}")
     return final_url, width, height
 
@@ -294,14 +229,14 @@ def build_image_option(original_option: dict, image_url: str, width: int, height
 # PATCH питання на сервері
 # ---------------------------------------------------------------------------
 
-def patch_question(
+def patch_questions(
     session: requests.Session,
     quiz_id: str,
     version_id: str,
-    question: dict,
+    questions: list[dict],
 ) -> bool:
     """
-    Надсилає оновлену структуру одного питання через PATCH.
+    Надсилає оновлені структури кількох питань одним PATCH (поле `updates` приймає список).
     """
     url = (
         f"https://wayground.com/_quizserver/main/v3/quiz/"
@@ -309,7 +244,7 @@ def patch_question(
     )
     resp = session.patch(
         url,
-        json={"updates": [question]},
+        json={"updates": questions},
         headers={"Referer": f"https://wayground.com/admin/quiz/{quiz_id}/edit"},
         timeout=30,
     )
@@ -319,6 +254,18 @@ def patch_question(
     return False
 
 
+def patch_question(
+    session: requests.Session,
+    quiz_id: str,
+    version_id: str,
+    question: dict,
+) -> bool:
+    """
+    Надсилає оновлену структуру одного питання через PATCH.
+    """
+    return patch_questions(session, quiz_id, version_id, [question])
+
+
 # ---------------------------------------------------------------------------
 # Головна логіка
 # ---------------------------------------------------------------------------
@@ -329,10 +276,12 @@ def process_mapping(
     mapping: list[dict],
     mapping_dir: Path,
     dry_run: bool = False,
+    batch_size: int = 10,
 ) -> None:
     """
-    Основний цикл: для кожного запису в маппінгу завантажує зображення
-    і оновлює відповідний варіант відповіді.
+    Основний цикл: завантажує всі зображення маппінгу (паралельно), підміняє
+    варіанти відповідей локально — усі варіанти одного питання разом — і
+    зберігає змінені питання PATCH-ами по `batch_size` питань.
     """
     version_id, questions = get_quiz(session, quiz_id)
 
@@ -340,6 +289,29 @@ def process_mapping(
 
     success_count = 0
     error_count = 0
+    index = UploadIndex(enabled=not dry_run)
+
+    # Локальні зображення завантажуємо наперед, паралельно; далі — лише локальні зміни і PATCH-і
+    uploads: dict[Path, tuple | Exception] = {}
+    if not dry_run:
+        local_paths = list(dict.fromkeys(
+            (mapping_dir / entry["image_path"]).resolve()
+            for entry in mapping
+            if not entry["image_path"].startswith(("http://", "https://"))
+        ))
+
+        def safe_upload(path: Path) -> tuple | Exception:
+            try:
+                return upload_image(session, path, index)
+            except (FileNotFoundError, RuntimeError, ValueError, requests.RequestException) as e:
+                return e
+
+        if local_paths:
+            print(f"[~] Завантажуємо {len(local_paths)} зображень паралельно...")
+            uploads = dict(zip(local_paths, upload_many(local_paths, safe_upload)))
+
+    # question_index → кількість записів маппінгу, застосованих до цього питання
+    changed: dict[int, int] = {}
 
     for i, entry in enumerate(mapping):
         q_idx: int = entry["question_index"]
@@ -382,25 +354,31 @@ def process_mapping(
 
         # Завантажуємо зображення (лише для локальних файлів)
         if not (img_rel.startswith("http://") or img_rel.startswith("https://")):
-            try:
-                final_url, width, height = upload_image(session, image_path)
-            except (FileNotFoundError, RuntimeError) as e:
-                print(f"  [X] {e}")
+            result = uploads[image_path]
+            if isinstance(result, Exception):
+                print(f"  [X] {result}")
                 error_count += 1
                 continue
+            final_url, width, height = result
 
-        # Підміняємо варіант відповіді
+        # Підміняємо варіант відповіді локально; на сервер питання піде одним PATCH з усіма варіантами
         updated_option = build_image_option(options[opt_idx], final_url, width, height)
         question["structure"]["options"][opt_idx] = updated_option
+        changed[q_idx] = changed.get(q_idx, 0) + 1
+
+    index.close()
 
-        # Зберігаємо на сервері
-        if patch_question(session, quiz_id, version_id, question):
+    # Зберігаємо на сервері: змінені питання пачками по batch_size
+    pending = sorted(changed)
+    for start in range(0, len(pending), max(1, batch_size)):
+        batch = pending[start:start + max(1, batch_size)]
+        entries = sum(changed[q_idx] for q_idx in batch)
+        print(f"[~] PATCH питань {', '.join(f'#{q_idx+1}' for q_idx in batch)} ({entries} варіантів)...")
+        if patch_questions(session, quiz_id, version_id, [questions[q_idx] for q_idx in batch]):
             print(f"  [✓] Збережено!")
-            success_count += 1
-            # Оновлюємо локальну копію питань щоб наступні PATCH містили актуальний стан
-            questions[q_idx] = question
+            success_count += entries
         else:
-            error_count += 1
+            error_count += entries
 
     print(f"\n{'='*50}")
     print(f"Готово! Успішно: {success_count}, Помилок: {error_count}")
@@ -412,28 +390,6 @@ def process_mapping(
 # CLI
 # ---------------------------------------------------------------------------
 
-def load_credentials() -> tuple[str, str]:
-    """
-    Читає WAYGROUND_EMAIL / WAYGROUND_PASSWORD з .env файлу або змінних середовища.
-    .env шукається в директорії скрипту і в поточній директорії.
-    """
-    # Спробуємо завантажити .env вручну (без python-dotenv)
-    for env_dir in [Path(__file__).parent, Path.cwd()]:
-        env_file = env_dir / ".env"
-        if env_file.exists():
-            for line in env_file.read_text().splitlines():
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, val = line.partition("=")
-                    # Не перезаписуємо вже встановлені змінні середовища
-                    os.environ.setdefault(key.strip(), val.strip().strip('"').strip("'"))
-            break
-
-    email = os.environ.get("WAYGROUND_EMAIL", "")
-    password = os.environ.get("WAYGROUND_PASSWORD", "")
-    return email, password
-
-
 def main():
     parser = argparse.ArgumentParser(
         description="Додає зображення до варіантів відповідей у тесті Wayground.",
@@ -461,6 +417,8 @@ Credentials (один з варіантів):
     parser.add_argument("--email", help="Email для Wayground (або WAYGROUND_EMAIL у .env)")
     parser.add_argument("--password", help="Пароль для Wayground (або WAYGROUND_PASSWORD у .env)")
     parser.add_argument("--dry-run", action="store_true", help="Перевірити маппінг без реальних змін")
+    parser.add_argument("--batch-size", type=int, default=10,
+                        help="Скільки питань зберігати одним PATCH (за замовчуванням: 10)")
 
     args = parser.parse_args()
 
@@ -469,9 +427,7 @@ Credentials (один з варіантів):
         parser.error("Треба вказати --list або --mapping")
 
     # Credentials
-    env_email, env_password = load_credentials()
-    email = args.email or env_email
-    password = args.password or env_password
+    email, password = credentials(args.email, args.password)
 
     if not email or not password:
         print("[X] Credentials не знайдено.")
@@ -480,7 +436,7 @@ Credentials (один з варіантів):
 
     # Авторизація
     try:
-        session = login(email, password)
+        session = get_session(email, password)
     except RuntimeError as e:
         print(f"[X] {e}")
         sys.exit(1)
@@ -514,7 +470,8 @@ Credentials (один з варіантів):
         print("[~] Режим DRY-RUN — реальних змін не буде\n")
 
     try:
-        process_mapping(session, args.quiz_id, mapping, mapping_dir, dry_run=args.dry_run)
+        process_mapping(session, args.quiz_id, mapping, mapping_dir, dry_run=args.dry_run,
+                        batch_size=args.batch_size)
     except RuntimeError as e:
         print(f"[X] {e}")
         sys.exit(1)
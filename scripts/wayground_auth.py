@@ -0,0 +1,233 @@
+"""
+wayground_auth.py — спільна авторизація Wayground для всіх скриптів.
+
+  - .env парситься один раз за процес (`load_env`): корінь репозиторію, scripts/
+    і поточна директорія; вже встановлені змінні середовища не перезаписуються;
+  - cookie `_sid` після логіну зберігається разом із терміном дії в кеші
+    користувача (~/.cache/kostyl/wayground-session.json, лише для власника),
+    тож логін відбувається раз на добу, а не на кожен запуск скрипту;
+  - `get_session()` бере cookie з кешу і перевіряє його одним легким запитом;
+    заново логіниться лише якщо сесія протухла (401 / редирект на логін);
+  - 401 посеред роботи → один прозорий повторний логін і повтор запиту.
+
+Використання:
+  from wayground_auth import credentials, get_session
+
+  email, password = credentials(args.email, args.password)
+  session = get_session(email, password)
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+
+import requests
+
+from content_manifest import ROOT
+
+LOGIN_URL = "https://wayground.com/_authserver/public/public/v1/auth/login/local"
+# Легка перевірка сесії: адмінка без сесії редиректить на /login
+CHECK_URL = "https://wayground.com/admin"
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/149.0.0.0 Safari/537.36"
+
+CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "kostyl", "wayground-session.json",
+)
+# Якщо сервер не вказав термін дії cookie — вважаємо сесію дійсною добу
+DEFAULT_TTL = 24 * 3600
+# Cookie, що протухне раніше ніж за цей час, не використовуємо
+EXPIRY_MARGIN = 10 * 60
+AUTH_COOKIES = ("_sid", "quizizz_uid")
+
+_login_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def load_env() -> None:
+    """Читає .env (без python-dotenv) один раз за процес."""
+    for env_dir in dict.fromkeys([ROOT, os.path.join(ROOT, "scripts"), os.getcwd()]):
+        env_file = os.path.join(env_dir, ".env")
+        if not os.path.exists(env_file):
+            continue
+        with open(env_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#") and "=" in line:
+                    key, _, val = line.partition("=")
+                    # Не перезаписуємо вже встановлені змінні середовища
+                    os.environ.setdefault(key.strip(), val.strip().strip('"').strip("'"))
+
+
+def credentials(email: str | None = None, password: str | None = None) -> tuple[str, str]:
+    """(email, пароль): аргументи CLI мають пріоритет над WAYGROUND_EMAIL / WAYGROUND_PASSWORD."""
+    load_env()
+    return (
+        email or os.environ.get("WAYGROUND_EMAIL", ""),
+        password or os.environ.get("WAYGROUND_PASSWORD", ""),
+    )
+
+
+def catbox_userhash() -> str:
+    """CATBOX_USERHASH з .env або змінних середовища ("" — якщо немає)."""
+    load_env()
+    return os.environ.get("CATBOX_USERHASH", "")
+
+
+# ---------------------------------------------------------------------------
+# Кеш cookie
+# ---------------------------------------------------------------------------
+
+def _load_cached(email: str) -> dict | None:
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("email") != email or not cached.get("cookies", {}).get("_sid"):
+        return None
+    if cached.get("expires", 0) - EXPIRY_MARGIN < time.time():
+        return None
+    return cached
+
+
+def _save_cached(email: str, cookies: dict, expires: float) -> None:
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    tmp = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    # Cookie — фактично пароль: файл доступний лише власнику
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"email": email, "cookies": cookies, "expires": expires}, f)
+    os.replace(tmp, CACHE_PATH)
+
+
+def clear_cache() -> None:
+    try:
+        os.remove(CACHE_PATH)
+    except OSError:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Сесія
+# ---------------------------------------------------------------------------
+
+def _new_session(cookies: dict) -> requests.Session:
+    session = requests.Session()
+    for name, value in cookies.items():
+        session.cookies.set(name, value, domain="wayground.com")
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Origin": "https://wayground.com",
+        "Content-Type": "application/json",
+    })
+    return session
+
+
+def _login(email: str, password: str) -> tuple[dict, float, dict]:
+    """
+    POST логіну. Повертає (cookies, термін дії _sid, user).
+    Будь-яка невдача (мережа, не-JSON відповідь, відмова) — RuntimeError.
+    """
+    try:
+        resp = requests.post(
+            LOGIN_URL,
+            json={"username": email, "password": password, "requestId": str(uuid.uuid4())},
+            headers={
+                "Content-Type": "application/json",
+                "User-Agent": USER_AGENT,
+                "Origin": "https://wayground.com",
+                "Referer": "https://wayground.com/login",
+            },
+            timeout=30,
+        )
+    except requests.RequestException as e:
+        raise RuntimeError(f"Помилка авторизації: {e}") from e
+    try:
+        body = resp.json()
+    except ValueError:
+        body = {}
+    if resp.status_code != 200 or not isinstance(body, dict) or not body.get("success"):
+        raise RuntimeError(f"Помилка авторизації. HTTP {resp.status_code}: {resp.text[:300]}")
+
+    cookies = {c.name: c.value for c in resp.cookies if c.name in AUTH_COOKIES}
+    if not cookies.get("_sid"):
+        raise RuntimeError("_sid cookie не знайдено у відповіді login")
+    sid_expires = next((c.expires for c in resp.cookies if c.name == "_sid"), None)
+    expires = float(sid_expires) if sid_expires else time.time() + DEFAULT_TTL
+    return cookies, expires, (body.get("data") or {}).get("user", {})
+
+
+def is_valid(session: requests.Session) -> bool:
+    """Один легкий запит: False лише якщо сервер явно не впізнав сесію."""
+    try:
+        r = session.get(CHECK_URL, allow_redirects=False, stream=True, timeout=15)
+    except requests.RequestException:
+        # Мережа — не привід логінитись заново; справжній 401 зловить хук сесії
+        return True
+    r.close()
+    if r.status_code in (401, 403):
+        return False
+    return not (r.is_redirect and "/login" in r.headers.get("Location", ""))
+
+
+def _install_relogin(session: requests.Session, email: str, password: str) -> None:
+    """401 посеред роботи → логін заново (один на всі потоки) і повтор запиту."""
+
+    def on_response(resp, *args, **kwargs):
+        if resp.status_code != 401 or resp.request.url == LOGIN_URL or getattr(resp.request, "_relogin", False):
+            return resp
+        stale = resp.request.headers.get("Cookie", "")
+        if "_sid=" not in stale:
+            return resp
+        with _login_lock:
+            # Інший потік міг уже оновити cookie, поки ми чекали лок
+            if f"_sid={session.cookies.get('_sid')}" in stale:
+                print("[~] Сесія Wayground протухла — логінимось заново...")
+                cookies, expires, _ = _login(email, password)
+                _save_cached(email, cookies, expires)
+                for name, value in cookies.items():
+                    session.cookies.set(name, value, domain="wayground.com")
+        request = resp.request.copy()
+        del request.headers["Cookie"]
+        request.prepare_cookies(session.cookies)
+        request._relogin = True
+        return session.send(request, **{k: v for k, v in kwargs.items() if k in ("stream", "timeout", "verify", "cert", "proxies")})
+
+    session.hooks["response"].append(on_response)
+
+
+def login(email: str, password: str) -> requests.Session:
+    """Завжди новий логін; cookie записується в кеш для наступних запусків."""
+    print(f"[~] Авторизація як {email}...")
+    with _login_lock:
+        cookies, expires, user = _login(email, password)
+        _save_cached(email, cookies, expires)
+    session = _new_session(cookies)
+    _install_relogin(session, email, password)
+    name = f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
+    print(f"[✓] Авторизовано: {name}")
+    return session
+
+
+def get_session(email: str | None = None, password: str | None = None) -> requests.Session:
+    """
+    Авторизована сесія: з кешованого `_sid` (якщо він живий), інакше — логін.
+    RuntimeError, якщо немає credentials або логін не вдався.
+    """
+    email, password = credentials(email, password)
+    if not email or not password:
+        raise RuntimeError("Credentials не знайдено. Створи .env або передай --email / --password")
+
+    cached = _load_cached(email)
+    if cached:
+        session = _new_session(cached["cookies"])
+        if is_valid(session):
+            _install_relogin(session, email, password)
+            print(f"[✓] Авторизовано як {email} (збережена сесія)")
+            return session
+        clear_cache()
+    return login(email, password)
@@ -1,35 +1,60 @@
 #!/usr/bin/env python3
 """
-wayground_import.py — Автоматичний імпорт xlsx-тесту в Wayground.
+wayground_import.py — Автоматичний імпорт тесту (JSON або xlsx) в Wayground.
 
 Pipeline:
-  1. Логін → отримати _sid cookie
-  2. Завантажити .xlsx на S3 через Wayground media API
-  3. POST /upload-quiz → розпарсити питання з xlsx
-  4. POST /v3/quiz → створити порожній тест, отримати quiz_id + version_id
-  5. POST /questions → додати всі питання у тест
-  6. Вивести посилання на готовий тест
+  1. Логін → _sid cookie (wayground_auth.py: збережена сесія або новий логін)
+  2. Питання:
+     - .json — напряму (quiz_questions.py): код → зображення, нормалізація, extracted;
+     - .xlsx — завантажити на S3 через Wayground media API і розпарсити через POST /upload-quiz
+  3. POST /v3/quiz → створити порожній тест, отримати quiz_id + version_id
+  4. POST /questions → додати всі питання у тест
+  5. Вивести посилання на готовий тест
+
+JSON — основний шлях: без двох серіалізацій у таблицю, S3 upload і серверного
+парсингу. xlsx (wayground_exporter.py) лишається як опціональний артефакт.
 
 Використання:
+  python3 wayground_import.py <шлях_до_json>
   python3 wayground_import.py <шлях_до_xlsx>
   python3 wayground_import.py <шлях_до_xlsx> --name "Назва тесту"
   python3 wayground_import.py <шлях_до_xlsx> --name "Назва" --lang uk
   python3 wayground_import.py <шлях_до_xlsx> --batch-size 5   # питань за один POST
+  python3 wayground_import.py <шлях_до_xlsx> --resume          # продовжити перерваний імпорт
+  python3 wayground_import.py <папка або glob> --workers 4      # пакетний імпорт, один логін
+
+Прогрес імпорту (quiz_id, version_id, підтверджені батчі) пишеться в журнал
+.content-cache/imports/, тож після збою --resume продовжує з останнього
+підтвердженого батчу замість створення нового тесту. Після таймауту батч не
+повторюється наосліп: спершу звіряється кількість питань на сервері. Пакетний імпорт пише
+JSON-звіт (назва → quiz_id, кількість питань, статус публікації) у --report.
 
-Credentials — з .env поряд зі скриптом або зі змінних середовища:
+Credentials — з .env (корінь репозиторію, scripts/ або поточна папка) чи змінних середовища:
   WAYGROUND_EMAIL=...
   WAYGROUND_PASSWORD=...
 """
 
 import os
 import sys
+import glob
+import time
 import uuid
 import json
+import hashlib
 import argparse
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import quote
 
+from batch_runner import STATE_DIR, atomic_write
+from quiz_questions import load_questions, normalize_question, process_code_blocks, to_extracted
+from wayground_auth import catbox_userhash, credentials, get_session
+
+
+JOURNAL_DIR = os.path.join(STATE_DIR, "imports")
+MAX_RETRIES = 4
+BACKOFF_BASE = 2.0  # 2, 4, 8, 16 с
 
 XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
@@ -43,60 +68,7 @@ QUESTION_THEME = {
 
 
 # ---------------------------------------------------------------------------
-# Auth (shared з wayground_add_images.py)
-# ---------------------------------------------------------------------------
-
-def load_credentials() -> tuple[str, str]:
-    for env_dir in [Path(__file__).parent, Path.cwd()]:
-        env_file = env_dir / ".env"
-        if env_file.exists():
-            for line in env_file.read_text().splitlines():
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, val = line.partition("=")
-                    os.environ.setdefault(key.strip(), val.strip().strip('"').strip("'"))
-            break
-    return os.environ.get("WAYGROUND_EMAIL", ""), os.environ.get("WAYGROUND_PASSWORD", "")
-
-
-def login(email: str, password: str) -> requests.Session:
-    print(f"[~] Авторизація як {email}...")
-    resp = requests.post(
-        "https://wayground.com/_authserver/public/public/v1/auth/login/local",
-        json={"username": email, "password": password, "requestId": str(uuid.uuid4())},
-        headers={
-            "Content-Type": "application/json",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            "Origin": "https://wayground.com",
-        },
-        timeout=30,
-    )
-    if resp.status_code != 200 or not resp.json().get("success"):
-        raise RuntimeError(f"Помилка авторизації. HTTP {resp.status_code}: {resp.text[:200]}")
-
-    sid = resp.cookies.get("_sid")
-    quizizz_uid = resp.cookies.get("quizizz_uid")
-    if not sid:
-        raise RuntimeError("_sid cookie не знайдено у відповіді login")
-
-    session = requests.Session()
-    session.cookies.set("_sid", sid, domain="wayground.com")
-    if quizizz_uid:
-        session.cookies.set("quizizz_uid", quizizz_uid, domain="wayground.com")
-    session.headers.update({
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/149.0.0.0 Safari/537.36",
-        "Origin": "https://wayground.com",
-        "Content-Type": "application/json",
-    })
-
-    user = resp.json().get("data", {}).get("user", {})
-    name = f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
-    print(f"[✓] Авторизовано: {name}")
-    return session
-
-
-# ---------------------------------------------------------------------------
-# Крок 1: Завантаження xlsx на S3
+# Крок 1: Питання — xlsx через S3 + upload-quiz або JSON напряму
 # ---------------------------------------------------------------------------
 
 def upload_xlsx(session: requests.Session, xlsx_path: Path) -> list[dict]:
@@ -172,6 +144,32 @@ def upload_xlsx(session: requests.Session, xlsx_path: Path) -> list[dict]:
     return extracted
 
 
+def load_json(json_path: Path, jobs: int | None = None) -> list[dict]:
+    """
+    Питання з JSON напряму у формат extracted (без xlsx і upload-quiz):
+    блоки коду → зображення (Image Link), нормалізація відповідей, конвертація.
+    """
+    print(f"[~] Читаємо {json_path.name}...")
+    try:
+        questions = load_questions(str(json_path))
+    except ValueError as e:
+        raise RuntimeError(str(e))
+
+    process_code_blocks(questions, jobs, catbox_userhash())
+
+    extracted = []
+    for i, q in enumerate(questions, 1):
+        try:
+            extracted.append(to_extracted(normalize_question(q)))
+        except ValueError as e:
+            raise RuntimeError(f"Питання {i}: {e}")
+
+    images_count = sum(1 for e in extracted if e.get("url"))
+    img_note = f", {images_count} з зображеннями" if images_count else ""
+    print(f"[✓] Підготовлено {len(extracted)} питань{img_note}")
+    return extracted
+
+
 # ---------------------------------------------------------------------------
 # Крок 2: Створення порожнього тесту
 # ---------------------------------------------------------------------------
@@ -322,51 +320,214 @@ def build_question(extracted: dict) -> dict:
     }
 
 
+# ---------------------------------------------------------------------------
+# Журнал імпорту (для --resume)
+# ---------------------------------------------------------------------------
+
+class ImportJournal:
+    """
+    Чекпоінт імпорту одного файлу: quiz_id, version_id, розпарсені питання
+    і підтверджені сервером батчі [start, end). Пишеться атомарно після кожного кроку.
+    """
+
+    def __init__(self, source: Path):
+        self.source = source
+        key = hashlib.sha256(str(source.resolve()).encode("utf-8")).hexdigest()[:12]
+        self.path = os.path.join(JOURNAL_DIR, f"{source.stem}-{key}.json")
+        self.data: dict = {}
+
+    @staticmethod
+    def source_hash(source: Path) -> str:
+        return hashlib.sha256(source.read_bytes()).hexdigest()
+
+    def load(self) -> bool:
+        """Читає журнал; False, якщо його немає або файл-джерело відтоді змінився."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+            return False
+        return self.data.get("source_sha256") == self.source_hash(self.source)
+
+    def start(self, quiz_id: str, version_id: str, name: str, extracted: list[dict]) -> None:
+        self.data = {
+            "source": str(self.source),
+            "source_sha256": self.source_hash(self.source),
+            "quiz_id": quiz_id,
+            "version_id": version_id,
+            "name": name,
+            "extracted": extracted,
+            "batches": [],
+            "published": False,
+        }
+        self.save()
+
+    def ack(self, start: int, end: int) -> None:
+        self.data["batches"].append([start, end])
+        self.save()
+
+    @property
+    def acknowledged(self) -> int:
+        """Скільки питань від початку підтверджено сервером (неперервний префікс)."""
+        done = 0
+        for start, end in sorted(self.data.get("batches", [])):
+            if start > done:
+                break
+            done = max(done, end)
+        return done
+
+    def save(self) -> None:
+        os.makedirs(JOURNAL_DIR, exist_ok=True)
+        atomic_write(self.path, json.dumps(self.data, ensure_ascii=False, indent=1))
+
+
 # ---------------------------------------------------------------------------
 # Крок 4: Додавання питань до тесту
 # ---------------------------------------------------------------------------
 
+def _post_batch(session: requests.Session, url: str, referer: str, questions: list[dict], index: int):
+    """
+    Один POST батчу з повторами на 5xx / 429.
+    Повертає (відповідь | None, чи варто зменшити батч, виняток мережі | None).
+    Таймаут і обрив з'єднання тут не повторюються: сервер міг уже додати батч,
+    а POST /questions не ідемпотентний — рішення приймає `import_questions`.
+    """
+    r = None
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            r = session.post(
+                url,
+                json={"questions": questions, "index": index, "aiMeta": {}},
+                headers={"Referer": referer},
+                timeout=60,
+            )
+        except requests.Timeout as e:
+            # Великий батч не встигає обробитись — зменшуємо, а не повторюємо той самий
+            return None, True, e
+        except requests.ConnectionError as e:
+            return None, False, e
+        if r.status_code == 413:
+            return r, True, None
+        if r.status_code not in (429, 500, 502, 503, 504):
+            return r, False, None
+        if attempt < MAX_RETRIES:
+            delay = BACKOFF_BASE * 2 ** attempt
+            print(f"  [~] HTTP {r.status_code}, повтор через {delay:.0f} с...")
+            time.sleep(delay)
+    return r, False, None
+
+
+def questions_url(quiz_id: str, version_id: str) -> str:
+    return (
+        f"https://wayground.com/_quizserver/main/v3/quiz/"
+        f"{quiz_id}/version/{version_id}/questions"
+    )
+
+
+def count_questions(session: requests.Session, url: str, referer: str) -> int | None:
+    """Скільки питань зараз у версії тесту на сервері (None — не вдалось дізнатись)."""
+    try:
+        r = session.get(url, headers={"Referer": referer}, timeout=30)
+        if r.status_code == 200 and r.json().get("success"):
+            return len(r.json()["data"]["questions"])
+    except (requests.RequestException, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
 def import_questions(
     session: requests.Session,
     quiz_id: str,
     version_id: str,
     extracted_questions: list[dict],
     batch_size: int = 10,
+    journal: ImportJournal | None = None,
+    start: int = 0,
 ) -> int:
     """
-    Конвертує та додає питання до тесту батчами.
-    Повертає кількість успішно доданих питань.
+    Конвертує та додає питання до тесту батчами, починаючи з `start`.
+    Розмір батчу адаптивний: на 413 / таймаут — удвічі менший, після успіху
+    росте назад до `batch_size`, але не до розміру, що вже не пройшов.
+    Після таймауту чи обриву з'єднання батч не надсилається наосліп: спершу
+    перечитується кількість питань на сервері (тест створено цим скриптом, тож
+    вона дорівнює кількості вже доданих), і застосований батч зараховується.
+    Кожен підтверджений батч пишеться в `journal`.
+    На батчі, що не пройшов і після повторів, імпорт зупиняється (продовжити — --resume).
+    Повертає кількість успішно доданих питань (разом з уже доданими до `start`).
     """
-    url = (
-        f"https://wayground.com/_quizserver/main/v3/quiz/"
-        f"{quiz_id}/version/{version_id}/questions"
-    )
+    url = questions_url(quiz_id, version_id)
     referer = f"https://wayground.com/admin/quiz/{quiz_id}/edit"
 
     total = len(extracted_questions)
-    added = 0
+    added = start
+    size = max(1, batch_size)
+    ceiling = size  # найбільший розмір, який ще не отримував 413 / таймаут
+    pos = start
+    failures = 0  # мережеві збої поспіль
 
-    for batch_start in range(0, total, batch_size):
-        batch = extracted_questions[batch_start : batch_start + batch_size]
-        batch_end = batch_start + len(batch)
+    while pos < total:
+        batch = extracted_questions[pos : pos + size]
+        batch_end = pos + len(batch)
 
-        print(f"[~] Додаємо питання {batch_start + 1}–{batch_end} з {total}...")
+        print(f"[~] Додаємо питання {pos + 1}–{batch_end} з {total}...")
 
         questions = [build_question(e) for e in batch]
-
-        r = session.post(
-            url,
-            json={"questions": questions, "index": batch_start, "aiMeta": {}},
-            headers={"Referer": referer},
-            timeout=60,
-        )
+        r, shrink, error = _post_batch(session, url, referer, questions, pos)
+
+        if error is not None:
+            print(f"  [~] {type(error).__name__}: {error}")
+            on_server = count_questions(session, url, referer)
+            if on_server is None:
+                print(f"  [X] Батч {pos + 1}–{batch_end}: {type(error).__name__}, а кількість питань "
+                      "на сервері невідома — не надсилаємо повторно, щоб не задублювати")
+                print("  [X] Імпорт зупинено. Продовжити: той самий запуск з --resume")
+                break
+            if on_server > pos:
+                # Сервер встиг додати батч (або його частину), просто не відповів
+                done = min(on_server, batch_end)
+                print(f"  [✓] Сервер уже містить питання до {done} — не надсилаємо повторно")
+                added += done - pos
+                if journal is not None:
+                    journal.ack(pos, done)
+                pos = done
+                failures = 0
+                continue
+            failures += 1
+            if failures > MAX_RETRIES:
+                print(f"  [X] Помилка батчу {pos + 1}–{batch_end}. {type(error).__name__}: {error}")
+                print("  [X] Імпорт зупинено. Продовжити: той самий запуск з --resume")
+                break
+            if shrink and size > 1:
+                ceiling = size - 1
+                size = max(1, size // 2)
+                print(f"  [~] Батч завеликий — зменшуємо до {size}")
+            else:
+                delay = BACKOFF_BASE * 2 ** (failures - 1)
+                print(f"  [~] Повтор через {delay:.0f} с...")
+                time.sleep(delay)
+            continue
 
         if r.status_code in (200, 201) and r.json().get("success"):
             count = len(r.json().get("data", {}).get("questions", []))
             added += count
             print(f"  [✓] Додано {count} питань")
-        else:
-            print(f"  [X] Помилка батчу {batch_start}–{batch_end}. HTTP {r.status_code}: {r.text[:300]}")
+            if journal is not None:
+                journal.ack(pos, batch_end)
+            pos = batch_end
+            size = min(ceiling, size * 2)
+            failures = 0
+            continue
+
+        if shrink and size > 1:
+            ceiling = size - 1
+            size = max(1, size // 2)
+            print(f"  [~] Батч завеликий — зменшуємо до {size}")
+            continue
+
+        print(f"  [X] Помилка батчу {pos + 1}–{batch_end}. HTTP {r.status_code}: {r.text[:300]}")
+        print("  [X] Імпорт зупинено. Продовжити: той самий запуск з --resume")
+        break
 
     return added
 
@@ -436,30 +597,193 @@ def publish_quiz(
     return True
 
 
+# ---------------------------------------------------------------------------
+# Повний pipeline одного тесту і пакетний імпорт
+# ---------------------------------------------------------------------------
+
+def import_quiz(
+    session: requests.Session,
+    source: Path,
+    name: str,
+    lang: str = "uk",
+    *,
+    batch_size: int = 10,
+    publish: bool = True,
+    resume: bool = False,
+    jobs: int | None = None,
+) -> dict:
+    """
+    Питання → тест → додавання → публікація для одного файлу (.json або .xlsx).
+    Повертає звіт: name, source, quiz_id, questions, added, published,
+    status ("ok" / "partial" / "error") і error. Для "ok" error задано, якщо
+    публікацію просили, але вона не вдалася (повторити — --resume).
+    """
+    report = {
+        "name": name,
+        "source": str(source),
+        "quiz_id": None,
+        "questions": 0,
+        "added": 0,
+        "published": False,
+        "status": "error",
+        "error": None,
+    }
+    journal = ImportJournal(source)
+
+    try:
+        resuming = resume and journal.load()
+        if resume and not resuming:
+            print(f"[~] {source.name}: журналу немає (або файл змінився) — починаємо новий імпорт")
+
+        if resuming:
+            # Тест уже створено, питання розпарсено — беремо все з журналу
+            quiz_id = journal.data["quiz_id"]
+            version_id = journal.data["version_id"]
+            extracted = journal.data["extracted"]
+            name = journal.data.get("name", name)
+            start = journal.acknowledged
+            # Батч міг дійти до сервера, але не потрапити в журнал (збій до ack)
+            on_server = count_questions(session, questions_url(quiz_id, version_id),
+                                        f"https://wayground.com/admin/quiz/{quiz_id}/edit")
+            if on_server is not None and start < on_server <= len(extracted):
+                print(f"[~] На сервері вже {on_server} питань (у журналі {start}) — не надсилаємо їх повторно")
+                journal.ack(start, on_server)
+                start = on_server
+            print(f"[~] Продовжуємо імпорт у quiz_id={quiz_id}: {start} з {len(extracted)} питань уже додано")
+        else:
+            # 1. Питання: JSON напряму або upload + parse xlsx
+            if source.suffix.lower() == ".json":
+                extracted = load_json(source, jobs)
+            else:
+                extracted = upload_xlsx(session, source)
+
+            # 2. Створити тест
+            quiz_id, version_id = create_quiz(session, name, lang)
+            journal.start(quiz_id, version_id, name, extracted)
+            start = 0
+        report.update(quiz_id=quiz_id, questions=len(extracted))
+
+        # 3. Додати питання
+        print(f"[~] Імпортуємо {len(extracted) - start} питань (batch_size={batch_size})...")
+        added = import_questions(session, quiz_id, version_id, extracted, batch_size,
+                                 journal=journal, start=start)
+        report["added"] = added
+        if added < len(extracted):
+            report["status"] = "partial"
+            report["error"] = f"додано {added} з {len(extracted)} питань (продовжити — --resume)"
+            return report
+
+        # 4. Публікація
+        if not journal.data.get("published") and publish:
+            journal.data["published"] = publish_quiz(session, quiz_id, version_id, name, lang)
+            journal.save()
+        report["published"] = bool(journal.data.get("published"))
+        report["status"] = "ok"
+        if publish and not report["published"]:
+            report["error"] = "публікація не вдалася (повторити — --resume)"
+    except (RuntimeError, requests.RequestException) as e:
+        report["error"] = str(e)
+        print(f"[X] {source.name}: {e}")
+    except Exception as e:
+        # Збій одного тесту (файл зник, битий xlsx чи журнал) не зупиняє пакетний імпорт
+        report["error"] = f"{type(e).__name__}: {e}"
+        print(f"[X] {source.name}: {report['error']}")
+    return report
+
+
+def collect_sources(inputs: list[str]) -> list[Path]:
+    """
+    Файли, папки (усі .json і .xlsx у ній) і glob-шаблони → список тестів.
+    Якщо поряд лежать X.json і X.xlsx, береться JSON (xlsx — лише похідний артефакт).
+    """
+    paths: list[Path] = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(Path(item).glob("*.json")) + sorted(Path(item).glob("*.xlsx")))
+        elif glob.has_magic(item):
+            paths.extend(Path(p) for p in sorted(glob.glob(item, recursive=True)))
+        else:
+            paths.append(Path(item))
+
+    seen: dict[Path, Path] = {}
+    for path in paths:
+        path = path.resolve()
+        if path.suffix.lower() not in (".json", ".xlsx"):
+            continue
+        key = path.with_suffix("")
+        if key not in seen or path.suffix.lower() == ".json":
+            seen[key] = path
+    return sorted(seen.values())
+
+
+def import_many(session: requests.Session, sources: list[Path], lang: str = "uk", *, workers: int = 4, **options) -> list[dict]:
+    """
+    Імпортує багато тестів однією сесією: `workers` pipeline-ів паралельно
+    (кожен — create → questions → publish). Звіти — у порядку `sources`.
+    """
+    total = len(sources)
+    reports: dict[Path, dict] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, total))) as executor:
+        futures = {
+            executor.submit(import_quiz, session, source, source.stem, lang, **options): source
+            for source in sources
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            report = future.result()
+            reports[futures[future]] = report
+            mark = {"ok": "~" if report["error"] else "✓", "partial": "~"}.get(report["status"], "X")
+            print(f"[{mark}] [{done}/{total}] {report['name']}: {report['added']}/{report['questions']} питань"
+                  + (f", quiz_id={report['quiz_id']}" if report["quiz_id"] else "")
+                  + (f" — {report['error']}" if report["error"] else ""))
+    return [reports[source] for source in sources]
+
+
+def print_report_table(reports: list[dict]) -> None:
+    width = max([len(r["name"]) for r in reports] + [5])
+    print(f"{'Назва':<{width}}  {'Питань':>9}  {'Статус':<12}  quiz_id")
+    print("-" * (width + 45))
+    for r in reports:
+        if r["status"] == "ok":
+            # error у статусі "ok" — публікація не вдалася
+            status = "опубліковано" if r["published"] else "не опубл." if r["error"] else "чернетка"
+        else:
+            status = r["status"]
+        counts = f"{r['added']}/{r['questions']}"
+        print(f"{r['name']:<{width}}  {counts:>9}  {status:<12}  {r['quiz_id'] or '-'}")
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Автоматичний імпорт xlsx-тесту в Wayground.",
+        description="Автоматичний імпорт тесту (JSON або xlsx) в Wayground.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Приклади:
+  python3 wayground_import.py tests/my_test.json
   python3 wayground_import.py tests/my_test.xlsx
   python3 wayground_import.py tests/my_test.xlsx --name "Python ООП"
   python3 wayground_import.py tests/my_test.xlsx --name "Python ООП" --lang uk --batch-size 5
   python3 wayground_import.py tests/my_test.xlsx --name "Python ООП" --no-publish
+  python3 wayground_import.py tests/my_test.xlsx --resume
+  python3 wayground_import.py tests/02.cpp/ --workers 4             # усі тести папки
+  python3 wayground_import.py "tests/**/*.json" --report report.json
 
 Credentials — з .env або змінних середовища:
   WAYGROUND_EMAIL=...
   WAYGROUND_PASSWORD=...
         """,
     )
-    parser.add_argument("xlsx", help="Шлях до .xlsx файлу")
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Шлях до .json (напряму) або .xlsx файлу; для пакетного імпорту — кілька файлів, папка або glob",
+    )
     parser.add_argument(
         "--name",
-        help="Назва тесту (за замовчуванням — ім'я файлу без розширення)",
+        help="Назва тесту (за замовчуванням — ім'я файлу без розширення; лише для одного файлу)",
     )
     parser.add_argument(
         "--lang",
@@ -471,79 +795,133 @@ Credentials — з .env або змінних середовища:
         type=int,
         default=10,
         metavar="N",
-        help="Кількість питань за один POST запит (за замовчуванням: 10)",
+        help="Максимальна кількість питань за один POST запит (за замовчуванням: 10)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Продовжити перерваний імпорт цього файлу з журналу (без нового тесту)",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Паралельних рендерів коду для .json (за замовчуванням — кількість ядер)",
     )
     parser.add_argument(
         "--no-publish",
         action="store_true",
         help="Не публікувати тест після імпорту (залишити як чернетку)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Пакетний імпорт: скільки тестів імпортувати паралельно (за замовчуванням: 4)",
+    )
+    parser.add_argument(
+        "--report",
+        default=os.path.join(JOURNAL_DIR, "report.json"),
+        help="Пакетний імпорт: JSON-звіт (назва → quiz_id, питання, статус публікації)",
+    )
     parser.add_argument("--email", help="Email (або WAYGROUND_EMAIL у .env)")
     parser.add_argument("--password", help="Пароль (або WAYGROUND_PASSWORD у .env)")
 
     args = parser.parse_args()
 
-    # Файл
-    xlsx_path = Path(args.xlsx).resolve()
-    if not xlsx_path.exists():
-        print(f"[X] Файл не знайдено: {xlsx_path}")
+    # Файли
+    missing = [item for item in args.sources
+               if not glob.has_magic(item) and not os.path.exists(item)]
+    if missing:
+        print(f"[X] Файл не знайдено: {', '.join(missing)}")
         sys.exit(1)
-    if xlsx_path.suffix.lower() != ".xlsx":
-        print(f"[X] Очікується .xlsx файл, отримано: {xlsx_path.suffix}")
+    sources = collect_sources(args.sources)
+    bulk = len(args.sources) > 1 or len(sources) != 1 or os.path.isdir(args.sources[0])
+    if not sources:
+        print(f"[X] Не знайдено .json / .xlsx файлів: {' '.join(args.sources)}")
+        sys.exit(1)
+    if bulk and args.name:
+        print("[X] --name працює лише для одного файлу")
         sys.exit(1)
-
-    quiz_name = args.name or xlsx_path.stem
 
     # Credentials
-    env_email, env_password = load_credentials()
-    email = args.email or env_email
-    password = args.password or env_password
+    email, password = credentials(args.email, args.password)
     if not email or not password:
         print("[X] Credentials не знайдено. Створи .env або передай --email / --password")
         sys.exit(1)
 
-    print(f"[~] Файл:  {xlsx_path}")
+    options = dict(
+        batch_size=args.batch_size,
+        publish=not args.no_publish,
+        resume=args.resume,
+        jobs=args.jobs,
+    )
+
+    if bulk:
+        print(f"[~] Тестів: {len(sources)} (паралельно: {args.workers})")
+        print(f"[~] Мова:   {args.lang}")
+        print()
+        try:
+            session = get_session(email, password)
+        except RuntimeError as e:
+            print(f"\n[X] {e}")
+            sys.exit(1)
+        print()
+
+        reports = import_many(session, sources, args.lang, workers=args.workers, **options)
+
+        print()
+        print_report_table(reports)
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        atomic_write(args.report, json.dumps(reports, ensure_ascii=False, indent=2))
+        failed = sum(1 for r in reports if r["status"] != "ok" or r["error"])
+        print(f"\n[~] Звіт: {args.report}")
+        if failed:
+            print(f"[X] Не завершено: {failed} з {len(reports)} (продовжити — той самий запуск з --resume)")
+            sys.exit(1)
+        return
+
+    source = sources[0]
+    quiz_name = args.name or source.stem
+
+    print(f"[~] Файл:  {source}")
     print(f"[~] Назва: {quiz_name}")
     print(f"[~] Мова:  {args.lang}")
     print()
 
     try:
         # Auth
-        session = login(email, password)
-        print()
-
-        # 1. Upload + parse xlsx
-        extracted = upload_xlsx(session, xlsx_path)
-        print()
-
-        # 2. Створити тест
-        quiz_id, version_id = create_quiz(session, quiz_name, args.lang)
+        session = get_session(email, password)
         print()
+    except RuntimeError as e:
+        print(f"\n[X] {e}")
+        sys.exit(1)
 
-        # 3. Додати питання
-        print(f"[~] Імпортуємо {len(extracted)} питань (batch_size={args.batch_size})...")
-        added = import_questions(session, quiz_id, version_id, extracted, args.batch_size)
-        print()
+    report = import_quiz(session, source, quiz_name, args.lang, **options)
+    print()
 
-        # 4. Публікація
-        published = False
-        if not args.no_publish:
-            published = publish_quiz(session, quiz_id, version_id, quiz_name, args.lang)
-            print()
-
-        # Підсумок
-        print("=" * 55)
-        print(f"Готово! Додано {added} з {len(extracted)} питань.")
-        if published:
+    # Підсумок
+    quiz_id = report["quiz_id"]
+    print("=" * 55)
+    if report["status"] == "error":
+        print(f"Імпорт не вдався: {report['error']}")
+    elif report["status"] == "partial":
+        print(f"Імпорт перервано: додано {report['added']} з {report['questions']} питань.")
+        print(f"Продовжити:  python3 {sys.argv[0]} {args.sources[0]} --resume")
+    else:
+        print(f"Готово! Додано {report['added']} з {report['questions']} питань.")
+        if report["published"]:
             print(f"Статус:   опубліковано ✓")
+        elif args.no_publish:
+            print(f"Статус:   чернетка (--no-publish)")
         else:
-            print(f"Статус:   чернетка (запусти з --no-publish щоб лишити так)")
+            print(f"Статус:   чернетка — публікація не вдалася")
+            print(f"Повторити публікацію:  python3 {sys.argv[0]} {args.sources[0]} --resume")
+    if quiz_id:
         print(f"Редактор: https://wayground.com/admin/quiz/{quiz_id}/edit")
         print(f"quiz_id:  {quiz_id}")
-        print("=" * 55)
-
-    except RuntimeError as e:
-        print(f"\n[X] {e}")
+    print("=" * 55)
+    if report["status"] != "ok" or report["error"]:
         sys.exit(1)
 
 
@@ -1,27 +1,25 @@
+import os
 import re
+import sys
 
-def unwrap_svg(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from batch_runner import run_cli
+from mdc_tokenizer import rewrite
 
-    def replacer(match):
-        return match.group(1)
+WRAPPED_SVG_RE = re.compile(r'<div class="w-full block">\n(<svg viewBox=.*?</svg>)\n</div>', re.DOTALL)
 
-    new_content = re.sub(r'<div class="w-full block">\n(<svg viewBox=.*?</svg>)\n</div>', replacer, content, flags=re.DOTALL)
+def unwrap_span(span):
+    # Only inline HTML is touched; code samples that show the wrapper stay as they are
+    if span.kind != 'prose' or 'w-full block' not in span.text:
+        return None
+    return WRAPPED_SVG_RE.sub(lambda m: m.group(1), span.text)
 
-    if new_content != content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        print(f"Fixed {file_path}")
-    else:
-        print(f"No changes for {file_path}")
-
-files = [
-    '/Users/arakviel/Work/kostyl.dev/content/07.tools/01.docker/01.containerization-concept.md',
-    '/Users/arakviel/Work/kostyl.dev/content/07.tools/01.docker/02.docker-what-and-why.md',
-    '/Users/arakviel/Work/kostyl.dev/content/98.test-new-components.md'
-]
-
-for file_path in files:
-    unwrap_svg(file_path)
+def unwrap_svg(content):
+    return rewrite(content, unwrap_span)
 
+if __name__ == "__main__":
+    run_cli(
+        "unwrap_svg", unwrap_svg,
+        default_patterns=["content/**/*.md"],
+        description='Unwrap inline <svg> from <div class="w-full block"> wrappers.',
+    )
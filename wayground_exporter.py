@@ -1,279 +1,201 @@
+"""
+wayground_exporter.py — конвертер JSON тестів у xlsx для імпорту в Wayground.
+
+CLI:
+  python3 wayground_exporter.py <json або папка> [-o <xlsx або папка>] [-j N] [-w N] [--pandas]
+
+API (для генераторів і quiz_bank.py — без subprocess і тимчасових файлів):
+  from wayground_exporter import export_questions
+  export_questions(questions, "tests/05.python/02.encapsulation.xlsx")
+"""
 import argparse
-import pandas as pd
-import json
 import os
 import sys
-import re
-import uuid
-import subprocess
-import requests
-
-
-def _get_wayground_session() -> requests.Session | None:
-    """Логінимось на Wayground для завантаження зображень."""
-    # Шукаємо credentials у .env поряд зі скриптом або в scripts/
-    env_dirs = [
-        os.path.dirname(os.path.abspath(__file__)),
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"),
-    ]
-    for d in env_dirs:
-        env_file = os.path.join(d, ".env")
-        if os.path.exists(env_file):
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        k, _, v = line.partition("=")
-                        os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
-            break
-
-    email    = os.environ.get("WAYGROUND_EMAIL", "")
-    password = os.environ.get("WAYGROUND_PASSWORD", "")
-    if not email or not password:
-        return None
-
-    try:
-        resp = requests.post(
-            "https://wayground.com/_authserver/public/public/v1/auth/login/local",
-            json={"username": email, "password": password, "requestId": str(uuid.uuid4())},
-            headers={"Content-Type": "application/json", "User-Agent": "Mozilla/5.0",
-                     "Origin": "https://wayground.com"},
-            timeout=15,
-        )
-        sid = resp.cookies.get("_sid")
-        if not sid:
-            return None
-        session = requests.Session()
-        session.cookies.set("_sid", sid, domain="wayground.com")
-        session.headers.update({"User-Agent": "Mozilla/5.0", "Origin": "https://wayground.com"})
-        return session
-    except Exception:
-        return None
-
-
-def _upload_to_wayground(session: requests.Session, img_path: str) -> str | None:
-    """Завантажує PNG на Wayground S3 і повертає finalUrl."""
-    try:
-        with open(img_path, "rb") as f:
-            img_data = f.read()
-        r = session.post(
-            "https://media.quizizz.com/_mdserver/main/getUploadURL"
-            "?destination=quizzes&enableAcceleration=true",
-            timeout=15,
-        )
-        if r.status_code != 200 or not r.json().get("success"):
-            return None
-        res = r.json()["data"]
-        s3 = requests.put(
-            res["signedUrl"],
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            data=img_data,
-            timeout=30,
-        )
-        return res["finalUrl"] if s3.status_code == 200 else None
-    except Exception:
-        return None
-
-
-def _get_catbox_userhash() -> str:
-    """Читає CATBOX_USERHASH з .env."""
-    env_dirs = [
-        os.path.dirname(os.path.abspath(__file__)),
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"),
-    ]
-    for d in env_dirs:
-        env_file = os.path.join(d, ".env")
-        if os.path.exists(env_file):
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        k, _, v = line.partition("=")
-                        os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
-            break
-    return os.environ.get("CATBOX_USERHASH", "")
-
-
-def _upload_to_catbox(img_path: str, userhash: str) -> str | None:
-    """Завантажує PNG на catbox.moe (постійне зберігання)."""
-    try:
-        with open(img_path, "rb") as f:
-            img_data = f.read()
-        payload = {"reqtype": "fileupload", "userhash": userhash}
-        r = requests.post(
-            "https://catbox.moe/user/api.php",
-            data=payload,
-            files={"fileToUpload": ("image.png", img_data, "image/png")},
-            timeout=30,
-        )
-        url = r.text.strip()
-        return url if url.startswith("https://") else None
-    except Exception:
-        return None
-
-
-def _upload_to_litterbox(img_path: str) -> str | None:
-    """Fallback: завантажує PNG на litterbox.catbox.moe (72h TTL)."""
-    try:
-        with open(img_path, "rb") as f:
-            img_data = f.read()
-        r = requests.post(
-            "https://litterbox.catbox.moe/resources/internals/api.php",
-            data={"reqtype": "fileupload", "time": "72h"},
-            files={"fileToUpload": ("image.png", img_data, "image/png")},
-            timeout=30,
-        )
-        url = r.text.strip()
-        return url if url.startswith("https://") else None
-    except Exception:
-        return None
-
-def process_code_blocks(data):
-    # regex to find code blocks: ```lang\ncode\n```
-    code_block_pattern = re.compile(r'```(\w*)\n([\s\S]*?)\n```')
-
-    # Ініціалізуємо catbox-хеш для завантаження зображень питань
-    catbox_hash = _get_catbox_userhash()
-    if catbox_hash:
-        print("🔑 Catbox.moe — зображення питань завантажуються постійно")
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from quiz_questions import QUESTION_FIELDS, load_questions, normalize_question, process_code_blocks
+from wayground_auth import catbox_userhash
+
+# pandas і openpyxl імпортуються ліниво — лише коли справді пишемо xlsx
+COLUMNS = QUESTION_FIELDS
+
+
+def normalize_answers(df):
+    """
+    Нормалізує відповіді по колонках (без проходу по рядках):
+      - Multiple Choice — лише перше число з Correct Answer;
+      - Checkbox — усі числа через кому;
+      - Fill-in-the-Blank — відповідь переноситься в Option 1 (якщо він порожній),
+        Correct Answer і Option 2-5 очищуються.
+    Змінює `df` на місці.
+    """
+    answer_columns = ["Question Type", "Option 1", "Correct Answer", "Option 2", "Option 3", "Option 4", "Option 5"]
+    df[answer_columns] = df[answer_columns].astype(object)
+
+    q_type = df["Question Type"].fillna("").astype(str).str.strip()
+    ans = df["Correct Answer"].fillna("").astype(str)
+
+    multiple = ans[q_type == "Multiple Choice"].str.extract(r'(\d+)', expand=False).dropna()
+    df.loc[multiple.index, "Correct Answer"] = multiple
+
+    checkbox = ans[q_type == "Checkbox"].str.findall(r'\d+').str.join(",")
+    checkbox = checkbox[checkbox != ""]
+    df.loc[checkbox.index, "Correct Answer"] = checkbox
+
+    blank = q_type.str.lower() == "fill-in-the-blank"
+    option1_empty = df["Option 1"].fillna("").astype(str).str.strip() == ""
+    move = blank & option1_empty & (ans.str.strip() != "")
+    df.loc[blank, "Question Type"] = "Fill-in-the-Blank"
+    df.loc[move, "Option 1"] = ans[move]
+    df.loc[blank, ["Correct Answer", "Option 2", "Option 3", "Option 4", "Option 5"]] = ""
+
+
+def write_xlsx(rows, xlsx_path):
+    """
+    Потоково пише питання в xlsx (openpyxl write_only): рядок за рядком, без
+    DataFrame і без утримання всієї таблиці в пам'яті. Повертає кількість рядків.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(COLUMNS)
+    count = 0
+    for row in rows:
+        ws.append([None if row.get(c) in (None, "") else row.get(c) for c in COLUMNS])
+        count += 1
+    wb.save(xlsx_path)
+    return count
+
+
+def write_xlsx_pandas(data, xlsx_path):
+    """Старий шлях через pandas DataFrame (--pandas). Повертає кількість рядків."""
+    import pandas as pd
+
+    df = pd.DataFrame(data, columns=COLUMNS)
+    # Пост-процесинг для нормалізації даних, якщо AI згенерував їх неточно
+    normalize_answers(df)
+    df.to_excel(xlsx_path, index=False, engine='openpyxl')
+    return len(df)
+
+
+def export_questions(questions, xlsx_path, *, render_code=True, jobs=None, use_pandas=False, catbox_hash=None):
+    """
+    Публічне API експорту: список питань у пам'яті → xlsx для Wayground, у тому ж процесі
+    (без тимчасового JSON і subprocess). Вхідний список не змінюється.
+
+      render_code — блоки коду в "Question Text" → зображення (Image Link);
+      jobs        — паралельних рендерів silicon;
+      catbox_hash — готовий CATBOX_USERHASH (None — прочитати з .env).
+
+    Повертає {"questions": записано питань, "images": додано зображень коду}.
+    Помилки прокидаються винятками.
+    """
+    questions = [dict(q) for q in questions if isinstance(q, dict)]
+    images = 0
+    if render_code:
+        if catbox_hash is None:
+            catbox_hash = catbox_userhash()
+        images = process_code_blocks(questions, jobs, catbox_hash)
+
+    # Створюємо директорію для файлу, якщо її немає
+    os.makedirs(os.path.dirname(os.path.abspath(xlsx_path)), exist_ok=True)
+
+    if use_pandas:
+        count = write_xlsx_pandas(questions, xlsx_path)
     else:
-        print("⚠️  CATBOX_USERHASH не знайдено — litterbox.catbox.moe (72h TTL)")
-
-    for item in data:
-        if not isinstance(item, dict):
-            continue
-
-        q_text = item.get("Question Text", "")
-        if not q_text:
-            continue
-
-        match = code_block_pattern.search(q_text)
-        if match:
-            lang = match.group(1)
-            code_content = match.group(2)
-
-            lang_mapped = lang.lower() if lang else ""
-            if lang_mapped in ("csharp", "c#"):
-                lang_mapped = "cs"
-
-            print(f"🔍 Знайдено блок коду ({lang if lang else 'plain'}) в питанні: '{q_text[:30]}...'")
-
-            ext = lang_mapped if lang_mapped else "txt"
-            temp_code_file = f"temp_code_{os.getpid()}.{ext}"
-            temp_img_file  = f"temp_code_{os.getpid()}.png"
-
-            try:
-                with open(temp_code_file, "w", encoding="utf-8") as f:
-                    f.write(code_content)
-
-                silicon_cmd = [
-                    "silicon",
-                    "--no-window-controls",
-                    "--theme", "Visual Studio Dark+",
-                    "--no-round-corner",
-                    "--pad-horiz", "0",
-                    "--pad-vert", "0",
-                ]
-                if lang_mapped:
-                    silicon_cmd.extend(["-l", lang_mapped])
-                silicon_cmd += [temp_code_file, "-o", temp_img_file]
-
-                print("🎨 Рендеринг зображення коду за допомогою silicon...")
-                subprocess.run(silicon_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-                image_url = None
-
-                # Спроба 1: catbox.moe (постійне зберігання)
-                if catbox_hash:
-                    print("🚀 Завантаження на catbox.moe...")
-                    image_url = _upload_to_catbox(temp_img_file, catbox_hash)
-                    if image_url:
-                        print(f"🔗 Зображення завантажено (catbox): {image_url}")
-
-                # Спроба 2: litterbox fallback (72h)
-                if not image_url:
-                    print("🚀 Fallback: завантаження на litterbox.catbox.moe...")
-                    image_url = _upload_to_litterbox(temp_img_file)
-                    if image_url:
-                        print(f"🔗 Зображення завантажено (litterbox): {image_url}")
-
-                if image_url:
-                    item["Image Link"] = image_url
-                    item["Question Text"] = code_block_pattern.sub("", q_text).strip()
-                else:
-                    print("⚠️ Не вдалося завантажити зображення — посилання залишається порожнім")
-
-            except Exception as e:
-                print(f"⚠️ Не вдалося обробити блок коду: {e}")
-
-            finally:
-                if os.path.exists(temp_code_file):
-                    os.remove(temp_code_file)
-                if os.path.exists(temp_img_file):
-                    os.remove(temp_img_file)
-
-def convert_json_to_xlsx(json_path, xlsx_path):
-    columns = [
-        "Question Text", "Question Type", "Option 1", "Option 2", 
-        "Option 3", "Option 4", "Option 5", "Correct Answer", 
-        "Time in seconds", "Image Link", "Answer explanation"
-    ]
-    
+        # Нормалізація по рядку (ті самі правила, що й normalize_answers) прямо під час запису
+        count = write_xlsx((normalize_question(q) for q in questions), xlsx_path)
+    return {"questions": count, "images": images}
+
+
+def convert_json_to_xlsx(json_path, xlsx_path, jobs=None, use_pandas=False, catbox_hash=None):
+    """
+    JSON з питаннями → xlsx для Wayground. `catbox_hash` — готовий CATBOX_USERHASH
+    (None — прочитати з .env). Повертає підсумок: path, questions, images, seconds, error.
+    """
+    started = time.perf_counter()
+    result = {"path": json_path, "questions": 0, "images": 0, "seconds": 0.0, "error": None}
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        try:
+            data = load_questions(json_path)
+        except ValueError as e:
+            print(f"❌ Помилка: {e}")
+            result["error"] = str(e)
+            return result
             
-        # Якщо JSON це просто словник з одним полем (наприклад {"questions": [...]})
-        if isinstance(data, dict):
-            # Спроба знайти масив всередині
-            for key in data.keys():
-                if isinstance(data[key], list):
-                    data = data[key]
-                    break
-                    
-        if not isinstance(data, list):
-            print(f"❌ Помилка: {json_path} не містить масиву питань.")
-            return
-            
-        process_code_blocks(data)
-            
-        df = pd.DataFrame(data, columns=columns)
-        
-        # Пост-процесинг для нормалізації даних, якщо AI згенерував їх неточно
-        for index, row in df.iterrows():
-            q_type = str(row.get('Question Type', '')).strip()
-            ans = str(row.get('Correct Answer', ''))
-            
-            if q_type == 'Multiple Choice':
-                m = re.search(r'\d+', ans)
-                if m:
-                    df.at[index, 'Correct Answer'] = m.group(0)
-            elif q_type == 'Checkbox':
-                m = re.findall(r'\d+', ans)
-                if m:
-                    df.at[index, 'Correct Answer'] = ",".join(m)
-            elif q_type.lower() == 'fill-in-the-blank':
-                df.at[index, 'Question Type'] = 'Fill-in-the-Blank'
-                if pd.notna(ans) and str(ans).strip() != "":
-                    if pd.isna(row.get('Option 1')) or str(row.get('Option 1')).strip() == "":
-                        df.at[index, 'Option 1'] = ans
-                df.at[index, 'Correct Answer'] = ""
-                for opt in ['Option 2', 'Option 3', 'Option 4', 'Option 5']:
-                    df.at[index, opt] = ""
-        
-        # Створюємо директорію для файлу, якщо її немає
-        os.makedirs(os.path.dirname(os.path.abspath(xlsx_path)), exist_ok=True)
-        
-        df.to_excel(xlsx_path, index=False, engine='openpyxl')
-        print(f"✅ Успішно створено {xlsx_path} ({len(data)} питань).")
+        result.update(export_questions(data, xlsx_path, jobs=jobs, use_pandas=use_pandas, catbox_hash=catbox_hash))
+        count = result["questions"]
+        print(f"✅ Успішно створено {xlsx_path} ({count} питань).")
         
     except Exception as e:
         print(f"❌ Помилка під час обробки {json_path}: {e}")
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def _convert_job(job):
+    """Конвертація одного файлу у воркері пулу процесів."""
+    return convert_json_to_xlsx(*job)
+
+
+def convert_folder(in_dir, out_dir, jobs=None, use_pandas=False, workers=None):
+    """
+    Конвертує всі JSON папки пулом процесів. CATBOX_USERHASH читається один раз
+    тут і передається воркерам. Без явного `jobs` кожен процес отримує свою частку
+    ядер (cpu_count // workers), тож одночасно працює не більше ~cpu_count рендерів
+    silicon. Повертає список підсумків (у порядку файлів).
+    """
+    json_files = sorted(f for f in os.listdir(in_dir) if f.endswith('.json'))
+    if not json_files:
+        print(f"У папці '{in_dir}' не знайдено JSON файлів.")
+        return []
+
+    catbox_hash = catbox_userhash()
+    cpus = os.cpu_count() or 1
+    workers = max(1, min(workers or cpus, len(json_files)))
+    if jobs is None:
+        # Ядра ділимо між процесами: інакше кожен запустить cpu_count рендерів silicon
+        jobs = max(1, cpus // workers)
+    work = [
+        (os.path.join(in_dir, f), os.path.join(out_dir, f.rsplit('.', 1)[0] + '.xlsx'), jobs, use_pandas, catbox_hash)
+        for f in json_files
+    ]
+    print(f"Знайдено {len(json_files)} JSON файлів. Починаємо конвертацію "
+          f"({workers} процесів × {jobs} рендерів silicon)...")
+    if workers == 1:
+        return [_convert_job(job) for job in work]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_convert_job, work))
+
+
+def print_summary(results):
+    width = max([len(os.path.basename(r["path"])) for r in results] + [4])
+    print(f"\n{'Файл':<{width}}  {'Питань':>6}  {'Зображень':>9}  {'Час, с':>7}  Статус")
+    print("-" * (width + 42))
+    for r in results:
+        status = f"❌ {r['error']}" if r["error"] else "✅"
+        print(f"{os.path.basename(r['path']):<{width}}  {r['questions']:>6}  {r['images']:>9}  {r['seconds']:>7.1f}  {status}")
+    failed = sum(1 for r in results if r["error"])
+    print(f"\n{len(results)} файлів: {sum(r['questions'] for r in results)} питань, "
+          f"{sum(r['images'] for r in results)} зображень коду, помилок {failed}")
+
 
 def main():
     parser = argparse.ArgumentParser(description="Конвертер JSON тестів у формат Wayground (XLSX).")
     parser.add_argument("input", help="Шлях до вхідного JSON файлу або папки з JSON файлами")
     parser.add_argument("-o", "--output", help="Шлях до вихідного XLSX файлу або папки (опціонально)", default=None)
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Кількість паралельних рендерів silicon на процес (за замовчуванням — "
+                             "кількість ядер; для папки — ядра, поділені на --workers)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Для папки: скільки файлів конвертувати паралельно (за замовчуванням — кількість ядер)")
+    parser.add_argument("--pandas", action="store_true",
+                        help="Писати xlsx через pandas DataFrame (повільніший старт; за замовчуванням — потоковий openpyxl)")
     
     args = parser.parse_args()
     
@@ -289,23 +211,21 @@ def main():
         elif os.path.isdir(out_path):
             out_path = os.path.join(out_path, os.path.basename(args.input).rsplit('.', 1)[0] + '.xlsx')
             
-        convert_json_to_xlsx(args.input, out_path)
+        result = convert_json_to_xlsx(args.input, out_path, args.jobs, args.pandas)
+        if result["error"]:
+            sys.exit(1)
         
     # Якщо передано папку
     elif os.path.isdir(args.input):
         out_dir = args.output if args.output else args.input
         os.makedirs(out_dir, exist_ok=True)
         
-        json_files = [f for f in os.listdir(args.input) if f.endswith('.json')]
-        if not json_files:
-            print(f"У папці '{args.input}' не знайдено JSON файлів.")
+        results = convert_folder(args.input, out_dir, args.jobs, args.pandas, args.workers)
+        if not results:
             return
-            
-        print(f"Знайдено {len(json_files)} JSON файлів. Починаємо конвертацію...")
-        for j_file in json_files:
-            in_path = os.path.join(args.input, j_file)
-            out_path = os.path.join(out_dir, j_file.rsplit('.', 1)[0] + '.xlsx')
-            convert_json_to_xlsx(in_path, out_path)
+        print_summary(results)
+        if any(r["error"] for r in results):
+            sys.exit(1)
     else:
         print(f"Помилка: Шляху '{args.input}' не існує.")
         sys.exit(1)